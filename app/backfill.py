@@ -0,0 +1,140 @@
+"""과거 아카이브 백필 — 기간을 지정해 날짜별 수집 → 요약 → 저장을 동시에 돌린다.
+
+스프링 대응:
+- backfill()     = 파티셔닝된 Spring Batch 잡 (날짜 = 파티션, gridSize = backfill_concurrency)
+- RateLimiter    = 외부 API별 Resilience4j RateLimiter (모든 날짜가 하나를 공유)
+- MarketHistory  = 기간 전체 시세를 한 번에 읽어 두는 캐시 (날짜마다 API를 부르지 않음)
+
+    python -m app.worker backfill 2025-01-01 2025-12-31
+    python -m app.worker backfill 2025-01-01 2025-12-31 --concurrency 8 --force
+
+- 이미 브리핑이 있는 날짜는 건너뛴다 (--force면 체크포인트도 지우고 다시 수집/요약한다)
+- 일요일은 건너뛴다 (스케줄러와 같은 월~토)
+- 오늘 이후는 받지 않는다 — 오늘 체크포인트는 본 실행(delivered 등)과 같은 자리라 덮어쓰면 재발송이 난다
+- 과거 뉴스는 날짜로 검색할 수 없어 시장 데이터 + 공시만으로 요약한다
+- 날짜별 체크포인트를 남기므로 중간에 끊겨도 다시 실행하면 요약을 반복하지 않는다
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+
+import httpx
+from sqlalchemy import select
+
+from app.checkpoint import RunCheckpoint
+from app.collector.dart import fetch_disclosures
+from app.collector.history import MarketHistory
+from app.config import settings
+from app.database import async_session
+from app.models import Briefing
+from app.pipeline import BriefingResult, CollectedData, _disclosure_limit, save_briefing, summarize
+from app.publisher import publish_site
+from app.ratelimit import RateLimiter
+from app.telemetry import http_client, traced_run
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BackfillReport:
+    requested: int = 0
+    skipped: int = 0  # 이미 브리핑이 있는 날짜
+    saved: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+def backfill_dates(start: date, end: date) -> list[date]:
+    """기간 안의 실행일 (월~토)."""
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)
+            if (start + timedelta(days=i)).weekday() != 6]
+
+
+async def existing_dates(start: date, end: date) -> set[str]:
+    async with async_session() as db:
+        result = await db.execute(
+            select(Briefing.date).where(Briefing.date.between(start.isoformat(), end.isoformat()))
+        )
+        return set(result.scalars())
+
+
+async def backfill(
+    start: date, end: date, concurrency: int | None = None, force: bool = False,
+) -> BackfillReport:
+    """[start, end] 기간의 브리핑을 만들어 저장한다. 날짜 하나가 실패해도 나머지는 계속한다."""
+    if end >= date.today():
+        raise ValueError(f"백필은 어제까지만 가능합니다 (종료일 {end}) — 오늘은 python -m app.worker run 으로 실행하세요")
+    if start > end:
+        raise ValueError(f"시작일({start})이 종료일({end})보다 늦습니다")
+    started = time.perf_counter()
+    dates = backfill_dates(start, end)
+    report = BackfillReport(requested=len(dates))
+    if not force:
+        existing = await existing_dates(start, end)
+        dates = [d for d in dates if d.isoformat() not in existing]
+        report.skipped = report.requested - len(dates)
+    if not dates:
+        return report
+
+    history = MarketHistory(dates[0], dates[-1], limiter=RateLimiter(settings.backfill_krx_rps))
+    await history.load()
+    dart_limiter = RateLimiter(settings.backfill_dart_rps)
+    slots = asyncio.Semaphore(concurrency or settings.backfill_concurrency)
+
+    async with http_client(timeout=15) as dart_client:
+        async def run(day: date) -> None:
+            async with slots:
+                try:
+                    await _backfill_day(day, history, dart_client, dart_limiter, force=force)
+                    report.saved.append(day.isoformat())
+                except Exception:
+                    logger.exception("백필 실패: %s", day)
+                    report.failed.append(day.isoformat())
+
+        await asyncio.gather(*(run(d) for d in dates))
+
+    report.saved.sort()
+    report.failed.sort()
+    if report.saved:
+        try:
+            await publish_site(report.saved)
+        except Exception:
+            logger.exception("정적 페이지 내보내기 실패")
+    report.elapsed = time.perf_counter() - started
+    logger.info(
+        "백필 완료: %d일 중 저장 %d, 건너뜀 %d, 실패 %d (%.1fs)",
+        report.requested, len(report.saved), report.skipped, len(report.failed), report.elapsed,
+    )
+    return report
+
+
+@traced_run("backfill")
+async def _backfill_day(
+    run_date: date, history: MarketHistory, dart_client: httpx.AsyncClient, dart_limiter: RateLimiter,
+    force: bool = False,
+) -> None:
+    checkpoint = RunCheckpoint(run_date.isoformat())
+    if force:
+        # 저장된 요약을 다시 저장하면 --force가 아무것도 바꾸지 못한다
+        checkpoint.reset()
+    saved = checkpoint.load("briefing")
+    if saved is not None:
+        result = BriefingResult(**saved)
+    else:
+        market, disclosures = await asyncio.gather(
+            history.summary_for(run_date),
+            fetch_disclosures(
+                run_date - timedelta(days=1), limit=_disclosure_limit(), client=dart_client, limiter=dart_limiter,
+            ),
+        )
+        data = CollectedData(market=market, disclosures=disclosures, news=[])
+        checkpoint.save("collected", data.to_dict())
+        checkpoint.mark("collect")
+        result = await asyncio.to_thread(summarize, data, run_date)
+        checkpoint.save("briefing", asdict(result))
+        checkpoint.mark("summarize")
+    await save_briefing(result, run_date)
+    checkpoint.mark("save")
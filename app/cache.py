@@ -0,0 +1,133 @@
+"""캐시 — 스프링의 @Cacheable + CacheManager 역할.
+
+FileCache (디스크):
+- 네임스페이스 = 캐시 이름 (@Cacheable("disclosure_map"))
+- 키는 sha256으로 해시해서 파일명으로 쓴다 → 키 길이/문자 제약 없음
+- 값은 JSON 직렬화 가능한 것만 저장한다
+- 프로세스가 재시작되거나 파이프라인을 재실행해도 살아남는다
+
+MemoryCache (프로세스 내):
+- 크기 제한 LRU + TTL, 웹 요청 경로의 작은 계산 결과용
+- 브리핑이 저장되면 invalidate_archive()로 비운다 (@CacheEvict) — 같은 프로세스 한정.
+  다른 프로세스(워커)의 저장은 아카이브 캐시 키에 넣은 updated_at 세대로 알아챈다
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class FileCache:
+    """네임스페이스 단위 JSON 파일 캐시 (TTL 지원)."""
+
+    def __init__(self, namespace: str, ttl: float | None = None, root: str | Path | None = None):
+        self.dir = Path(root or settings.cache_dir) / namespace
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.dir / f"{digest}.json"
+
+    def get(self, key: str) -> Any | None:
+        """캐시된 값을 반환한다. 없거나 만료됐으면 None."""
+        try:
+            entry = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at < time.time():
+            return None
+        return entry["value"]
+
+    def set(self, key: str, value: Any) -> None:
+        """값을 저장한다. 임시 파일에 쓴 뒤 교체해서 동시 읽기에도 안전하다."""
+        path = self._path(key)
+        entry = {
+            "expires_at": time.time() + self.ttl if self.ttl is not None else None,
+            "value": value,
+        }
+        try:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("캐시 저장 실패 (%s): %s", self.dir.name, e)
+
+
+class MemoryCache:
+    """프로세스 내 LRU + TTL 캐시 (스레드 안전)."""
+
+    def __init__(self, maxsize: int = 128, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Any, tuple[float | None, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def keys(self) -> list[Any]:
+        with self._lock:
+            return list(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# ── 아카이브 캐시 인스턴스 ──
+
+# 목록/검색 전체 건수 (키: (검색어, 아카이브 세대), ""는 전체 목록)
+archive_counts = MemoryCache(maxsize=256, ttl=600)
+
+# 렌더링된 상세 페이지 (키: (날짜, 해당 브리핑의 updated_at))
+archive_pages = MemoryCache(maxsize=128, ttl=3600)
+
+
+def invalidate_archive(briefing_date: str | None = None) -> None:
+    """브리핑이 추가/수정되면 이 프로세스의 아카이브 캐시를 비운다 (날짜를 주면 해당 상세 페이지만).
+
+    정합성은 키의 세대가 보장한다 — 여기서는 더 이상 맞지 않을 항목을 미리 치워 메모리만 돌려받는다.
+    """
+    archive_counts.clear()
+    if briefing_date is None:
+        archive_pages.clear()
+    else:
+        for key in archive_pages.keys():
+            if key[0] == briefing_date:
+                archive_pages.pop(key)
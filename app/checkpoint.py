@@ -0,0 +1,120 @@
+"""파이프라인 실행 체크포인트 — 단계별 결과를 디스크에 남겨 실패 지점부터 재개.
+
+스프링 대응:
+- RunCheckpoint = Spring Batch의 JobRepository/ExecutionContext (단계 완료 여부 + 중간 산출물)
+- mark()/done() = StepExecution 상태 (COMPLETED면 재시작 시 건너뜀)
+
+저장 위치: {checkpoint_dir}/{실행일}/
+- collected.json.gz, briefing.json.gz 등: 단계 산출물 (gzip JSON)
+- delivered.log 등: 진행 중에 조금씩 덧붙이는 목록 (한 줄에 하나)
+- stages.json: 완료된 단계와 시각
+"""
+
+import gzip
+import json
+import logging
+import os
+import shutil
+import tempfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("collect", "summarize", "save", "send", "publish")
+# 07:00 본 실행 전에 미리 돌리는 워밍업 단계 — 본 실행을 처음부터 다시 해도 지우지 않는다
+WARMUP_STAGES = ("after_close", "prefetch", "draft")
+WARMUP_FILES = ("market_close", "prefetched", "draft")
+
+
+class RunCheckpoint:
+    """하루치 파이프라인 실행의 체크포인트."""
+
+    def __init__(self, run_date: str, root: str | Path | None = None):
+        self.run_date = run_date
+        self.dir = Path(root or settings.checkpoint_dir) / run_date
+
+    def save(self, name: str, payload: Any) -> None:
+        """단계 산출물을 저장한다 (JSON 직렬화 가능한 값)."""
+        data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        _write_atomic(self.dir / f"{name}.json.gz", gzip.compress(data, mtime=0))
+
+    def load(self, name: str) -> Any | None:
+        try:
+            return json.loads(gzip.decompress((self.dir / f"{name}.json.gz").read_bytes()))
+        except (OSError, ValueError) as e:
+            if not isinstance(e, FileNotFoundError):
+                logger.warning("체크포인트 읽기 실패 (%s/%s): %s", self.run_date, name, e)
+            return None
+
+    def append(self, name: str, items: list[str]) -> None:
+        """목록에 항목을 덧붙인다 — 전체를 다시 쓰지 않으므로 진행 중에 자주 불러도 된다."""
+        if not items:
+            return
+        self.dir.mkdir(parents=True, exist_ok=True)
+        with open(self.dir / f"{name}.log", "a", encoding="utf-8") as f:
+            f.write("".join(f"{item}\n" for item in items))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def load_appended(self, name: str) -> set[str]:
+        try:
+            lines = (self.dir / f"{name}.log").read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return set()
+        return {line for line in lines if line}
+
+    def stages(self) -> dict[str, dict]:
+        """완료된 단계 → {"at": 완료 시각, ...부가 정보}."""
+        try:
+            return json.loads((self.dir / "stages.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def done(self, stage: str) -> bool:
+        return stage in self.stages()
+
+    def mark(self, stage: str, **info: Any) -> None:
+        """단계 완료를 기록한다."""
+        stages = self.stages()
+        stages[stage] = {"at": datetime.now().isoformat(timespec="seconds"), **info}
+        _write_atomic(self.dir / "stages.json", json.dumps(stages, ensure_ascii=False).encode("utf-8"))
+
+    def clear(self) -> None:
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def reset(self) -> None:
+        """본 실행 단계만 지우고 워밍업 산출물은 남긴다."""
+        if not self.dir.exists():
+            return
+        for path in self.dir.glob("*.json.gz"):
+            if path.name.removesuffix(".json.gz") not in WARMUP_FILES:
+                path.unlink(missing_ok=True)
+        for path in self.dir.glob("*.log"):
+            path.unlink(missing_ok=True)
+        warmup = {k: v for k, v in self.stages().items() if k in WARMUP_STAGES}
+        _write_atomic(self.dir / "stages.json", json.dumps(warmup, ensure_ascii=False).encode("utf-8"))
+
+
+def prune_checkpoints(keep_days: int | None = None, root: str | Path | None = None) -> int:
+    """keep_days일보다 오래된 실행의 체크포인트를 지운다. 지운 실행 수를 반환한다."""
+    keep_days = settings.checkpoint_keep_days if keep_days is None else keep_days
+    base = Path(root or settings.checkpoint_dir)
+    cutoff = (date.today() - timedelta(days=keep_days)).isoformat()
+    removed = 0
+    for run_dir in base.glob("????-??-??"):
+        if run_dir.is_dir() and run_dir.name < cutoff:
+            shutil.rmtree(run_dir, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
@@ -0,0 +1,168 @@
+"""기사 본문 수집기 - 뉴스 링크의 본문을 받아 검색 API의 짧은 description을 보강한다.
+
+대장주 섹션의 "왜 움직였나"는 description(한두 문장)만으로는 근거가 부족하다.
+collect_data()가 settings.article_enrichment일 때 종목별 뉴스에만 적용한다 (기사 수십 건).
+
+메모리와 지연을 기사 크기와 무관하게 묶어 둔다:
+- 응답을 청크 단위로 스트리밍하면서 바로 파싱한다 (전체 HTML을 메모리에 올리지 않음)
+- 기사 하나당 수신 바이트(article_max_bytes)와 전체 시간(article_timeout_seconds) 한도
+- 본문이 article_max_chars만큼 모이면 나머지는 받지 않고 끊는다
+- 추출한 본문은 URL 기준으로 디스크에 캐시한다 (같은 기사를 다시 받지 않음)
+"""
+
+import asyncio
+import codecs
+import logging
+import re
+from dataclasses import replace
+from html.parser import HTMLParser
+
+import httpx
+
+from app.cache import FileCache
+from app.collector.news import NewsArticle
+from app.config import settings
+from app.telemetry import http_client, traced
+
+logger = logging.getLogger(__name__)
+
+CACHE_TTL = 7 * 86400  # 기사 본문은 거의 바뀌지 않는다
+
+# 본문이 아닌 영역 — 안의 텍스트는 버린다
+_SKIP_TAGS = {"script", "style", "noscript", "template", "svg", "iframe", "form", "nav", "header", "footer", "aside", "button", "select"}
+# 텍스트 덩어리의 경계가 되는 태그
+_BLOCK_TAGS = {"p", "div", "article", "section", "br", "li", "td", "h1", "h2", "h3", "h4", "blockquote", "figcaption"}
+
+# 이보다 짧은 덩어리는 메뉴/버튼/기자명 같은 잡문으로 본다
+_MIN_BLOCK_CHARS = 30
+
+_CHARSET_RE = re.compile(rb"""charset=["']?([\w-]+)""", re.IGNORECASE)
+
+
+class ArticleTextParser(HTMLParser):
+    """청크 단위로 feed()하는 본문 추출기. 모은 본문이 max_chars에 닿으면 done이 된다."""
+
+    def __init__(self, max_chars: int):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.blocks: list[str] = []
+        self._length = 0
+        self._skip_depth = 0
+        self._current: list[str] = []
+        self._current_len = 0
+
+    @property
+    def done(self) -> bool:
+        return self._length >= self.max_chars
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in _BLOCK_TAGS:
+            self._flush()
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in _BLOCK_TAGS:
+            self._flush()
+
+    def handle_startendtag(self, tag: str, attrs) -> None:
+        if tag in _BLOCK_TAGS:
+            self._flush()
+
+    def handle_data(self, data: str) -> None:
+        # 덩어리 하나도 max_chars 넘게는 들고 있지 않는다 (닫는 태그 없이 끝없이 이어지는 페이지 대비)
+        if self._skip_depth or self.done or self._current_len >= self.max_chars:
+            return
+        self._current.append(data)
+        self._current_len += len(data)
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+
+    def _flush(self) -> None:
+        text = " ".join("".join(self._current).split())
+        self._current.clear()
+        self._current_len = 0
+        if len(text) < _MIN_BLOCK_CHARS or self.done:
+            return
+        self.blocks.append(text)
+        self._length += len(text)
+
+    def text(self) -> str:
+        return "\n".join(self.blocks)[:self.max_chars]
+
+
+async def fetch_article_text(client: httpx.AsyncClient, url: str) -> str:
+    """기사 본문을 스트리밍으로 받아 추출한다. 시간/바이트 한도 안에서 받은 만큼만 쓴다."""
+    return await asyncio.wait_for(_stream_text(client, url), timeout=settings.article_timeout_seconds)
+
+
+async def _stream_text(client: httpx.AsyncClient, url: str) -> str:
+    parser = ArticleTextParser(settings.article_max_chars)
+    received = 0
+    async with client.stream("GET", url) as resp:
+        resp.raise_for_status()
+        if "html" not in resp.headers.get("content-type", "html"):
+            return ""
+        decoder = None
+        async for chunk in resp.aiter_bytes():
+            if decoder is None:
+                # 헤더에 charset이 없으면 첫 청크의 <meta charset>으로 (국내 언론사는 아직 EUC-KR이 있다)
+                decoder = codecs.getincrementaldecoder(_charset(resp, chunk))(errors="replace")
+            chunk = chunk[:settings.article_max_bytes - received]
+            received += len(chunk)
+            parser.feed(decoder.decode(chunk))
+            if parser.done or received >= settings.article_max_bytes:
+                break
+        if decoder is not None:
+            parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    return parser.text()
+
+
+def _charset(resp: httpx.Response, head: bytes) -> str:
+    match = _CHARSET_RE.search(head[:4096])
+    for candidate in (resp.charset_encoding, match.group(1).decode("ascii") if match else None):
+        if candidate:
+            try:
+                return codecs.lookup(candidate).name
+            except LookupError:
+                pass
+    return "utf-8"
+
+
+@traced("collect.article_bodies")
+async def enrich_articles(stock_news: dict[str, list[NewsArticle]]) -> dict[str, list[NewsArticle]]:
+    """종목별 뉴스의 body를 채운다. 실패한 기사는 body 없이 그대로 둔다."""
+    cache = FileCache("article_text", ttl=CACHE_TTL)
+    slots = asyncio.Semaphore(settings.article_concurrency)
+    links = list(dict.fromkeys(a.link for articles in stock_news.values() for a in articles if a.link))
+    bodies: dict[str, str] = {}
+
+    async with http_client(follow_redirects=True, headers={"User-Agent": "Mozilla/5.0"}) as client:
+        async def load(url: str) -> None:
+            cached = cache.get(url)
+            if cached is not None:
+                bodies[url] = cached
+                return
+            async with slots:
+                try:
+                    text = await fetch_article_text(client, url)
+                except Exception as e:
+                    # 보강은 부가 기능 — 잘못된 링크(InvalidURL/ValueError), 파서/디코더 오류까지
+                    # 기사 하나의 실패가 gather를 타고 collect_data를 깨뜨리지 않게 한다
+                    logger.warning("기사 본문 수집 실패 (%s): %s: %s", url, type(e).__name__, e)
+                    return
+            bodies[url] = text
+            cache.set(url, text)
+
+        await asyncio.gather(*(load(url) for url in links))
+
+    logger.info("기사 본문 보강: 기사 %d건 중 %d건", len(links), sum(1 for t in bodies.values() if t))
+    return {
+        name: [replace(a, body=bodies[a.link]) if bodies.get(a.link) else a for a in articles]
+        for name, articles in stock_news.items()
+    }
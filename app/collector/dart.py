@@ -8,6 +8,8 @@ from datetime import date, timedelta
 import httpx
 
 from app.config import settings
+from app.ratelimit import RateLimiter
+from app.telemetry import http_client, traced
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +18,9 @@ DART_LIST_URL = "https://opendart.fss.or.kr/api/list.json"
 # 수집 대상 공시 유형: 정기(A), 주요사항(B), 발행(C), 지분(D)
 DISCLOSURE_TYPES = ["A", "B", "C", "D"]
 
+# 유형별 최대 페이지 수 (page_count=100 기준 → 유형당 최대 1,000건)
+DART_MAX_PAGES = 10
+
 
 @dataclass(frozen=True)
 class Disclosure:
@@ -32,43 +37,80 @@ async def _fetch_by_type(
     client: httpx.AsyncClient,
     base_params: dict,
     pblntf_ty: str,
+    max_pages: int = 1,
+    limiter: RateLimiter | None = None,
 ) -> list[dict]:
-    """단일 공시 유형을 조회한다."""
-    params = {**base_params, "pblntf_ty": pblntf_ty}
-    try:
-        resp = await client.get(DART_LIST_URL, params=params)
-        resp.raise_for_status()
-        data = resp.json()
-    except httpx.HTTPStatusError as e:
-        logger.warning("DART API HTTP 에러 (type=%s): %d", pblntf_ty, e.response.status_code)
-        return []
-    except httpx.RequestError as e:
-        logger.warning("DART API 네트워크 에러 (type=%s): %s", pblntf_ty, e)
-        return []
-
-    if data.get("status") == "000" and data.get("list"):
-        return data["list"]
-    return []
-
-async def fetch_disclosures(target_date: date | None = None) -> list[Disclosure]:
-    """전일(또는 지정일) 주요 공시 목록을 가져온다."""
+    """단일 공시 유형을 조회한다. total_page가 남아 있으면 max_pages까지 다음 페이지를 따라간다."""
+    items: list[dict] = []
+    page_no = 1
+    while True:
+        params = {**base_params, "pblntf_ty": pblntf_ty, "page_no": page_no}
+        if limiter is not None:
+            await limiter.acquire()
+        try:
+            resp = await client.get(DART_LIST_URL, params=params)
+            resp.raise_for_status()
+            data = resp.json()
+        except httpx.HTTPStatusError as e:
+            logger.warning("DART API HTTP 에러 (type=%s): %d", pblntf_ty, e.response.status_code)
+            return items
+        except httpx.RequestError as e:
+            logger.warning("DART API 네트워크 에러 (type=%s): %s", pblntf_ty, e)
+            return items
+
+        if data.get("status") != "000" or not data.get("list"):
+            return items
+        items.extend(data["list"])
+
+        if page_no >= min(int(data.get("total_page") or 1), max_pages):
+            return items
+        page_no += 1
+
+
+@traced("collect.disclosures")
+async def fetch_disclosures(
+    target_date: date | None = None,
+    limit: int | None = 20,
+    client: httpx.AsyncClient | None = None,
+    limiter: RateLimiter | None = None,
+) -> list[Disclosure]:
+    """전일(또는 지정일) 주요 공시 목록을 가져온다.
+
+    limit=None 이면 페이지를 따라가며 유형별로 최대 DART_MAX_PAGES 페이지까지 모두 가져온다.
+    client/limiter를 주면 여러 날짜를 동시에 받을 때 커넥션 풀과 호출 한도를 공유한다 (백필).
+    """
+    if client is None:
+        async with http_client(timeout=15) as own_client:
+            return await _fetch_disclosures(own_client, target_date, limit, limiter)
+    return await _fetch_disclosures(client, target_date, limit, limiter)
+
+
+async def _fetch_disclosures(
+    client: httpx.AsyncClient, target_date: date | None, limit: int | None, limiter: RateLimiter | None,
+) -> list[Disclosure]:
+    settings.require("dart")
     if target_date is None:
         target_date = date.today() - timedelta(days=1)
 
+    # 상위 몇십 건이면 첫 페이지로 충분하고, 그 이상은 100건 단위로 페이지를 넘긴다
+    if limit is not None and limit <= 30:
+        page_count, max_pages = 30, 1
+    else:
+        page_count, max_pages = 100, DART_MAX_PAGES
+
     date_str = target_date.strftime("%Y%m%d")
     base_params = {
         "crtfc_key": settings.dart_api_key,
         "bgn_de": date_str,
         "end_de": date_str,
-        "page_count": 30,
+        "page_count": page_count,
     }
 
-    async with httpx.AsyncClient(timeout=15) as client:
-        # 4개 카테고리 동시 호출 — 스프링 WebFlux의 Mono.zip()과 동일
-        results = await asyncio.gather(
-            *[_fetch_by_type(client, base_params, ty) for ty in DISCLOSURE_TYPES],
-            return_exceptions=True,
-        )
+    # 4개 카테고리 동시 호출 — 스프링 WebFlux의 Mono.zip()과 동일
+    results = await asyncio.gather(
+        *[_fetch_by_type(client, base_params, ty, max_pages, limiter) for ty in DISCLOSURE_TYPES],
+        return_exceptions=True,
+    )
 
     # 결과 병합 (예외가 섞여 있을 수 있으므로 필터링)
     all_disclosures: list[dict] = []
@@ -93,4 +135,4 @@ async def fetch_disclosures(target_date: date | None = None) -> list[Disclosure]
                 flr_nm=d.get("flr_nm", ""),
             ))
 
-    return unique[:20]
+    return unique[:limit] if limit is not None else unique
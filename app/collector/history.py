@@ -0,0 +1,137 @@
+"""과거 시장 데이터 수집기 - pykrx(KRX 정보데이터시스템)로 지난 날짜의 시장 요약을 만든다.
+
+네이버 금융 API는 현재 시세만 주므로 백필(app/backfill.py)에서만 쓴다.
+- 지수/투자자 동향: 기간 전체 시계열을 처음에 한 번 받아 둔다 (날짜마다 부르지 않음)
+- 시총 TOP10: 거래일마다 받되, 같은 거래일을 보는 실행일끼리 공유하고 디스크에도 캐시한다
+  (과거 데이터는 바뀌지 않으므로 TTL 없음)
+"""
+
+import asyncio
+import bisect
+import logging
+from datetime import date, timedelta
+from typing import Any, Callable
+
+from pykrx import stock
+
+from app.cache import FileCache
+from app.collector.market import IndexData, InvestorData, MarketSummary, StockData
+from app.ratelimit import RateLimiter
+from app.telemetry import span
+
+logger = logging.getLogger(__name__)
+
+# KRX 지수 코드
+INDEX_TICKERS = {"kospi": ("1001", "코스피"), "kosdaq": ("2001", "코스닥")}
+INVESTOR_MARKETS = {"kospi_investor": "KOSPI", "kosdaq_investor": "KOSDAQ"}
+
+# 시작일 직전 거래일과 그 전일 종가(전일 대비 계산용)까지 받으려고 앞쪽으로 넉넉히 더 받는다
+_LOOKBACK_DAYS = 14
+
+
+def _direction(value: float) -> str:
+    return "상승" if value > 0 else "하락" if value < 0 else "보합"
+
+
+def _eok(won: float) -> str:
+    """원 → 억원 (순매수 부호 포함)."""
+    return f"{round(won / 1e8):+,}"
+
+
+class MarketHistory:
+    """기간 [start, end]의 실행일별 시장 요약 — 여러 날짜를 동시에 처리하는 백필이 공유한다."""
+
+    def __init__(self, start: date, end: date, limiter: RateLimiter | None = None, cache: FileCache | None = None):
+        self.start = start
+        self.end = end
+        self._limiter = limiter
+        self._cache = cache or FileCache("market_history")
+        self._days: dict[date, dict[str, Any]] = {}
+        self._trading_days: list[date] = []
+        self._top10: dict[date, asyncio.Task] = {}
+
+    async def load(self) -> None:
+        """지수와 투자자 동향 시계열을 받는다 (API 4회)."""
+        fromdate = (self.start - timedelta(days=_LOOKBACK_DAYS)).strftime("%Y%m%d")
+        todate = self.end.strftime("%Y%m%d")
+
+        for field, (ticker, name) in INDEX_TICKERS.items():
+            df = await self._call(stock.get_index_ohlcv_by_date, fromdate, todate, ticker, name_display=False)
+            prev_close = None
+            for ts, row in df.iterrows():
+                close = float(row["종가"])
+                change = close - prev_close if prev_close else 0.0
+                pct = change / prev_close * 100 if prev_close else 0.0
+                self._days.setdefault(ts.date(), {})[field] = IndexData(
+                    name=name,
+                    close=f"{close:,.2f}",
+                    change=f"{change:,.2f}",
+                    change_pct=f"{pct:.2f}",
+                    direction=_direction(change),
+                )
+                prev_close = close
+
+        for field, market in INVESTOR_MARKETS.items():
+            df = await self._call(stock.get_market_trading_value_by_date, fromdate, todate, market)
+            for ts, row in df.iterrows():
+                self._days.setdefault(ts.date(), {})[field] = InvestorData(
+                    personal=_eok(row["개인"]),
+                    foreign=_eok(row["외국인합계"]),
+                    institutional=_eok(row["기관합계"]),
+                )
+
+        self._trading_days = sorted(self._days)
+        logger.info("과거 시장 데이터: 거래일 %d일 (%s ~ %s)", len(self._trading_days), self.start, self.end)
+
+    def trading_day_before(self, run_date: date) -> date | None:
+        """run_date 아침 브리핑이 다루는 거래일 (run_date 직전 거래일)."""
+        i = bisect.bisect_left(self._trading_days, run_date)
+        return self._trading_days[i - 1] if i else None
+
+    async def summary_for(self, run_date: date) -> MarketSummary:
+        """run_date 07:00 실행이 fetch_market_summary()로 받았을 시장 요약."""
+        day = self.trading_day_before(run_date)
+        if day is None:
+            raise LookupError(f"{run_date} 이전 거래일 시장 데이터가 없습니다")
+        return MarketSummary(date=day.isoformat(), **self._days[day], kospi_top10=await self._top10_for(day))
+
+    async def _top10_for(self, day: date) -> list[StockData]:
+        # 토요일과 월요일 실행은 같은 금요일을 본다 → 진행 중인 조회를 함께 기다린다
+        if day not in self._top10:
+            self._top10[day] = asyncio.ensure_future(self._fetch_top10(day))
+        return await self._top10[day]
+
+    async def _fetch_top10(self, day: date) -> list[StockData]:
+        key = day.isoformat()
+        cached = self._cache.get(key)
+        if cached is not None:
+            return [StockData.model_validate(s) for s in cached]
+
+        ymd = day.strftime("%Y%m%d")
+        caps = await self._call(stock.get_market_cap, ymd, market="KOSPI")
+        prices = await self._call(stock.get_market_ohlcv, ymd, market="KOSPI")
+        tickers = list(caps.sort_values("시가총액", ascending=False).index[:10])
+        def ticker_names() -> dict[str, str]:
+            return {t: stock.get_market_ticker_name(t) for t in tickers}
+
+        names = await self._call(ticker_names)
+
+        top10 = []
+        for ticker in tickers:
+            pct = float(prices.at[ticker, "등락률"]) if ticker in prices.index else 0.0
+            top10.append(StockData(
+                name=names[ticker],
+                close=f"{int(caps.at[ticker, '종가']):,}",
+                change_pct=f"{pct:.2f}",
+                direction=_direction(pct),
+                volume=f"{int(caps.at[ticker, '거래량']):,}",
+            ))
+        self._cache.set(key, [s.model_dump() for s in top10])
+        return top10
+
+    async def _call(self, fn: Callable, *args, **kwargs):
+        # pykrx는 동기 HTTP(requests) — 이벤트 루프를 막지 않게 스레드에서, KRX 한도는 공유 리미터로
+        if self._limiter is not None:
+            await self._limiter.acquire()
+        with span(f"krx {getattr(fn, '__name__', 'call')}", kind="http"):
+            return await asyncio.to_thread(fn, *args, **kwargs)
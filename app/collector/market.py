@@ -5,6 +5,8 @@ import logging
 import httpx
 from pydantic import BaseModel
 
+from app.telemetry import http_client, traced
+
 logger = logging.getLogger(__name__)
 
 NAVER_STOCK_API = "https://m.stock.naver.com/api"
@@ -57,11 +59,12 @@ class MarketSummary(BaseModel):
 # ── 수집 함수 ──
 
 
+@traced("collect.market")
 async def fetch_market_summary() -> MarketSummary:
     """시장 요약 데이터를 가져온다."""
     market = MarketSummary()
 
-    async with httpx.AsyncClient(timeout=15, headers=HEADERS) as client:
+    async with http_client(timeout=15, headers=HEADERS) as client:
         # 코스피/코스닥 지수
         for code, field in [("KOSPI", "kospi"), ("KOSDAQ", "kosdaq")]:
             index_data = await _fetch_index(client, code)
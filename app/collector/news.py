@@ -1,12 +1,24 @@
-"""뉴스 수집기 - 네이버 뉴스 검색 API로 주요 경제/주식 뉴스를 수집한다."""
+"""뉴스 수집기 - 네이버 뉴스 검색 API로 주요 경제/주식 뉴스를 수집한다.
 
+종목별 뉴스(TickerNewsService)는 구독자 관심 종목 규모(수천 종목)를 전제로 한다:
+- 요청된 종목을 합쳐 고유 종목당 한 번만 검색 (여러 구독자가 같은 종목을 봐도 1회)
+- 종목별 TTL 캐시 — 메모리(같은 NewsArticle 객체 공유) → 디스크(프로세스 재시작 후에도) 순
+- 캐시 미스만 배치로 갱신하되 초당 호출 수와 일일 호출 한도(네이버 검색 API) 안에서만
+"""
+
+import asyncio
 import logging
 import re
-from dataclasses import dataclass
+import weakref
+from dataclasses import asdict, dataclass
+from datetime import date
 
 import httpx
 
+from app.cache import FileCache, MemoryCache
 from app.config import settings
+from app.ratelimit import RateLimiter
+from app.telemetry import http_client, traced
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +33,7 @@ class NewsArticle:
     description: str
     link: str
     pub_date: str
+    body: str = ""  # 기사 본문 발췌 (app/collector/article.py로 보강했을 때만)
 
 
 def _strip_html(text: str) -> str:
@@ -30,6 +43,20 @@ def _strip_html(text: str) -> str:
 
 async def fetch_news(query: str = "주식 증시", count: int = 5) -> list[NewsArticle]:
     """네이버 뉴스 검색으로 최신 뉴스를 가져온다."""
+    settings.require("naver")
+    try:
+        async with http_client(timeout=10) as client:
+            return await _search_news(client, query, count)
+    except httpx.HTTPStatusError as e:
+        logger.warning("뉴스 API HTTP 에러 (query=%s): %d", query, e.response.status_code)
+        return []
+    except httpx.RequestError as e:
+        logger.warning("뉴스 API 네트워크 에러 (query=%s): %s", query, e)
+        return []
+
+
+async def _search_news(client: httpx.AsyncClient, query: str, count: int) -> list[NewsArticle]:
+    """검색 1회. HTTP/네트워크 에러는 호출자에게 그대로 던진다."""
     headers = {
         "X-Naver-Client-Id": settings.naver_client_id,
         "X-Naver-Client-Secret": settings.naver_client_secret,
@@ -39,18 +66,9 @@ async def fetch_news(query: str = "주식 증시", count: int = 5) -> list[NewsA
         "display": count,
         "sort": "date",
     }
-
-    try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.get(NAVER_SEARCH_URL, headers=headers, params=params)
-            resp.raise_for_status()
-            data = resp.json()
-    except httpx.HTTPStatusError as e:
-        logger.warning("뉴스 API HTTP 에러 (query=%s): %d", query, e.response.status_code)
-        return []
-    except httpx.RequestError as e:
-        logger.warning("뉴스 API 네트워크 에러 (query=%s): %s", query, e)
-        return []
+    resp = await client.get(NAVER_SEARCH_URL, headers=headers, params=params)
+    resp.raise_for_status()
+    data = resp.json()
 
     return [
         NewsArticle(
@@ -63,6 +81,7 @@ async def fetch_news(query: str = "주식 증시", count: int = 5) -> list[NewsA
     ]
 
 
+@traced("collect.news")
 async def fetch_stock_news() -> list[NewsArticle]:
     """주식/경제 관련 뉴스를 여러 키워드로 수집한다."""
     queries = ["코스피 증시", "주식시장 전망", "경제 금리"]
@@ -79,11 +98,107 @@ async def fetch_stock_news() -> list[NewsArticle]:
     return all_news[:10]
 
 
-async def fetch_news_for_stocks(stock_names: list[str]) -> dict[str, list[NewsArticle]]:
-    """개별 종목별 뉴스를 수집한다. {종목명: [뉴스]} 형태로 반환."""
-    result: dict[str, list[NewsArticle]] = {}
-    for name in stock_names:
-        news = await fetch_news(query=f"{name} 주가", count=3)
-        if news:
-            result[name] = news
-    return result
+@traced("collect.stock_news")
+async def fetch_news_for_stocks(stock_names: list[str], refresh: bool = False) -> dict[str, list[NewsArticle]]:
+    """개별 종목별 뉴스를 수집한다. {종목명: [뉴스]} 형태로 반환 (뉴스가 없는 종목은 빠진다).
+
+    stock_names는 중복이 있어도 되고, 앞쪽 종목부터 갱신한다 (호출 한도가 모자라면 뒤쪽이 빠진다).
+    refresh=True면 캐시를 건너뛰고 모두 새로 검색한다 — 본 실행의 대장주 뉴스처럼 직전 뉴스가 중요한 곳용.
+    TTL 캐시는 관심 종목 팬아웃(personalize)처럼 같은 종목을 여러 번 찾는 곳에서 쓴다.
+    """
+    return await ticker_news.fetch(stock_names, refresh=refresh)
+
+
+class TickerNewsService:
+    """종목별 뉴스 — 고유 종목당 한 번 검색하고 TTL 동안 재사용한다 (스프링의 @Cacheable 서비스)."""
+
+    QUERY = "{name} 주가"
+    COUNT = 3
+
+    def __init__(self):
+        ttl = settings.ticker_news_ttl_minutes * 60
+        self._memory = MemoryCache(maxsize=settings.ticker_news_cache_size, ttl=ttl)
+        self._disk = FileCache("ticker_news", ttl=ttl)
+        self._quota = FileCache("naver_quota", ttl=2 * 86400)
+        self._limiter = RateLimiter(settings.naver_search_rps)
+        # 링크가 같은 기사는 종목이 달라도 같은 객체 (살아 있는 참조가 없으면 자동으로 빠진다)
+        self._articles: weakref.WeakValueDictionary[str, NewsArticle] = weakref.WeakValueDictionary()
+
+    async def fetch(self, names: list[str], refresh: bool = False) -> dict[str, list[NewsArticle]]:
+        """refresh=True면 캐시와 상관없이 모두 검색하고, 검색하지 못한 종목만 캐시로 채운다."""
+        unique = list(dict.fromkeys(n for n in names if n))
+        found: dict[str, tuple[NewsArticle, ...]] = {}
+        misses: list[str] = []
+        for name in unique:
+            cached = None if refresh else self._cached(name)
+            if cached is None:
+                misses.append(name)
+            else:
+                found[name] = cached
+
+        refreshed = await self._refresh(misses) if misses else {}
+        found.update(refreshed)
+        if refresh:
+            for name in misses:
+                if name not in refreshed and (cached := self._cached(name)) is not None:
+                    found[name] = cached
+        logger.info(
+            "종목 뉴스: 요청 %d (고유 %d), 캐시 %d, 검색 %d, 한도 초과로 건너뜀 %d",
+            len(names), len(unique), len(unique) - len(misses), len(refreshed), len(misses) - len(refreshed),
+        )
+        return {name: list(found[name]) for name in unique if found.get(name)}
+
+    def _cached(self, name: str) -> tuple[NewsArticle, ...] | None:
+        articles = self._memory.get(name)
+        if articles is not None:
+            return articles
+        stored = self._disk.get(name)
+        if stored is None:
+            return None
+        articles = tuple(self._intern(NewsArticle(**a)) for a in stored)
+        self._memory.set(name, articles)
+        return articles
+
+    async def _refresh(self, names: list[str]) -> dict[str, tuple[NewsArticle, ...]]:
+        """캐시 미스 종목을 배치로 검색한다. 일일 한도를 넘는 종목은 검색하지 않는다."""
+        settings.require("naver")
+        today = date.today().isoformat()
+        used = self._quota.get(today) or 0
+        allowed = names[:max(0, settings.naver_daily_quota - used)]
+        if len(allowed) < len(names):
+            logger.warning("네이버 검색 일일 한도 %d회 중 %d회 사용 — 종목 %d개는 검색하지 않음",
+                           settings.naver_daily_quota, used, len(names) - len(allowed))
+
+        refreshed: dict[str, tuple[NewsArticle, ...]] = {}
+        async with http_client(timeout=10) as client:
+            for i in range(0, len(allowed), settings.ticker_news_batch_size):
+                batch = allowed[i:i + settings.ticker_news_batch_size]
+                results = await asyncio.gather(*(self._search(client, name) for name in batch))
+                refreshed.update((name, articles) for name, articles in zip(batch, results) if articles is not None)
+                # 배치마다 사용량을 남긴다 — 중간에 죽어도 다음 실행이 한도를 넘지 않게
+                used += len(batch)
+                self._quota.set(today, used)
+        return refreshed
+
+    async def _search(self, client: httpx.AsyncClient, name: str) -> tuple[NewsArticle, ...] | None:
+        """검색 1회. 실패하면 None (캐시하지 않아서 다음 실행이 다시 시도한다)."""
+        await self._limiter.acquire()
+        try:
+            found = await _search_news(client, self.QUERY.format(name=name), self.COUNT)
+        except httpx.HTTPStatusError as e:
+            logger.warning("종목 뉴스 HTTP 에러 (%s): %d", name, e.response.status_code)
+            return None
+        except httpx.RequestError as e:
+            logger.warning("종목 뉴스 네트워크 에러 (%s): %s", name, e)
+            return None
+        # 뉴스가 없는 종목도 캐시한다 — 소형주 수천 개를 매번 다시 검색하지 않게
+        articles = tuple(self._intern(a) for a in found)
+        self._memory.set(name, articles)
+        self._disk.set(name, [asdict(a) for a in articles])
+        return articles
+
+    def _intern(self, article: NewsArticle) -> NewsArticle:
+        return self._articles.setdefault(article.link, article)
+
+
+ticker_news = TickerNewsService()
@@ -2,8 +2,13 @@
 
 스프링의 @ConfigurationProperties + @Validated 와 동일한 역할:
 - 환경변수 → 필드 자동 바인딩 (스프링의 relaxed binding과 유사)
-- 기본값 없는 필드 = 필수값 → 앱 시작 시 ValidationError (스프링의 @NotNull)
+- 모든 필드에 기본값이 있다 → 비밀값이 없어도 Settings()는 만들어진다 (필수 검증은 아래 require())
 - Literal 타입 = 허용값 제한 (스프링의 @Pattern 또는 enum 바인딩)
+
+API 키/SMTP 계정 같은 비밀값은 그룹(SETTING_GROUPS)으로 묶어 처음 쓰는 곳에서 require()로 검증한다
+(스프링의 @Lazy @ConfigurationProperties 빈) — 비어 있는 필드를 모아 SettingsError로 알린다 (스프링의 @NotNull).
+아카이브만 서빙하는 웹 프로세스는 키 없이도 뜬다.
+파이프라인을 돌리는 프로세스(워커, 스케줄러 리더)는 시작할 때 PIPELINE_GROUPS를 한 번에 검증한다.
 """
 
 from typing import Literal
@@ -17,26 +22,147 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
     )
 
-    # API Keys (필수 — 없으면 앱 시작 실패)
-    dart_api_key: str
-    anthropic_api_key: str
-    gemini_api_key: str
-    naver_client_id: str
-    naver_client_secret: str
+    # API Keys (그룹별로 처음 쓸 때 검증 — require() 참고)
+    dart_api_key: str = ""
+    anthropic_api_key: str = ""
+    gemini_api_key: str = ""
+    naver_client_id: str = ""
+    naver_client_secret: str = ""
 
     # AI Provider
-    ai_provider: Literal["claude", "gemini"] = "claude"
+    ai_provider: Literal["claude", "gemini", "hedged"] = "claude"
     claude_model: str = "claude-sonnet-4-5-20250929"
     gemini_model: str = "gemini-2.0-flash"
 
+    # 헤지 모드 (ai_provider="hedged"): 주 제공자가 지연/실패하면 나머지 제공자를 경쟁시킨다
+    hedge_primary: Literal["claude", "gemini"] = "claude"
+    hedge_delay_seconds: float = 30.0  # 이 시간 안에 주 제공자가 끝나지 않으면 보조 제공자 출발
+
+    # 브리핑 생성 방식: single = 한 번에 전체 생성, sections = 섹션별 병렬 생성 후 조립
+    briefing_mode: Literal["single", "sections"] = "single"
+    section_max_attempts: int = 2  # 섹션 하나당 최대 시도 횟수
+
+    # 공시 맵리듀스: 공시가 많은 날 배치별로 싼 모델로 먼저 요약(map)한 뒤 본 프롬프트에 넣는다(reduce)
+    disclosure_map_reduce: bool = False
+    disclosure_map_threshold: int = 20  # 공시가 이 건수를 넘으면 맵리듀스
+    disclosure_max_items: int = 500  # 맵리듀스 모드에서 수집할 최대 공시 수
+    disclosure_batch_size: int = 25
+    disclosure_map_concurrency: int = 4
+    claude_map_model: str = "claude-haiku-4-5"
+    gemini_map_model: str = "gemini-2.0-flash-lite"
+
+    # 개인화: 관심 종목 섹션 동시 생성 수
+    ticker_section_concurrency: int = 4
+
+    # 종목별 뉴스 (app/collector/news.py TickerNewsService) — 고유 종목당 한 번 검색, TTL 동안 재사용
+    ticker_news_ttl_minutes: float = 60.0
+    ticker_news_cache_size: int = 5000  # 프로세스 메모리에 들고 있는 종목 수 (넘치면 디스크 캐시에서 다시 읽음)
+    ticker_news_batch_size: int = 50  # 한 번에 동시 검색하는 종목 수
+    naver_search_rps: float = 8.0  # 네이버 검색 API 초당 호출 수 (공식 한도 10)
+    naver_daily_quota: int = 24000  # 종목 뉴스에 쓸 일일 호출 수 (공식 한도 25,000 — 나머지는 시장 뉴스 몫)
+
+    # 기사 본문 보강 (app/collector/article.py) — 대장주 뉴스 링크의 본문을 받아 등락 이유의 근거로 쓴다
+    article_enrichment: bool = False
+    article_max_bytes: int = 1_000_000  # 기사 하나당 최대 수신 바이트 (넘으면 받은 데까지만 파싱)
+    article_max_chars: int = 1500  # 기사 하나당 추출 본문 최대 길이 (프롬프트에 들어가는 양)
+    article_timeout_seconds: float = 5.0  # 기사 하나당 전체 수신 시간 한도 (느린 서버는 버린다)
+    article_concurrency: int = 8
+
+    # 캐시
+    cache_dir: str = ".cache"
+
+    # 과거 아카이브 백필 (python -m app.worker backfill)
+    backfill_concurrency: int = 6  # 동시에 처리하는 날짜 수 (= 동시 AI 요약 호출 수)
+    backfill_dart_rps: float = 5.0  # DART 초당 요청 수 — 모든 날짜가 공유 (일 20,000건 한도)
+    backfill_krx_rps: float = 1.0  # KRX(pykrx) 초당 요청 수 — 몰아서 부르면 차단된다
+
+    # 파이프라인 체크포인트 (app/checkpoint.py) — 실패 지점부터 재개용
+    checkpoint_dir: str = ".checkpoints"
+    checkpoint_keep_days: int = 14
+
+    # 워밍업: 06시 초안 이후 새로 들어온 뉴스가 이 수 이하면 07시에 초안을 그대로 쓴다 (AI 재호출 없음)
+    draft_max_new_items: int = 3
+
+    # 브리핑 본문을 gzip으로 압축해 저장 (읽을 때 자동으로 풀림)
+    compress_briefing_html: bool = True
+
+    # 정적 내보내기 (app/publisher.py) — 비우면 미들웨어를 끈다
+    static_site_dir: str = "site"
+
     # SMTP
     smtp_host: str = "smtp.gmail.com"
     smtp_port: int = 587  # str→int 자동 변환 (스프링의 @Value 타입 변환)
-    smtp_user: str
-    smtp_password: str
+    smtp_user: str = ""
+    smtp_password: str = ""
+    # 발송 성공 주소를 이만큼 모일 때마다 체크포인트에 덧붙인다 (중간에 죽어도 재개 시 재발송하지 않게)
+    delivery_checkpoint_batch: int = 20
 
     # Database
     database_url: str = "sqlite+aiosqlite:///briefing.db"
+    database_read_url: str = ""  # 읽기 복제본 (비우면 database_url 사용)
+    # 커넥션 풀 (PostgreSQL 등 서버형 DB)
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800  # 초 — 서버/프록시의 유휴 연결 끊김 대비
+    # SQLite PRAGMA (커넥션마다 적용)
+    sqlite_journal_mode: str = "wal"  # 쓰는 동안에도 읽기 가능
+    sqlite_synchronous: str = "normal"  # WAL에서는 normal로도 커밋 내구성 충분
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size_kib: int = 20000
+    sqlite_mmap_size_mb: int = 128
+
+    # 스케줄러 리더 선출 (여러 워커 중 하나만 예약 작업 실행)
+    # 파이프라인을 별도 워커(python -m app.worker)로 돌리면 웹은 false로 서빙만 한다
+    scheduler_enabled: bool = True
+    leader_lease_seconds: float = 60.0  # 하트비트가 끊기고 이 시간이 지나면 다른 워커가 넘겨받는다
+    leader_heartbeat_seconds: float = 15.0
+    catch_up_hours: float = 3.0  # 리더 교체 시 07:00 이후 이 시간 안이면 놓친 실행을 이어서 한다
+    # 실행일 점유(RunClaim)는 leader_lease_seconds 동안 유효하고, 실행 중에는 그 1/4 간격으로 갱신한다
+
+    # 실행 기록 (app/telemetry.py) — pipeline_runs / pipeline_spans, /metrics
+    telemetry_enabled: bool = True
+    telemetry_keep_days: int = 90
+
+    # 관리자 API와 /metrics (X-Admin-Token 헤더 또는 Bearer) — 비워두면 둘 다 비활성화
+    admin_token: str = ""
+
+    def require(self, *groups: str) -> None:
+        """설정 그룹의 필수값이 모두 채워졌는지 확인한다. 빠진 값이 있으면 환경변수 이름과 함께 SettingsError.
+
+        "ai"는 ai_provider가 쓰는 제공자 그룹(claude/gemini, hedged면 둘 다)으로 펼쳐진다.
+        """
+        missing = [
+            name.upper()
+            for group in groups
+            for sub in self._expand(group)
+            for name in SETTING_GROUPS[sub]
+            if not getattr(self, name)
+        ]
+        if missing:
+            raise SettingsError(f"필수 설정이 없습니다 ({', '.join(groups)}): {', '.join(dict.fromkeys(missing))}")
+
+    def _expand(self, group: str) -> tuple[str, ...]:
+        if group != "ai":
+            return (group,)
+        return ("claude", "gemini") if self.ai_provider == "hedged" else (self.ai_provider,)
+
+
+class SettingsError(RuntimeError):
+    """필수 설정 그룹이 비어 있다 (스프링의 BindValidationException)."""
+
+
+# 설정 그룹 → 필수 필드
+SETTING_GROUPS: dict[str, tuple[str, ...]] = {
+    "dart": ("dart_api_key",),
+    "naver": ("naver_client_id", "naver_client_secret"),
+    "claude": ("anthropic_api_key",),
+    "gemini": ("gemini_api_key",),
+    "smtp": ("smtp_user", "smtp_password"),
+}
+
+# 파이프라인 전체(수집 → 요약 → 발송)에 필요한 그룹
+PIPELINE_GROUPS = ("dart", "naver", "ai", "smtp")
 
 
 # 싱글턴 인스턴스 — 스프링의 @Bean과 유사
@@ -1,21 +1,202 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+"""DB 엔진/세션 — 쓰기용과 읽기용을 분리한다.
+
+스프링 대응:
+- engine / read_engine = 주/읽기 전용 DataSource (AbstractRoutingDataSource + @Transactional(readOnly=true))
+- pool_size 등         = HikariCP maximumPoolSize / connectionTimeout / maxLifetime
+- SQLite PRAGMA        = 커넥션 초기화 SQL (connectionInitSql)
+
+SQLite는 WAL 모드로 열어 파이프라인이 쓰는 동안에도 아카이브 읽기가 막히지 않게 한다.
+PostgreSQL은 postgresql+asyncpg:// (postgres:// 등도 자동 변환)로 쓰고, 읽기 복제본은 database_read_url로 지정한다.
+"""
+
+import logging
+
+from sqlalchemy import Connection, Integer, LargeBinary, String, event, inspect, text
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.schema import CreateColumn
+from sqlalchemy.types import TypeDecorator
 
 from app.config import settings
 
-engine = create_async_engine(settings.database_url, echo=False)
+logger = logging.getLogger(__name__)
+
+
+def async_url(url: str) -> URL:
+    """드라이버가 빠진 URL에 async 드라이버를 붙인다 (postgres:// → postgresql+asyncpg://)."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend in ("postgres", "postgresql") and parsed.drivername in ("postgres", "postgresql"):
+        return parsed.set(drivername="postgresql+asyncpg")
+    if parsed.drivername == "sqlite":
+        return parsed.set(drivername="sqlite+aiosqlite")
+    return parsed
+
+
+def sqlite_pragmas(readonly: bool = False) -> dict[str, str | int]:
+    """커넥션마다 적용할 SQLite PRAGMA (설정값 기반)."""
+    pragmas: dict[str, str | int] = {
+        "journal_mode": settings.sqlite_journal_mode,
+        "synchronous": settings.sqlite_synchronous,
+        "busy_timeout": settings.sqlite_busy_timeout_ms,
+        "cache_size": -settings.sqlite_cache_size_kib,  # 음수 = KiB 단위
+        "mmap_size": settings.sqlite_mmap_size_mb * 1024 * 1024,
+        "temp_store": "memory",
+        "foreign_keys": "on",
+    }
+    if readonly:
+        pragmas["query_only"] = "on"
+    return pragmas
+
+
+def create_engine_for(url: str, readonly: bool = False, pragmas: dict[str, str | int] | None = None) -> AsyncEngine:
+    """DB 종류에 맞는 풀/커넥션 설정으로 엔진을 만든다."""
+    parsed = async_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        engine = create_async_engine(parsed, echo=False)
+        _apply_pragmas(engine, sqlite_pragmas(readonly) if pragmas is None else pragmas)
+        return engine
+    return create_async_engine(
+        parsed,
+        echo=False,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=True,
+    )
+
+
+def _apply_pragmas(engine: AsyncEngine, pragmas: dict[str, str | int]) -> None:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_conn, _record) -> None:
+        cursor = dbapi_conn.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+        cursor.close()
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+
+
+engine = create_engine_for(settings.database_url)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# 읽기 전용 엔진 — 따로 지정하지 않으면 SQLite 파일은 같은 파일을 query_only 커넥션으로,
+# 그 외(인메모리 SQLite, PostgreSQL 단일 서버)는 쓰기 엔진을 그대로 쓴다.
+if settings.database_read_url:
+    read_engine = create_engine_for(settings.database_read_url, readonly=True)
+elif make_url(settings.database_url).get_backend_name() == "sqlite" and not _is_memory_sqlite(settings.database_url):
+    read_engine = create_engine_for(settings.database_url, readonly=True)
+else:
+    read_engine = engine
+read_session = async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+
 
 class Base(DeclarativeBase):
     pass
 
 
 async def init_db():
+    from app.search import sync_search_index
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_add_missing_columns)
+        await conn.run_sync(_add_missing_indexes)
+        await conn.run_sync(_migrate_binary_columns)
+        await conn.run_sync(_backfill_excerpts)
+        await conn.run_sync(sync_search_index)
+
+
+def _add_missing_columns(conn: Connection) -> None:
+    """create_all은 기존 테이블을 바꾸지 않는다 — 모델에 새로 생긴 컬럼만 ALTER TABLE로 추가한다."""
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {c["name"] for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing:
+                ddl = CreateColumn(column).compile(dialect=conn.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {ddl}"))
+
+
+def _add_missing_indexes(conn: Connection) -> None:
+    """기존 테이블에 모델에 새로 생긴 인덱스를 만든다 (create_all은 이미 있는 테이블의 인덱스를 건너뛴다)."""
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(conn)
+
+
+def _migrate_binary_columns(conn: Connection) -> None:
+    """TEXT로 만들어진 기존 컬럼을 모델의 바이너리 타입으로 바꾼다 (briefings.content_html 압축 저장 도입).
+
+    SQLite는 컬럼 타입과 무관하게 값을 저장하므로 그대로 두고(평문 행은 CompressedText가 읽는다),
+    PostgreSQL은 BYTEA로 바꾸면서 기존 평문을 UTF-8 바이트로 옮긴다.
+    """
+    if conn.dialect.name == "sqlite":
+        return
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {c["name"]: c["type"] for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            current = existing.get(column.name)
+            storage = column.type.impl if isinstance(column.type, TypeDecorator) else column.type
+            if not isinstance(storage, LargeBinary) or not isinstance(current, String):
+                continue
+            if conn.dialect.name != "postgresql":
+                logger.warning("%s.%s 컬럼이 %s입니다 — 바이너리 타입으로 직접 바꿔주세요", table.name, column.name, current)
+                continue
+            conn.execute(text(
+                f"ALTER TABLE {table.name} ALTER COLUMN {column.name} TYPE BYTEA USING convert_to({column.name}, 'UTF8')"
+            ))
+            logger.info("%s.%s: %s → BYTEA", table.name, column.name, current)
+
+
+def _backfill_excerpts(conn: Connection) -> None:
+    """발췌문 컬럼 도입 전에 저장된 브리핑의 발췌문을 채운다."""
+    from app.models import CompressedText
+    from app.text import make_excerpt
+
+    query = text("SELECT id, content_html FROM briefings WHERE excerpt = ''").columns(id=Integer, content_html=CompressedText)
+    rows = conn.execute(query).all()
+    if rows:
+        conn.execute(
+            text("UPDATE briefings SET excerpt = :excerpt WHERE id = :id"),
+            [{"id": row_id, "excerpt": make_excerpt(html or "")} for row_id, html in rows],
+        )
+
+
+def dialect_insert(db: AsyncSession | Connection, model):
+    """방언별 INSERT — ON CONFLICT 절(on_conflict_do_nothing 등)을 붙일 수 있는 구문."""
+    dialect = db.bind.dialect.name if isinstance(db, AsyncSession) else db.dialect.name
+    if dialect == "sqlite":
+        return sqlite.insert(model)
+    if dialect == "postgresql":
+        from sqlalchemy.dialects import postgresql  # asyncpg 방언 로딩은 PostgreSQL을 쓸 때만
+
+        return postgresql.insert(model)
+    raise NotImplementedError(f"ON CONFLICT를 지원하지 않는 DB: {dialect}")
 
 
 async def get_db():
     async with async_session() as session:
         yield session
+
+
+async def get_read_db():
+    """조회 전용 라우트용 세션 (읽기 엔진)."""
+    async with read_session() as session:
+        yield session
@@ -9,27 +9,35 @@
 import asyncio
 import logging
 import smtplib
+import time
+from typing import Callable
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from app.config import settings
+from app.telemetry import observe
 
 logger = logging.getLogger(__name__)
 
 
-def _build_message(to_email: str, subject: str, html_body: str) -> MIMEMultipart:
-    """이메일 MIME 메시지를 조립한다."""
+def _html_part(html_body: str) -> MIMEText:
+    """HTML 본문 MIME 파트. base64 인코딩은 생성 시점에 한 번만 일어난다."""
+    return MIMEText(html_body, "html", "utf-8")
+
+
+def _build_message(to_email: str, subject: str, html_body: str | MIMEText) -> MIMEMultipart:
+    """이메일 MIME 메시지를 조립한다. 미리 만든 본문 파트를 받으면 그대로 붙인다."""
     msg = MIMEMultipart("alternative")
     msg["From"] = settings.smtp_user
     msg["To"] = to_email
     msg["Subject"] = subject
-    msg.attach(MIMEText(html_body, "html", "utf-8"))
+    msg.attach(html_body if isinstance(html_body, MIMEText) else _html_part(html_body))
     return msg
 
 
-def _send_smtp(to_email: str, subject: str, html_body: str) -> None:
+def _send_smtp(to_email: str, subject: str, html_body: str | MIMEText) -> None:
     """동기 SMTP 발송 (스레드풀에서 실행될 함수)."""
     msg = _build_message(to_email, subject, html_body)
     with smtplib.SMTP(settings.smtp_host, settings.smtp_port) as server:
@@ -47,21 +55,58 @@ def _send_smtp(to_email: str, subject: str, html_body: str) -> None:
     )),
     reraise=True,
 )
-async def send_email(to_email: str, subject: str, html_body: str) -> bool:
+async def send_email(to_email: str, subject: str, html_body: str | MIMEText) -> bool:
     """HTML 이메일을 비동기로 발송한다. SMTP 에러 시 최대 3회 재시도."""
+    started = time.perf_counter()
     try:
         await asyncio.to_thread(_send_smtp, to_email, subject, html_body)
+        observe("smtp", "send", started)
         return True
     except Exception as e:
+        observe("smtp", "send", started, ok=False)
         logger.error("이메일 발송 실패 (%s): %s", to_email, e)
         return False
 
 
-async def send_briefing_to_subscribers(subscribers: list[str], subject: str, html_body: str) -> dict:
-    """구독자 리스트에 브리핑 이메일을 동시 발송한다."""
-    tasks = [send_email(email, subject, html_body) for email in subscribers]
-    results_list = await asyncio.gather(*tasks)
+async def send_briefing_to_subscribers(
+    subscribers: list[str],
+    subject: str,
+    html_body: str,
+    on_delivered: Callable[[list[str]], None] | None = None,
+) -> dict:
+    """구독자 리스트에 브리핑 이메일을 동시 발송한다.
+
+    본문 MIME 파트는 한 번만 만들어서 모든 구독자 메시지가 공유한다 (구독자마다 재인코딩하지 않음).
+    on_delivered는 성공한 주소를 delivery_checkpoint_batch개씩 (취소되면 그때까지 모인 만큼) 받는다.
+    """
+    settings.require("smtp")  # 구독자마다 로그인 실패로 흩어지기 전에 한 번에 알린다
+    body = _html_part(html_body)
+
+    async def send(email: str) -> tuple[str, bool]:
+        return email, await send_email(email, subject, body)
+
+    tasks = [asyncio.create_task(send(email)) for email in subscribers]
+    failed: set[str] = set()
+    pending: list[str] = []
+    try:
+        for finished in asyncio.as_completed(tasks):
+            email, ok = await finished
+            if not ok:
+                failed.add(email)
+                continue
+            pending.append(email)
+            if on_delivered is not None and len(pending) >= settings.delivery_checkpoint_batch:
+                on_delivered(pending)
+                pending = []
+    finally:
+        # 중간에 취소/예외로 빠져나오면 남은 발송은 멈추고, 그때까지 성공한 주소는 남긴다
+        for task in tasks:
+            task.cancel()
+        if on_delivered is not None and pending:
+            on_delivered(pending)
 
-    success = sum(1 for r in results_list if r)
-    fail = len(results_list) - success
-    return {"success": success, "fail": fail}
+    return {
+        "success": len(subscribers) - len(failed),
+        "fail": len(failed),
+        "failed": [email for email in subscribers if email in failed],
+    }
@@ -0,0 +1,69 @@
+"""렌더링된 이메일 저장소 — 한 번 렌더링한 결과를 브리핑 옆에 저장해 두고 재사용한다.
+
+스타일링 + Jinja 렌더링은 브리핑당 한 번만 한다:
+- 발송: 저장된 HTML로 MIME 본문을 한 번 만들어 모든 구독자에게 재사용
+- 재발송: 렌더링 없이 저장된 바이트 그대로 발송
+- 웹 보기(/archive/{date}/email): 저장된 바이트(또는 gzip 변형)를 그대로 응답
+"""
+
+import gzip
+import hashlib
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.email_template import render_email
+from app.models import BriefingEmail
+
+
+@dataclass(frozen=True)
+class EmailArtifact:
+    """렌더링 완료된 이메일 (저장/발송 단위)."""
+
+    date: str
+    html: bytes
+    html_gzip: bytes
+    content_hash: str
+
+    @property
+    def text(self) -> str:
+        return self.html.decode("utf-8")
+
+
+def build_artifact(briefing_date: str, title: str, content_html: str) -> EmailArtifact:
+    """브리핑을 최종 이메일로 렌더링하고 압축 변형과 해시를 만든다."""
+    html = render_email(title, content_html).encode("utf-8")
+    return EmailArtifact(
+        date=briefing_date,
+        html=html,
+        # mtime=0 → 같은 내용이면 압축 결과도 같다 (해시/ETag 안정)
+        html_gzip=gzip.compress(html, compresslevel=9, mtime=0),
+        content_hash=hashlib.sha256(html).hexdigest(),
+    )
+
+
+async def save_artifact(db: AsyncSession, artifact: EmailArtifact) -> None:
+    """이메일 산출물을 저장한다 (같은 날짜가 있으면 교체). 커밋은 호출자가 한다."""
+    existing = await db.execute(select(BriefingEmail).where(BriefingEmail.date == artifact.date))
+    row = existing.scalar_one_or_none()
+    if row is None:
+        row = BriefingEmail(date=artifact.date)
+        db.add(row)
+    row.html = artifact.html
+    row.html_gzip = artifact.html_gzip
+    row.content_hash = artifact.content_hash
+
+
+async def load_artifact(db: AsyncSession, briefing_date: str) -> EmailArtifact | None:
+    """저장된 이메일 산출물을 가져온다."""
+    result = await db.execute(select(BriefingEmail).where(BriefingEmail.date == briefing_date))
+    row = result.scalar_one_or_none()
+    if row is None:
+        return None
+    return EmailArtifact(
+        date=row.date,
+        html=row.html,
+        html_gzip=row.html_gzip,
+        content_hash=row.content_hash,
+    )
@@ -15,38 +15,61 @@ _TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates"
 _env = Environment(loader=FileSystemLoader(_TEMPLATE_DIR), autoescape=False)
 
 
-def render_email(title: str, content_html: str) -> str:
-    """브리핑 HTML을 다크 테마 이메일 템플릿으로 렌더링한다."""
+def render_email(title: str, content_html: str, watchlist_html: str = "") -> str:
+    """브리핑 HTML을 다크 테마 이메일 템플릿으로 렌더링한다.
+
+    watchlist_html은 본문 바로 뒤에 붙는다 (이미 스타일이 적용된 HTML이어야 한다).
+    """
     styled = _style_content_html(content_html)
     template = _env.get_template("email_briefing.html")
-    return template.render(title=title, content_html=styled)
+    return template.render(title=title, content_html=styled, watchlist_html=watchlist_html)
 
 
-def _style_content_html(html: str) -> str:
-    """AI가 생성한 HTML에 다크 테마 인라인 스타일을 자동 적용한다."""
+# ── 태그별 다크 테마 스타일 (태그 → 치환 문자열) ──
+# AI가 class/id 같은 속성을 붙여도 태그째 교체한다 (스타일은 여기서만 결정).
+
+_H2_OPEN = (
+    '<table cellpadding="0" cellspacing="0" border="0" width="100%" style="margin-top: 28px; margin-bottom: 14px;">'
+    '<tr><td style="width: 4px; background-color: #3182F6; border-radius: 2px;"></td>'
+    '<td style="padding-left: 12px; font-size: 17px; font-weight: 700; color: #FFFFFF; line-height: 1.4;">'
+)
+
+_OPEN_TAGS = {
     # <h2> → 섹션 헤더 (왼쪽 파란 바 + 흰 볼드)
-    html = re.sub(
-        r'<h2>(.*?)</h2>',
-        r'<table cellpadding="0" cellspacing="0" border="0" width="100%" style="margin-top: 28px; margin-bottom: 14px;">'
-        r'<tr><td style="width: 4px; background-color: #3182F6; border-radius: 2px;"></td>'
-        r'<td style="padding-left: 12px; font-size: 17px; font-weight: 700; color: #FFFFFF; line-height: 1.4;">\1</td>'
-        r'</tr></table>',
-        html,
-    )
+    "h2": _H2_OPEN,
     # <ul> → 리스트 컨테이너
-    html = html.replace('<ul>', '<ul style="list-style: none; padding: 0; margin: 0 0 8px 0;">')
+    "ul": '<ul style="list-style: none; padding: 0; margin: 0 0 8px 0;">',
     # <li> → 리스트 아이템 (다크 카드)
-    html = re.sub(
-        r'<li(?:\s[^>]*)?>',
-        '<li style="background-color: rgba(255,255,255,0.06); border: 1px solid rgba(255,255,255,0.05); border-radius: 12px; padding: 14px 16px; margin-bottom: 10px; font-size: 14px; line-height: 1.75; color: rgba(255,255,255,0.75);">',
-        html,
-    )
+    "li": '<li style="background-color: rgba(255,255,255,0.06); border: 1px solid rgba(255,255,255,0.05); border-radius: 12px; padding: 14px 16px; margin-bottom: 10px; font-size: 14px; line-height: 1.75; color: rgba(255,255,255,0.75);">',
     # <strong> → 흰색 볼드
-    html = html.replace('<strong>', '<strong style="color: #FFFFFF; font-weight: 700;">')
+    "strong": '<strong style="color: #FFFFFF; font-weight: 700;">',
     # <p> → 본문 텍스트
-    html = re.sub(
-        r'<p(?:\s[^>]*)?>',
-        '<p style="font-size: 14px; line-height: 1.75; color: rgba(255,255,255,0.65); margin: 0 0 12px 0;">',
-        html,
-    )
-    return html
+    "p": '<p style="font-size: 14px; line-height: 1.75; color: rgba(255,255,255,0.65); margin: 0 0 12px 0;">',
+}
+
+_CLOSE_TAGS = {
+    "h2": "</td></tr></table>",
+}
+
+# 표에 있는 태그만 매칭한다 — 여는 태그는 이름 뒤에 공백+속성만 허용 (<pre>, <link> 는 제외됨)
+_TAG_RE = re.compile(
+    r"<(?:(%s)(?:\s[^>]*)?|/(%s))>" % ("|".join(_OPEN_TAGS), "|".join(_CLOSE_TAGS)),
+    re.IGNORECASE,
+)
+
+
+def _style_content_html(html: str) -> str:
+    """AI가 생성한 HTML에 다크 테마 인라인 스타일을 자동 적용한다.
+
+    스타일 표에 있는 태그만 한 번 훑으면서 교체한다 (본문 크기에 선형, 재스캔 없음).
+    """
+    # split 결과는 [텍스트, 여는 태그명, 닫는 태그명, 텍스트, ...] 3칸 단위
+    parts = _TAG_RE.split(html)
+    for i in range(1, len(parts), 3):
+        opening, closing = parts[i], parts[i + 1]
+        if opening is not None:
+            parts[i] = _OPEN_TAGS[opening.lower()]
+        else:
+            parts[i] = _CLOSE_TAGS[closing.lower()]
+        parts[i + 1] = ""
+    return "".join(parts)
@@ -0,0 +1,243 @@
+"""스케줄러 리더 선출 — DB 임대(lease) 행 + 하트비트.
+
+uvicorn 워커를 N개 띄우면 lifespan이 N번 돌아 스케줄러도 N개가 된다 → 같은 메일이 N통.
+워커마다 scheduler_leases 행을 조건부 UPDATE 한 번으로 잡으려고 시도하고,
+성공한 하나만 스케줄러를 띄운다. 리더가 죽어 하트비트가 끊기면 임대가 만료되고 다른 워커가 넘겨받는다.
+
+스프링 대응:
+- LeaderElector     = ShedLock / LockRegistryLeaderInitiator (JDBC 락 테이블)
+- try_acquire()     = UPDATE ... WHERE holder = 나 OR expires_at < now (원자적 compare-and-set)
+- SchedulerLeader   = SmartLifecycle (리더가 되면 시작, 리더를 잃으면 정지)
+- RunClaim          = Spring Batch의 JobInstance 중복 실행 방지 (실행일 하나 = 임대 행 하나)
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Awaitable, Callable
+
+from sqlalchemy import case, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.database import async_session, dialect_insert
+from app.models import SchedulerLease
+
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class LeaderElector:
+    """임대 행 하나를 두고 경쟁한다. 임대 시간 안에 갱신(하트비트)하면 리더를 유지한다."""
+
+    def __init__(self, name: str = "scheduler", holder: str | None = None, ttl: float | None = None):
+        self.name = name
+        self.holder = holder or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.ttl = timedelta(seconds=settings.leader_lease_seconds if ttl is None else ttl)
+        # 마지막으로 잡은(연장한) 임대 — 임기 시작 시각과 만료 시각
+        self.acquired_at: datetime | None = None
+        self.expires_at: datetime | None = None
+
+    def holds_lease(self, now: datetime | None = None) -> bool:
+        """DB에 묻지 않고, 마지막으로 연장한 임대가 아직 유효한지 (그동안은 다른 워커가 가져갈 수 없다)."""
+        return self.expires_at is not None and (now or _utcnow()) < self.expires_at
+
+    async def try_acquire(self, db: AsyncSession, now: datetime | None = None) -> bool:
+        """리더면 임대를 연장하고, 임대가 비었거나 만료됐으면 가져온다. 커밋까지 한다.
+
+        성공하면 acquired_at(이번 임기의 시작 — 연장이면 그대로)과 expires_at을 갱신한다.
+        """
+        now = now or _utcnow()
+        await db.execute(
+            dialect_insert(db, SchedulerLease)
+            .values(name=self.name, holder="", expires_at=_EPOCH)
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
+        result = await db.execute(
+            update(SchedulerLease)
+            .where(
+                SchedulerLease.name == self.name,
+                (SchedulerLease.holder == self.holder) | (SchedulerLease.expires_at < now),
+            )
+            .values(
+                holder=self.holder,
+                expires_at=now + self.ttl,
+                # SET 절의 컬럼 참조는 갱신 전 값 — 연장이면 그대로, 새로 잡았으면 지금
+                acquired_at=case((SchedulerLease.holder == self.holder, SchedulerLease.acquired_at), else_=now),
+            )
+        )
+        if result.rowcount != 1:
+            await db.commit()
+            self.acquired_at = self.expires_at = None
+            return False
+        acquired_at = await db.scalar(select(SchedulerLease.acquired_at).where(SchedulerLease.name == self.name))
+        await db.commit()
+        self.acquired_at, self.expires_at = acquired_at, now + self.ttl
+        return True
+
+    async def release(self, db: AsyncSession) -> None:
+        """임대를 즉시 반납한다 (정상 종료 시 — 다른 워커가 만료를 기다리지 않게)."""
+        await db.execute(
+            update(SchedulerLease)
+            .where(SchedulerLease.name == self.name, SchedulerLease.holder == self.holder)
+            .values(holder="", expires_at=_EPOCH)
+        )
+        await db.commit()
+        self.acquired_at = self.expires_at = None
+
+
+class SchedulerLeader:
+    """하트비트 루프 — 리더가 되면 스케줄러를 띄우고(+놓친 실행 따라잡기), 리더를 잃으면 내린다."""
+
+    def __init__(
+        self,
+        start: Callable[[], object],
+        on_elected: Callable[[], Awaitable[None]] | None = None,
+        elector: LeaderElector | None = None,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        heartbeat: float | None = None,
+    ):
+        self._start = start
+        self._on_elected = on_elected
+        self.elector = elector or LeaderElector()
+        self._sessions = session_factory or async_session
+        self._heartbeat = settings.leader_heartbeat_seconds if heartbeat is None else heartbeat
+        self._scheduler = None
+        self._term: datetime | None = None  # 따라잡기를 마친 임기 (acquired_at)
+        self._task: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def is_leader(self) -> bool:
+        return self._scheduler is not None
+
+    async def start(self) -> None:
+        await self.tick()
+        self._task = asyncio.create_task(self._loop(), name="scheduler-leader")
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self.is_leader:
+            self._step_down()
+            async with self._sessions() as db:
+                await self.elector.release(db)
+
+    async def tick(self) -> None:
+        """하트비트 1회: 임대를 잡거나 연장하고, 결과에 따라 스케줄러를 올리거나 내린다.
+
+        - 갱신이 일시적으로 실패해도 마지막 임대가 만료되기 전까지는 리더를 유지한다
+          (그동안 다른 워커도 임대를 못 가져가므로 리더가 둘이 되지 않는다)
+        - 따라잡기(on_elected)는 임대를 새로 잡았을 때(acquired_at이 바뀜)만 — 연장/재기동에는 돌리지 않는다
+        """
+        try:
+            async with self._sessions() as db:
+                leading = await self.elector.try_acquire(db)
+        except Exception:
+            leading = self.elector.holds_lease()
+            logger.exception("리더 임대 갱신 실패 (%s)", "만료 전까지 리더 유지" if leading else "리더 내려놓음")
+
+        if not leading:
+            if self.is_leader:
+                logger.warning("스케줄러 리더 상실: %s", self.elector.holder)
+                self._step_down()
+            return
+
+        if not self.is_leader:
+            logger.info("스케줄러 리더 선출: %s", self.elector.holder)
+            self._scheduler = self._start()
+        if self.elector.acquired_at != self._term:
+            self._term = self.elector.acquired_at
+            if self._on_elected is not None:
+                task = asyncio.create_task(self._on_elected(), name="scheduler-catch-up")
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    def _step_down(self) -> None:
+        # AsyncIOScheduler는 shutdown 때 실행 중인 코루틴 잡을 취소한다. 따라잡기 태스크는 여기서 직접 취소
+        # (실행 도중 취소돼도 실행일 점유와 delivered 체크포인트가 있어 새 리더가 이어서 한다)
+        self._scheduler.shutdown(wait=False)
+        self._scheduler = None
+        for task in list(self._tasks):
+            task.cancel()
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._heartbeat)
+            await self.tick()
+
+
+class RunClaim:
+    """실행일 점유 — 프로세스가 달라도 같은 실행일의 파이프라인은 한 곳에서만 돈다.
+
+    리더가 임대를 잃어도 이전 리더의 실행이 살아 있으면 점유를 계속 갱신하므로, 새 리더의 따라잡기는 점유에 실패해 건너뛴다.
+    반대로 점유를 갱신하지 못해 넘어가면 그 실행을 취소한다 (둘이 동시에 발송하지 않게).
+    """
+
+    def __init__(
+        self,
+        run_date: str,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        ttl: float | None = None,
+    ):
+        self.elector = LeaderElector(f"run:{run_date}", ttl=settings.leader_lease_seconds if ttl is None else ttl)
+        self._sessions = session_factory or async_session
+
+    @contextlib.asynccontextmanager
+    async def hold(self, wait: float = 0) -> AsyncIterator[bool]:
+        """점유를 잡았으면 True를 내주고, 블록이 끝날 때까지 갱신한 뒤 반납한다.
+
+        wait초까지는 다른 곳의 점유가 풀리기(반납 또는 만료)를 기다린다. 그래도 못 잡으면 False.
+        """
+        deadline = time.monotonic() + wait
+        while True:
+            async with self._sessions() as db:
+                acquired = await self.elector.try_acquire(db)
+            remaining = deadline - time.monotonic()
+            if acquired or remaining <= 0:
+                break
+            await asyncio.sleep(min(self.elector.ttl.total_seconds() / 4, remaining))
+        if not acquired:
+            yield False
+            return
+        renewal = asyncio.create_task(self._renew(asyncio.current_task()), name=f"{self.elector.name}-claim")
+        try:
+            yield True
+        finally:
+            renewal.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await renewal
+            try:
+                async with self._sessions() as db:
+                    await self.elector.release(db)
+            except Exception:
+                # 반납하지 못해도 임대 시간이 지나면 풀린다
+                logger.exception("실행 점유 반납 실패: %s", self.elector.name)
+
+    async def _renew(self, owner: asyncio.Task) -> None:
+        while True:
+            await asyncio.sleep(self.elector.ttl.total_seconds() / 4)
+            try:
+                async with self._sessions() as db:
+                    held = await self.elector.try_acquire(db)
+            except Exception:
+                held = self.elector.holds_lease()
+                logger.exception("실행 점유 갱신 실패 (%s)", "만료 전까지 유지" if held else "점유 상실")
+            if not held:
+                logger.error("실행 점유를 잃었습니다 (%s) — 중복 발송을 막기 위해 실행을 취소합니다", self.elector.name)
+                owner.cancel()
+                return
@@ -1,10 +1,46 @@
+import functools
+import gzip
+import logging
+import sqlite3
 from datetime import datetime
 
-from sqlalchemy import String, Text, DateTime, Boolean
+from sqlalchemy import DDL, JSON, Float, String, Text, DateTime, Boolean, LargeBinary, ForeignKey, UniqueConstraint, event
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
 
+from app.config import settings
 from app.database import Base
 
+logger = logging.getLogger(__name__)
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class CompressedText(TypeDecorator):
+    """gzip으로 압축해 BLOB으로 저장하는 문자열 컬럼 (JPA의 AttributeConverter).
+
+    읽을 때는 투명하게 풀어서 str을 돌려준다. 압축 전에 저장된 평문 행(TEXT)도 그대로 읽는다.
+    settings.compress_briefing_html=False면 압축 없이 UTF-8 바이트로 저장한다.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: str | None, dialect) -> bytes | None:
+        if value is None:
+            return None
+        data = value.encode("utf-8")
+        # mtime=0 → 같은 본문은 같은 바이트 (그대로 Content-Encoding: gzip 응답에 쓸 수 있다)
+        return gzip.compress(data, compresslevel=9, mtime=0) if settings.compress_briefing_html else data
+
+    def process_result_value(self, value: bytes | str | None, dialect) -> str | None:
+        if value is None or isinstance(value, str):
+            return value
+        value = bytes(value)
+        if value[:2] == GZIP_MAGIC:
+            value = gzip.decompress(value)
+        return value.decode("utf-8")
+
 
 class Subscriber(Base):
     __tablename__ = "subscribers"
@@ -15,11 +51,129 @@ class Subscriber(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
 
 
+class SubscriberTicker(Base):
+    """구독자 관심 종목 (종목명 기준 — 뉴스 검색/시총 TOP10 매칭이 종목명으로 동작)."""
+
+    __tablename__ = "subscriber_tickers"
+    __table_args__ = (UniqueConstraint("subscriber_id", "ticker"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    subscriber_id: Mapped[int] = mapped_column(ForeignKey("subscribers.id", ondelete="CASCADE"), index=True)
+    ticker: Mapped[str] = mapped_column(String(50))
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+
+
 class Briefing(Base):
     __tablename__ = "briefings"
 
     id: Mapped[int] = mapped_column(primary_key=True)
     date: Mapped[str] = mapped_column(String(10), unique=True, index=True)  # YYYY-MM-DD
     title: Mapped[str] = mapped_column(String(200))
-    content_html: Mapped[str] = mapped_column(Text)
+    # 본문은 상세 화면에서만 필요 → 기본 로딩에서 제외 (필요하면 undefer)
+    content_html: Mapped[str] = mapped_column(CompressedText, deferred=True)
+    # 목록 화면용 평문 발췌문 (저장 시 계산)
+    excerpt: Mapped[str] = mapped_column(String(200), default="", server_default="")
+    # 검색용 평문 본문 — FTS5 색인이 없는 DB(PostgreSQL 등)에서만 채운다 (본문은 압축 저장이라 LIKE가 안 닿음)
+    search_text: Mapped[str | None] = mapped_column(Text, nullable=True, deferred=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    # HTTP Last-Modified 용 (컬럼 도입 전 행은 NULL → created_at 사용)
+    # 인덱스: max(updated_at)이 아카이브 캐시의 세대 — 다른 프로세스가 저장해도 웹 워커가 알아챈다
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime, default=datetime.now, onupdate=datetime.now, index=True,
+    )
+
+
+class BriefingEmail(Base):
+    """브리핑별 최종 렌더링된 이메일 — 발송/재발송/웹 보기가 저장된 바이트를 그대로 쓴다."""
+
+    __tablename__ = "briefing_emails"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    date: Mapped[str] = mapped_column(String(10), unique=True, index=True)  # Briefing.date
+    html: Mapped[bytes] = mapped_column(LargeBinary)  # UTF-8 인코딩된 최종 HTML
+    html_gzip: Mapped[bytes] = mapped_column(LargeBinary)  # 미리 압축한 변형
+    content_hash: Mapped[str] = mapped_column(String(64))  # html의 sha256
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+
+
+class SchedulerLease(Base):
+    """스케줄러 리더 임대(lease) — 여러 워커 중 holder 하나만 예약 작업을 돌린다 (app/leader.py)."""
+
+    __tablename__ = "scheduler_leases"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    holder: Mapped[str] = mapped_column(String(100), default="")
+    expires_at: Mapped[datetime] = mapped_column(DateTime)  # UTC
+    acquired_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
+class PipelineRun(Base):
+    """파이프라인 실행 1회 기록 (app/telemetry.py) — 실행 종류별 소요 시간과 성공 여부."""
+
+    __tablename__ = "pipeline_runs"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    kind: Mapped[str] = mapped_column(String(30), index=True)  # daily / prefetch / draft / after_close / backfill
+    run_date: Mapped[str] = mapped_column(String(10), index=True)  # YYYY-MM-DD
+    started_at: Mapped[datetime] = mapped_column(DateTime)
+    duration_ms: Mapped[float] = mapped_column(Float)
+    status: Mapped[str] = mapped_column(String(10))  # ok / failed
+    error: Mapped[str] = mapped_column(Text, default="")
+
+
+class PipelineSpan(Base):
+    """실행 안의 구간 (단계, 외부 HTTP 호출, AI 호출, SMTP 발송)."""
+
+    __tablename__ = "pipeline_spans"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    run_id: Mapped[int] = mapped_column(ForeignKey("pipeline_runs.id", ondelete="CASCADE"), index=True)
+    seq: Mapped[int] = mapped_column()  # 실행 안에서의 시작 순서
+    parent_seq: Mapped[int | None] = mapped_column(nullable=True)
+    kind: Mapped[str] = mapped_column(String(20))  # stage / http / ai / smtp
+    name: Mapped[str] = mapped_column(String(200))
+    offset_ms: Mapped[float] = mapped_column(Float)  # 실행 시작으로부터
+    duration_ms: Mapped[float] = mapped_column(Float)
+    status: Mapped[str] = mapped_column(String(10))  # ok / error
+    attrs: Mapped[dict] = mapped_column(JSON, default=dict)  # HTTP 상태 코드, 토큰 수 등
+
+
+# ── 아카이브 전문 검색 색인 (SQLite FTS5, app/search.py 참고) ──
+# ORM 모델이 아닌 가상 테이블이라 create_all/drop_all 이벤트로 함께 생성/삭제한다.
+# trigram 토크나이저는 SQLite 3.34+, FTS5를 넣고 빌드한 경우에만 있다 — 없으면 search_text LIKE 경로를 쓴다.
+
+FTS_TABLE = "briefing_fts"
+
+
+@functools.cache
+def fts_supported() -> bool:
+    """이 프로세스의 SQLite가 FTS5 trigram을 지원하는지 (한 번만 확인, aiosqlite도 같은 라이브러리를 쓴다)."""
+    probe = sqlite3.connect(":memory:")
+    try:
+        probe.execute("CREATE VIRTUAL TABLE probe USING fts5(body, tokenize='trigram')")
+        return True
+    except sqlite3.OperationalError as e:
+        logger.warning("SQLite %s에서 FTS5 trigram을 쓸 수 없음 — 검색은 LIKE로: %s", sqlite3.sqlite_version, e)
+        return False
+    finally:
+        probe.close()
+
+
+def uses_fts(bind) -> bool:
+    """이 DB(엔진/연결)가 FTS5 색인을 쓰는지."""
+    return bind.dialect.name == "sqlite" and fts_supported()
+
+
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+        "USING fts5(date UNINDEXED, title, body, tokenize='trigram')"
+    ).execute_if(callable_=lambda ddl, target, bind, **kw: uses_fts(bind)),
+)
+event.listen(
+    Base.metadata,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {FTS_TABLE}").execute_if(dialect="sqlite"),
+)
@@ -0,0 +1,119 @@
+"""구독자별 관심 종목 섹션 — 공통 조각 + 종목 조각을 바이트로 이어붙여 메일을 만든다.
+
+비용이 구독자 수가 아니라 '고유 종목 수'에 비례하도록:
+- 공통 브리핑은 한 번만 렌더링/인코딩 → 관심 종목 자리를 기준으로 앞(head)/뒤(tail) 조각으로 자른다
+- 종목 섹션은 전체 구독자의 고유 종목당 한 번만 뉴스 수집 + AI 생성 + 스타일링 + 인코딩
+- 구독자 메일 = head + 섹션 헤더 + 종목 조각들 + tail (바이트 이어붙이기만)
+- 관심 종목 조합이 같은 구독자끼리는 MIME 본문까지 공유한다
+"""
+
+import asyncio
+import logging
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Callable
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.collector.market import MarketSummary
+from app.collector.news import NewsArticle, fetch_news_for_stocks
+from app.email_sender import send_briefing_to_subscribers
+from app.email_template import _style_content_html, render_email
+from app.models import Subscriber, SubscriberTicker
+from app.summarizer import generate_ticker_sections
+
+logger = logging.getLogger(__name__)
+
+# 공통 렌더링 결과에서 관심 종목 섹션이 들어갈 자리
+_SLOT = "<!--watchlist-slot-->"
+_WATCHLIST_HEADING = "<h2>⭐ 내 관심 종목</h2>"
+
+
+@dataclass(frozen=True)
+class EmailFragments:
+    """인코딩이 끝난 메일 조각들."""
+
+    head: bytes
+    tail: bytes
+    heading: bytes
+    tickers: dict[str, bytes] = field(default_factory=dict)
+
+    def assemble(self, tickers: list[str]) -> bytes:
+        """구독자 메일을 조립한다. 생성된 조각이 하나도 없으면 공통 메일과 같다."""
+        parts = [self.tickers[t] for t in tickers if t in self.tickers]
+        if not parts:
+            return self.head + self.tail
+        return b"".join([self.head, self.heading, *parts, self.tail])
+
+
+def render_fragments(title: str, content_html: str, ticker_html: dict[str, str]) -> EmailFragments:
+    """공통 브리핑을 한 번 렌더링해서 자르고, 종목 조각은 한 번씩 스타일링/인코딩한다."""
+    rendered = render_email(title, content_html, watchlist_html=_SLOT)
+    head, tail = rendered.split(_SLOT, 1)
+    return EmailFragments(
+        head=head.encode("utf-8"),
+        tail=tail.encode("utf-8"),
+        heading=_style_content_html(_WATCHLIST_HEADING).encode("utf-8"),
+        tickers={t: _style_content_html(html).encode("utf-8") for t, html in ticker_html.items()},
+    )
+
+
+async def load_watchlists(db: AsyncSession) -> dict[str, list[str]]:
+    """활성 구독자 중 관심 종목이 있는 구독자의 {이메일: [종목]} (등록 순서 유지)."""
+    rows = await db.execute(
+        select(Subscriber.email, SubscriberTicker.ticker)
+        .join(SubscriberTicker, SubscriberTicker.subscriber_id == Subscriber.id)
+        .where(Subscriber.is_active == True)
+        .order_by(SubscriberTicker.id)
+    )
+    watchlists: dict[str, list[str]] = defaultdict(list)
+    for email, ticker in rows.all():
+        watchlists[email].append(ticker)
+    return dict(watchlists)
+
+
+async def set_watchlist(db: AsyncSession, email: str, tickers: list[str]) -> None:
+    """구독자의 관심 종목을 교체한다. 커밋은 호출자가 한다."""
+    subscriber_id = (await db.execute(select(Subscriber.id).where(Subscriber.email == email))).scalar_one()
+    await db.execute(delete(SubscriberTicker).where(SubscriberTicker.subscriber_id == subscriber_id))
+    unique = list(dict.fromkeys(t.strip() for t in tickers if t.strip()))
+    db.add_all(SubscriberTicker(subscriber_id=subscriber_id, ticker=t) for t in unique)
+
+
+async def send_personalized(
+    title: str,
+    content_html: str,
+    emails: list[str],
+    watchlists: dict[str, list[str]],
+    market: MarketSummary,
+    stock_news: dict[str, list[NewsArticle]],
+    on_delivered: Callable[[list[str]], None] | None = None,
+) -> dict:
+    """관심 종목 섹션을 붙여서 발송한다. 관심 종목이 없는 구독자는 공통 메일을 받는다."""
+    unique = list(dict.fromkeys(t for tickers in watchlists.values() for t in tickers))
+
+    # 이미 수집된 종목 뉴스(등락 큰 대장주)는 재사용하고, 나머지만 종목당 한 번 검색
+    # 구독자가 많은 종목부터 — 검색 한도가 모자라면 구독자가 적은 종목의 뉴스가 빠진다
+    followers = Counter(t for tickers in watchlists.values() for t in tickers)
+    missing = sorted((t for t in unique if t not in stock_news), key=followers.__getitem__, reverse=True)
+    news = {**stock_news, **(await fetch_news_for_stocks(missing))}
+    ticker_html = await asyncio.to_thread(generate_ticker_sections, unique, market, news)
+    fragments = render_fragments(title, content_html, ticker_html)
+    logger.info("관심 종목 섹션 생성: 고유 종목 %d개 (성공 %d), 구독자 %d명", len(unique), len(ticker_html), len(watchlists))
+
+    # 같은 종목 조합끼리 묶어서 본문을 공유
+    groups: dict[tuple[str, ...], list[str]] = defaultdict(list)
+    for email in emails:
+        key = tuple(t for t in watchlists.get(email, []) if t in fragments.tickers)
+        groups[key].append(email)
+
+    results = await asyncio.gather(*[
+        send_briefing_to_subscribers(group, title, fragments.assemble(list(key)).decode("utf-8"), on_delivered)
+        for key, group in groups.items()
+    ])
+    return {
+        "success": sum(r["success"] for r in results),
+        "fail": sum(r["fail"] for r in results),
+        "failed": [email for r in results for email in r.get("failed", [])],
+    }
@@ -3,29 +3,55 @@
 스프링의 서비스 레이어 분리와 동일:
 - collect_data()  → CollectorService
 - summarize()     → SummarizerService
-- save_briefing() → BriefingRepository
-- send_emails()   → EmailService
+- save_briefing() → BriefingRepository (최종 이메일 렌더링 결과도 함께 저장)
+- send_emails()   → EmailService (저장된 이메일을 그대로 발송)
+- publish_site()  → 정적 페이지 내보내기 (app/publisher.py)
 - run_pipeline()  → Orchestrator (각 서비스를 순서대로 호출)
+
+07:00 본 실행 전 워밍업 (scheduler.py):
+- warm_after_close() → 전날 장 마감 후: 시장 데이터 확정본 저장 + 공시 맵 요약 캐시 채우기
+- prefetch()         → 06:00: 수집을 미리 해서 체크포인트에 저장
+- prepare_draft()    → 06:20: 미리 수집한 데이터로 초안 생성
+본 실행은 뉴스만 다시 가져오고, 새 뉴스가 거의 없으면 초안을 그대로 쓴다.
+
+단계 산출물은 실행일별 체크포인트(app/checkpoint.py)로 남긴다.
+run_pipeline(resume=True)는 완료된 단계를 건너뛰고 — 예: 발송 중 SMTP 장애 후 재실행 시
+수집/AI 요약 없이 체크포인트에서 읽어 아직 못 받은 구독자에게만 발송한다.
 """
 
 import asyncio
 import logging
-from dataclasses import dataclass, field
-from datetime import date
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from typing import Callable
 
 from sqlalchemy import select
+from sqlalchemy.orm import undefer
 
+from app.cache import invalidate_archive
+from app.checkpoint import STAGES, RunCheckpoint, prune_checkpoints
+from app.collector.article import enrich_articles
 from app.collector.dart import Disclosure, fetch_disclosures
 from app.collector.market import MarketSummary, fetch_market_summary
 from app.collector.news import NewsArticle, fetch_news_for_stocks, fetch_stock_news
+from app.config import settings
 from app.database import async_session
 from app.email_sender import send_briefing_to_subscribers
-from app.email_template import render_email
+from app.email_store import build_artifact, load_artifact, save_artifact
+from app.leader import RunClaim
 from app.models import Briefing, Subscriber
-from app.summarizer import generate_briefing
+from app.personalize import load_watchlists, send_personalized
+from app.publisher import publish_site, unpublish
+from app.search import index_briefing
+from app.text import make_excerpt
+from app.summarizer import generate_briefing, summarize_disclosures
+from app.telemetry import mark_failed, traced, traced_run
 
 logger = logging.getLogger(__name__)
 
+# 단계별로 필요한 설정 그룹 — 실행을 시작하기 전에 한 번에 확인한다 (수집 후 요약 단계에서 키 누락으로 멈추지 않게)
+_STAGE_GROUPS = {"collect": ("dart", "naver"), "summarize": ("ai",), "send": ("smtp",)}
+
 
 # ── 단계 간 전달 데이터 (스프링의 서비스 간 DTO) ──
 
@@ -39,6 +65,24 @@ class CollectedData:
     news: list[NewsArticle]
     stock_news: dict[str, list[NewsArticle]] = field(default_factory=dict)
 
+    def to_dict(self) -> dict:
+        """체크포인트용 JSON 직렬화."""
+        return {
+            "market": self.market.model_dump(),
+            "disclosures": [asdict(d) for d in self.disclosures],
+            "news": [asdict(n) for n in self.news],
+            "stock_news": {name: [asdict(n) for n in items] for name, items in self.stock_news.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CollectedData":
+        return cls(
+            market=MarketSummary.model_validate(data["market"]),
+            disclosures=[Disclosure(**d) for d in data["disclosures"]],
+            news=[NewsArticle(**n) for n in data["news"]],
+            stock_news={name: [NewsArticle(**n) for n in items] for name, items in data["stock_news"].items()},
+        )
+
 
 @dataclass
 class BriefingResult:
@@ -51,11 +95,31 @@ class BriefingResult:
 # ── 파이프라인 단계 (각각 독립 함수) ──
 
 
-async def collect_data() -> CollectedData:
-    """1단계: 시장/공시/뉴스 데이터를 병렬 수집한다."""
+def _disclosure_limit() -> int:
+    # 맵리듀스 모드면 공시를 자르지 않고 가져온다 (요약 단계에서 배치 요약)
+    return settings.disclosure_max_items if settings.disclosure_map_reduce else 20
+
+
+async def _given(value):
+    return value
+
+
+@traced("collect")
+async def collect_data(
+    market: MarketSummary | None = None,
+    disclosures: list[Disclosure] | None = None,
+    run_date: date | None = None,
+) -> CollectedData:
+    """1단계: 시장/공시/뉴스 데이터를 병렬 수집한다.
+
+    market/disclosures를 주면(워밍업에서 미리 받아둔 확정 데이터) 다시 가져오지 않고 뉴스만 새로 받는다.
+    공시는 실행일(run_date, 기본 오늘)의 전일 공시를 가져온다.
+    """
+    disclosure_date = (run_date or date.today()) - timedelta(days=1)
     market, disclosures, news = await asyncio.gather(
-        fetch_market_summary(),
-        fetch_disclosures(),
+        _given(market) if market is not None else fetch_market_summary(),
+        _given(disclosures) if disclosures is not None
+        else fetch_disclosures(target_date=disclosure_date, limit=_disclosure_limit()),
         fetch_stock_news(),
     )
     logger.info("수집 완료: 공시 %d건, 뉴스 %d건", len(disclosures), len(news))
@@ -65,8 +129,11 @@ async def collect_data() -> CollectedData:
         s.name for s in market.kospi_top10
         if abs(float(s.change_pct.replace(",", "") or "0")) >= 2.0
     ]
-    stock_news = await fetch_news_for_stocks(mover_names)
+    # 캐시를 거치지 않는다 — 06:00 prefetch 이후의 기사를 07:00 실행이 놓치지 않게
+    stock_news = await fetch_news_for_stocks(mover_names, refresh=True)
     logger.info("종목별 뉴스 수집: %d종목", len(stock_news))
+    if settings.article_enrichment and stock_news:
+        stock_news = await enrich_articles(stock_news)
 
     return CollectedData(
         market=market,
@@ -76,53 +143,283 @@ async def collect_data() -> CollectedData:
     )
 
 
-def summarize(data: CollectedData) -> BriefingResult:
+@traced("summarize")
+def summarize(data: CollectedData, run_date: date | None = None) -> BriefingResult:
     """2단계: 수집 데이터를 AI로 요약한다."""
     html = generate_briefing(data.market, data.disclosures, data.news, data.stock_news)
-    title = f"{date.today().strftime('%Y년 %m월 %d일')} 주식 아침 브리핑"
+    title = f"{(run_date or date.today()).strftime('%Y년 %m월 %d일')} 주식 아침 브리핑"
     logger.info("요약 완료: %s", title)
     return BriefingResult(title=title, html=html)
 
 
-async def save_briefing(result: BriefingResult) -> None:
-    """3단계: 브리핑을 DB에 저장한다 (같은 날 재실행 시 업데이트)."""
-    today = date.today().isoformat()
+@traced("save")
+async def save_briefing(result: BriefingResult, run_date: date | None = None) -> None:
+    """3단계: 브리핑과 최종 렌더링된 이메일을 DB에 저장한다 (같은 날 재실행 시 업데이트)."""
+    today = (run_date or date.today()).isoformat()
+    artifact = build_artifact(today, result.title, result.html)
+    excerpt = make_excerpt(result.html)
     async with async_session() as db:
         existing = await db.execute(select(Briefing).where(Briefing.date == today))
         briefing = existing.scalar_one_or_none()
         if briefing:
             briefing.title = result.title
             briefing.content_html = result.html
+            briefing.excerpt = excerpt
         else:
-            db.add(Briefing(date=today, title=result.title, content_html=result.html))
+            db.add(Briefing(date=today, title=result.title, content_html=result.html, excerpt=excerpt))
+        await save_artifact(db, artifact)
+        await index_briefing(db, today, result.title, result.html)
         await db.commit()
-
-
-async def send_emails(result: BriefingResult) -> None:
-    """4단계: 구독자에게 이메일을 발송한다."""
+    invalidate_archive(today)
+    unpublish(today)
+
+
+@traced("send")
+async def send_emails(
+    result: BriefingResult,
+    data: CollectedData | None = None,
+    skip: set[str] | frozenset[str] = frozenset(),
+    run_date: date | None = None,
+    on_delivered: Callable[[list[str]], None] | None = None,
+) -> dict:
+    """4단계: 구독자에게 저장된 이메일을 발송한다.
+
+    관심 종목을 등록한 구독자가 있고 수집 데이터가 있으면 관심 종목 섹션을 붙여서 보낸다.
+    skip에 있는 주소(이미 받은 구독자)는 건너뛴다. on_delivered는 성공한 주소를 배치마다 받는다.
+    반환값: {"success", "fail", "failed": 실패 주소, "delivered": 성공 주소}
+    """
+    today = (run_date or date.today()).isoformat()
     async with async_session() as db:
         rows = await db.execute(select(Subscriber.email).where(Subscriber.is_active == True))
-        emails = [row[0] for row in rows.all()]
+        emails = [row[0] for row in rows.all() if row[0] not in skip]
+        artifact = await load_artifact(db, today)
+        watchlists = await load_watchlists(db) if data is not None else {}
 
     if not emails:
-        logger.info("구독자 없음 — 발송 건너뜀")
-        return
-
-    email_html = render_email(result.title, result.html)
-    results = await send_briefing_to_subscribers(emails, result.title, email_html)
+        logger.info("발송 대상 없음 — 발송 건너뜀")
+        return {"success": 0, "fail": 0, "failed": [], "delivered": []}
+
+    if watchlists:
+        results = await send_personalized(
+            result.title, result.html, emails, watchlists, data.market, data.stock_news, on_delivered,
+        )
+    else:
+        if artifact is None:
+            artifact = build_artifact(today, result.title, result.html)
+        results = await send_briefing_to_subscribers(emails, result.title, artifact.text, on_delivered)
     logger.info("발송 완료: 성공 %d, 실패 %d", results["success"], results["fail"])
 
+    failed = set(results.get("failed", []))
+    return {**results, "delivered": [e for e in emails if e not in failed]}
 
-# ── 오케스트레이터 ──
 
+async def resend_briefing(briefing_date: str, emails: list[str] | None = None) -> dict:
+    """저장된 이메일을 다시 발송한다 (렌더링 없음). emails가 없으면 활성 구독자 전체."""
+    async with async_session() as db:
+        briefing = (await db.execute(
+            select(Briefing).options(undefer(Briefing.content_html)).where(Briefing.date == briefing_date)
+        )).scalar_one_or_none()
+        artifact = await load_artifact(db, briefing_date)
+        if emails is None:
+            rows = await db.execute(select(Subscriber.email).where(Subscriber.is_active == True))
+            emails = [row[0] for row in rows.all()]
+
+    if briefing is None:
+        raise ValueError(f"브리핑 없음: {briefing_date}")
+    if artifact is None:
+        # 이 기능 이전에 저장된 브리핑 — 한 번 렌더링해서 저장해 두고 쓴다
+        artifact = build_artifact(briefing_date, briefing.title, briefing.content_html)
+        async with async_session() as db:
+            await save_artifact(db, artifact)
+            await db.commit()
+
+    results = await send_briefing_to_subscribers(emails, briefing.title, artifact.text)
+    logger.info("재발송 완료 (%s): 성공 %d, 실패 %d", briefing_date, results["success"], results["fail"])
+    return results
+
+
+# ── 워밍업 (07:00 본 실행 전) ──
+
+
+def _next_run_date(today: date) -> date:
+    """다음 본 실행일 (월~토, 일요일은 건너뜀)."""
+    nxt = today + timedelta(days=1)
+    return nxt + timedelta(days=1) if nxt.weekday() == 6 else nxt
+
+
+def _news_keys(data: CollectedData) -> set[str]:
+    articles = [*data.news, *(n for items in data.stock_news.values() for n in items)]
+    return {a.link or a.title for a in articles}
+
+
+@traced_run("after_close")
+async def warm_after_close() -> None:
+    """장 마감 후: 다음 실행일 체크포인트에 시장 데이터 확정본을 저장하고 공시 맵 요약 캐시를 채운다."""
+    checkpoint = RunCheckpoint(_next_run_date(date.today()).isoformat())
+    market = await fetch_market_summary()
+    checkpoint.save("market_close", market.model_dump())
+
+    disclosures: list[Disclosure] = []
+    if settings.disclosure_map_reduce:
+        # 오늘 공시 = 다음 실행의 "전일 공시". 배치는 접수번호 순이라 밤사이 추가된 공시는 뒤쪽 배치만 바뀐다
+        disclosures = await fetch_disclosures(target_date=date.today(), limit=settings.disclosure_max_items)
+        await asyncio.to_thread(summarize_disclosures, disclosures)
+    checkpoint.mark("after_close", disclosures=len(disclosures))
+    logger.info("장 마감 워밍업 완료 (%s): 공시 %d건 맵 요약", checkpoint.run_date, len(disclosures))
+
+
+@traced_run("prefetch")
+async def prefetch(run_date: date | None = None) -> CollectedData:
+    """06:00: 수집을 미리 해서 체크포인트에 저장한다 (장 마감 워밍업의 시장 데이터가 있으면 재사용)."""
+    run_date = run_date or date.today()
+    checkpoint = RunCheckpoint(run_date.isoformat())
+    saved_market = checkpoint.load("market_close")
+    market = MarketSummary.model_validate(saved_market) if saved_market is not None else None
+    data = await collect_data(market=market, run_date=run_date)
+    checkpoint.save("prefetched", data.to_dict())
+    checkpoint.mark("prefetch")
+    return data
+
+
+@traced_run("draft")
+async def prepare_draft(run_date: date | None = None) -> BriefingResult:
+    """06:20: 미리 수집한 데이터로 초안을 만든다 — AI 생성이 07:00 크리티컬 패스에서 빠진다."""
+    run_date = run_date or date.today()
+    checkpoint = RunCheckpoint(run_date.isoformat())
+    saved = checkpoint.load("prefetched")
+    data = CollectedData.from_dict(saved) if saved is not None else await prefetch(run_date)
+    result = await asyncio.to_thread(summarize, data, run_date)
+    checkpoint.save("draft", {"briefing": asdict(result), "news": sorted(_news_keys(data))})
+    checkpoint.mark("draft")
+    return result
+
+
+def _usable_draft(checkpoint: RunCheckpoint, data: CollectedData) -> BriefingResult | None:
+    """초안 이후 새 뉴스가 draft_max_new_items 이하면 초안을 돌려준다."""
+    draft = checkpoint.load("draft")
+    if draft is None:
+        return None
+    new_items = len(_news_keys(data) - set(draft["news"]))
+    if new_items > settings.draft_max_new_items:
+        logger.info("초안 폐기: 새 뉴스 %d건 (허용 %d건)", new_items, settings.draft_max_new_items)
+        return None
+    logger.info("초안 사용: 새 뉴스 %d건", new_items)
+    return BriefingResult(**draft["briefing"])
 
-async def run_pipeline() -> str:
-    """전체 파이프라인: 수집 → 요약 → 저장 → 발송."""
-    logger.info("브리핑 파이프라인 시작: %s", date.today())
 
-    data = await collect_data()
-    result = summarize(data)
-    await save_briefing(result)
-    await send_emails(result)
+# ── 오케스트레이터 ──
+
+
+async def run_pipeline(
+    resume: bool = False, run_date: date | None = None, steps: list[str] | None = None, claim_wait: float = 0,
+) -> str:
+    """전체 파이프라인: 수집 → 요약 → 저장 → 발송 → 정적 페이지 내보내기.
+
+    - resume=True: 실행일 체크포인트에서 완료된 단계를 건너뛴다. False면 본 실행 단계를 지우고 처음부터.
+    - run_date: 실행일 (기본 오늘) — 체크포인트, 브리핑 날짜, 전일 공시 기준일이 모두 이 날짜를 따른다.
+      수집(collect)은 오늘만 가능하다. 다른 날짜는 그날 체크포인트에 있는 수집 결과로 뒤 단계만 돌린다.
+    - steps: 지정한 단계만 실행한다 (체크포인트의 STAGES 중). 앞 단계 산출물은 체크포인트에서 읽는다.
+
+    같은 실행일이 다른 곳(이 프로세스의 07:00 잡, 다른 워커의 따라잡기 등)에서 돌고 있으면 건너뛴다 —
+    실행일 점유(RunClaim)는 DB에 있어서 프로세스가 달라도 하나만 잡는다. claim_wait초까지는 풀리기를 기다린다.
+    """
+    run_date = run_date or date.today()
+    day = run_date.isoformat()
+    async with RunClaim(day).hold(wait=claim_wait) as claimed:
+        if not claimed:
+            logger.warning("브리핑 파이프라인이 이미 실행 중입니다 (%s) — 이번 호출은 건너뜀", day)
+            return ""
+        return await _run_pipeline(resume, run_date, steps)
+
+
+@traced_run("daily")
+async def _run_pipeline(resume: bool, run_date: date, steps: list[str] | None) -> str:
+    day = run_date.isoformat()
+    unknown = set(steps or ()) - set(STAGES)
+    if unknown:
+        raise ValueError(f"알 수 없는 단계: {', '.join(sorted(unknown))} (가능: {', '.join(STAGES)})")
+    selected = set(steps) if steps else set(STAGES)
+    settings.require(*(group for stage in STAGES if stage in selected for group in _STAGE_GROUPS.get(stage, ())))
+    logger.info("브리핑 파이프라인 시작: %s%s%s", day, " (재개)" if resume else "",
+                f" 단계={','.join(s for s in STAGES if s in selected)}" if steps else "")
+
+    checkpoint = RunCheckpoint(day)
+
+    def should_run(stage: str) -> bool:
+        # 단계를 직접 지정했으면 완료 여부와 상관없이 실행, 재개 모드면 완료된 단계는 건너뜀
+        return stage in selected and (bool(steps) or not (resume and checkpoint.done(stage)))
+
+    # 시세/뉴스 수집기는 지금 시점 데이터만 준다 — 다른 날짜로 수집하면 오늘 데이터가 그 날짜 이름으로 저장된다
+    if should_run("collect") and run_date != date.today():
+        raise ValueError(
+            f"collect 단계는 오늘만 실행할 수 있습니다 ({day}) — 과거 날짜는 python -m app.worker backfill 로 만드세요"
+        )
+    if not resume and not steps:
+        checkpoint.reset()
+        prune_checkpoints()
+
+    data = None
+    if not should_run("collect"):
+        saved = checkpoint.load("collected")
+        data = CollectedData.from_dict(saved) if saved is not None else None
+    if data is None and "collect" in selected:
+        # 미리 받아둔 시장/공시(확정 데이터)가 있으면 뉴스만 새로 받는다
+        prefetched = checkpoint.load("prefetched")
+        if prefetched is not None:
+            base = CollectedData.from_dict(prefetched)
+            data = await collect_data(market=base.market, disclosures=base.disclosures, run_date=run_date)
+        else:
+            data = await collect_data(run_date=run_date)
+        checkpoint.save("collected", data.to_dict())
+        checkpoint.mark("collect")
+    elif data is not None and "collect" in selected:
+        logger.info("체크포인트 사용: 수집 건너뜀")
+
+    result = None
+    if not should_run("summarize"):
+        saved = checkpoint.load("briefing")
+        result = BriefingResult(**saved) if saved is not None else None
+    if result is None and "summarize" in selected:
+        if data is None:
+            raise RuntimeError(f"수집 체크포인트가 없습니다 ({day}) — collect 단계를 먼저 실행하세요")
+        # AI 호출은 스레드에서 — 이벤트 루프(리더 하트비트, 웹 요청)를 막지 않게
+        result = _usable_draft(checkpoint, data) or await asyncio.to_thread(summarize, data, run_date)
+        checkpoint.save("briefing", asdict(result))
+        checkpoint.mark("summarize")
+    elif result is not None and "summarize" in selected:
+        logger.info("체크포인트 사용: 요약 건너뜀 (AI 호출 없음)")
+
+    if result is None:
+        if selected & {"save", "send", "publish"}:
+            raise RuntimeError(f"요약 체크포인트가 없습니다 ({day}) — summarize 단계를 먼저 실행하세요")
+        return ""
+
+    if should_run("save"):
+        await save_briefing(result, run_date)
+        checkpoint.mark("save")
+
+    if should_run("send"):
+        # 부분 실패 후 재개하면 이미 받은 구독자는 건너뛴다 (중복 발송 방지)
+        # 성공 주소는 배치마다 delivered.log에 덧붙인다 — 발송 도중에 프로세스가 죽거나 취소돼도 남는다
+        delivered = set(checkpoint.load("delivered") or []) | checkpoint.load_appended("delivered")
+        sent = await send_emails(
+            result, data, skip=frozenset(delivered), run_date=run_date,
+            on_delivered=lambda emails: checkpoint.append("delivered", emails),
+        )
+        delivered.update(sent["delivered"])
+        checkpoint.save("delivered", sorted(delivered))
+        if sent["fail"]:
+            mark_failed(f"발송 실패 {sent['fail']}건")
+            logger.warning("발송 실패 %d건 — run_pipeline(resume=True)로 재시도할 수 있습니다", sent["fail"])
+        else:
+            checkpoint.mark("send", delivered=len(delivered))
+
+    if should_run("publish"):
+        try:
+            await publish_site([day])
+            checkpoint.mark("publish")
+        except Exception:
+            # 내보내기 실패 시에도 동적 라우트가 그대로 응답하므로 파이프라인은 성공으로 둔다
+            logger.exception("정적 페이지 내보내기 실패")
 
     return result.html
@@ -0,0 +1,151 @@
+"""정적 사이트 내보내기 — 바뀌지 않는 페이지를 미리 렌더링해 파일로 서빙.
+
+스프링 대응:
+- publish_site()           = 정적 사이트 생성 배치 (빌드 시점에 HTML 생성)
+- PublishedSiteMiddleware  = ResourceHttpRequestHandler + EncodedResourceResolver
+                             (미리 압축된 .gz가 있으면 그대로, 없으면 컨트롤러로 위임)
+
+내보내는 페이지:
+- /                    → index.html
+- /archive             → archive/index.html (1페이지)
+- /archive/YYYY-MM-DD  → archive/YYYY-MM-DD/index.html
+검색(?q=), 2페이지 이후(?page=), 구독(POST)은 쿼리/메서드로 구분되어 동적 렌더링으로 간다.
+브리핑이 저장되면 unpublish()가 그 날짜와 목록 파일을 지운다 (@CacheEvict) — 다시 내보낼 때까지는 동적 렌더링.
+프론트 프록시(nginx 등)가 같은 디렉토리를 직접 서빙해도 된다 (gzip_static on).
+"""
+
+import asyncio
+import gzip
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+
+from fastapi.staticfiles import StaticFiles
+from sqlalchemy import select
+
+from app.config import settings
+from app.database import read_session
+from app.models import Briefing
+from app.routes.archive import accepts_gzip, browse_context, render_detail, templates
+from app.telemetry import traced
+
+logger = logging.getLogger(__name__)
+
+_DETAIL_PATH_RE = re.compile(r"^/archive/(\d{4}-\d{2}-\d{2})/?$")
+
+
+def page_file(path: str) -> str | None:
+    """요청 경로 → 내보낸 파일의 상대 경로 (내보내기 대상이 아니면 None)."""
+    if path == "/":
+        return "index.html"
+    if path in ("/archive", "/archive/"):
+        return "archive/index.html"
+    m = _DETAIL_PATH_RE.match(path)
+    return f"archive/{m.group(1)}/index.html" if m else None
+
+
+@traced("publish")
+async def publish_site(dates: list[str] | None = None, root: str | Path | None = None) -> int:
+    """랜딩, 아카이브 1페이지, 상세 페이지를 정적 파일로 내보낸다.
+
+    dates가 None이면 모든 브리핑의 상세 페이지를 다시 내보낸다.
+    반환값: 내보낸 페이지 수.
+    """
+    root = Path(root or settings.static_site_dir)
+    pages: dict[str, bytes] = {
+        "index.html": templates.get_template("landing.html").render().encode("utf-8"),
+    }
+    compressed: dict[str, bytes] = {}
+    async with read_session() as db:
+        context = await browse_context(db)
+        pages["archive/index.html"] = templates.get_template("archive.html").render(**context).encode("utf-8")
+
+        if dates is None:
+            dates = list((await db.execute(select(Briefing.date))).scalars())
+        for briefing_date in dates:
+            rendered = await render_detail(db, briefing_date)
+            if rendered is not None:
+                rel = f"archive/{briefing_date}/index.html"
+                pages[rel] = rendered.body
+                compressed[rel] = rendered.body_gzip
+
+    for rel, body in pages.items():
+        _write_atomic(root / rel, body)
+        gz = compressed.get(rel) or gzip.compress(body, mtime=0)
+        _write_atomic(root / f"{rel}.gz", gz)
+
+    logger.info("정적 페이지 %d개 내보내기 완료: %s", len(pages), root)
+    return len(pages)
+
+
+def unpublish(briefing_date: str, root: str | Path | None = None) -> None:
+    """브리핑이 바뀐 날짜의 상세 페이지와 목록 1페이지 파일을 지운다.
+
+    미들웨어는 파일이 없으면 라우터로 넘기므로, 내보내기가 실패하거나 건너뛰어져도 옛 페이지가 남지 않는다.
+    다른 프로세스(웹)가 서빙하는 파일이라 메모리 캐시 무효화가 아니라 파일 자체를 지운다.
+    """
+    root = root or settings.static_site_dir
+    if not root:
+        return
+    for rel in (f"archive/{briefing_date}/index.html", "archive/index.html"):
+        for name in (rel, f"{rel}.gz"):
+            Path(root, name).unlink(missing_ok=True)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    # 서빙 중인 파일을 덮어쓰므로 임시 파일에 쓰고 rename
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+class PublishedSiteMiddleware:
+    """내보낸 파일이 있으면 그대로 응답하고, 없으면 라우터로 넘기는 ASGI 미들웨어.
+
+    쿼리 스트링이 없는 GET/HEAD 요청만 대상 — ETag/Last-Modified/304는 StaticFiles가 처리한다.
+    """
+
+    def __init__(self, app, directory: str | Path):
+        self.app = app
+        self.static = StaticFiles(directory=directory, check_dir=False)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD") and not scope["query_string"]:
+            rel = page_file(scope["path"])
+            if rel is not None:
+                response = self._file_response(rel, scope)
+                if response is not None:
+                    await response(scope, receive, send)
+                    return
+        await self.app(scope, receive, send)
+
+    def _file_response(self, rel: str, scope):
+        accept_encoding = dict(scope["headers"]).get(b"accept-encoding", b"")
+        gzipped = accepts_gzip(accept_encoding.decode("latin-1"))
+        full_path, stat_result = self.static.lookup_path(f"{rel}.gz" if gzipped else rel)
+        if stat_result is None:
+            return None
+        response = self.static.file_response(full_path, stat_result, scope)
+        response.headers["content-type"] = "text/html; charset=utf-8"
+        response.headers["cache-control"] = "no-cache"  # 재생성될 수 있으니 매번 ETag로 재검증
+        response.headers["vary"] = "Accept-Encoding"
+        if gzipped:
+            response.headers["content-encoding"] = "gzip"
+        return response
+
+
+if __name__ == "__main__":
+    # 전체 재내보내기: python -m app.publisher
+    from app.database import init_db
+    from app.logging_config import setup_logging
+
+    async def _main() -> None:
+        await init_db()
+        await publish_site()
+
+    setup_logging()
+    asyncio.run(_main())
@@ -0,0 +1,35 @@
+"""외부 API 호출 속도 제한 — 여러 코루틴이 하나의 한도를 나눠 쓴다.
+
+스프링 대응:
+- RateLimiter = Resilience4j RateLimiter (limitForPeriod / limitRefreshPeriod)
+"""
+
+import asyncio
+import time
+
+
+class RateLimiter:
+    """초당 rate회로 호출 간격을 벌린다 (rate <= 0이면 제한 없음).
+
+    호출 순서대로 다음 슬롯을 예약하므로 동시에 기다리는 코루틴이 많아도 간격이 지켜진다.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self._next = 0.0
+
+    async def acquire(self) -> None:
+        if not self.interval:
+            return
+        now = time.monotonic()
+        slot = max(self._next, now)
+        self._next = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
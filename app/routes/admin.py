@@ -0,0 +1,127 @@
+"""관리자 API — X-Admin-Token 헤더로 보호.
+
+스프링 대응:
+- require_admin = HandlerInterceptor (토큰이 맞지 않으면 403)
+- 구독자 가져오기 = @PostMapping + 배치 서비스 호출
+- 실행 기록 조회   = /actuator 스타일 JSON (pipeline_runs / pipeline_spans)
+"""
+
+import secrets
+from dataclasses import asdict
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import get_db, get_read_db
+from app.models import PipelineRun, PipelineSpan
+from app.subscribers import import_subscribers, parse_rows
+
+router = APIRouter(prefix="/admin")
+
+
+def require_admin(x_admin_token: str = Header(default="")) -> None:
+    if not settings.admin_token or not secrets.compare_digest(x_admin_token, settings.admin_token):
+        raise HTTPException(status_code=403, detail="관리자 토큰이 필요합니다")
+
+
+@router.post("/subscribers/import", dependencies=[Depends(require_admin)])
+async def import_subscribers_endpoint(
+    request: Request,
+    fmt: Literal["csv", "json"] | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_db),
+):
+    """CSV/JSON 본문으로 구독자를 대량 등록한다 (형식 생략 시 Content-Type으로 판단)."""
+    fmt = fmt or ("json" if "json" in request.headers.get("content-type", "") else "csv")
+    try:
+        rows = parse_rows((await request.body()).decode("utf-8-sig"), fmt)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=f"가져오기 파일을 읽을 수 없습니다: {exc}")
+
+    report = await import_subscribers(db, rows)
+    await db.commit()
+    return asdict(report)
+
+
+def _run_dict(run: PipelineRun) -> dict:
+    return {
+        "id": run.id,
+        "kind": run.kind,
+        "run_date": run.run_date,
+        "started_at": run.started_at.isoformat(timespec="seconds"),
+        "duration_ms": round(run.duration_ms, 1),
+        "status": run.status,
+        "error": run.error,
+    }
+
+
+def _tokens(spans: list[PipelineSpan]) -> dict[str, int]:
+    ai = [s.attrs for s in spans if s.kind == "ai"]
+    return {
+        "input": sum(a.get("input_tokens", 0) for a in ai),
+        "output": sum(a.get("output_tokens", 0) for a in ai),
+    }
+
+
+@router.get("/runs", dependencies=[Depends(require_admin)])
+async def list_runs(
+    kind: str | None = None,
+    limit: int = Query(default=20, ge=1, le=200),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """최근 실행 목록 — 단계별 소요 시간(ms)과 AI 토큰 합계를 함께 준다."""
+    query = select(PipelineRun).order_by(PipelineRun.id.desc()).limit(limit)
+    if kind:
+        query = query.where(PipelineRun.kind == kind)
+    runs = list((await db.execute(query)).scalars())
+
+    spans: dict[int, list[PipelineSpan]] = {run.id: [] for run in runs}
+    rows = await db.execute(
+        select(PipelineSpan).where(
+            PipelineSpan.run_id.in_(spans), PipelineSpan.kind.in_(["stage", "ai"]),
+        ).order_by(PipelineSpan.seq)
+    )
+    for span in rows.scalars():
+        spans[span.run_id].append(span)
+
+    return [
+        {
+            **_run_dict(run),
+            "stages": {
+                s.name: round(s.duration_ms, 1)
+                for s in spans[run.id] if s.kind == "stage" and s.parent_seq is None
+            },
+            "tokens": _tokens(spans[run.id]),
+        }
+        for run in runs
+    ]
+
+
+@router.get("/runs/{run_id}", dependencies=[Depends(require_admin)])
+async def get_run(run_id: int, db: AsyncSession = Depends(get_read_db)):
+    """실행 하나의 전체 span (시작 순서)."""
+    run = await db.get(PipelineRun, run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="실행 기록이 없습니다")
+    spans = list((await db.execute(
+        select(PipelineSpan).where(PipelineSpan.run_id == run_id).order_by(PipelineSpan.seq)
+    )).scalars())
+    return {
+        **_run_dict(run),
+        "tokens": _tokens(spans),
+        "spans": [
+            {
+                "seq": s.seq,
+                "parent": s.parent_seq,
+                "kind": s.kind,
+                "name": s.name,
+                "offset_ms": round(s.offset_ms, 1),
+                "duration_ms": round(s.duration_ms, 1),
+                "status": s.status,
+                "attrs": s.attrs,
+            }
+            for s in spans
+        ],
+    }
@@ -2,23 +2,47 @@
 
 스프링 대응:
 - Query(ge=1) = @RequestParam @Min(1) (파라미터 검증)
-- offset/limit = Pageable + Page<T> (페이지네이션)
-- func.count() = JPA의 countQuery (전체 건수 조회)
+- before 커서 = Slice<T> + keyset(seek) 페이지네이션 — 몇 페이지를 넘기든 인덱스 탐색 한 번
+- func.count() = JPA의 countQuery (전체 건수 조회, 프로세스 캐시로 재사용 — 키에 세대 max(updated_at))
+- 검색(q)은 FTS5 색인으로 (app/search.py)
+- 상세 페이지 = ShallowEtagHeaderFilter + @Cacheable (ETag/Last-Modified → 304, 렌더링 결과 LRU — 키에 updated_at)
+
+캐시 키에 DB의 updated_at을 넣으므로, 파이프라인 워커가 다른 프로세스에서 브리핑을 저장해도
+웹 워커는 다음 요청에서 바로 새 버전을 본다 (인덱스 조회 한 번).
 """
 
+import gzip
+import hashlib
+from dataclasses import dataclass
+from datetime import date, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from urllib.parse import urlencode
+
 from fastapi import APIRouter, Depends, Query, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.templating import Jinja2Templates
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
-from app.database import get_db
+from app.cache import archive_counts, archive_pages
+from app.database import get_read_db
+from app.email_store import load_artifact
 from app.models import Briefing
+from app.search import search_briefings
 
 router = APIRouter(prefix="/archive")
 templates = Jinja2Templates(directory="templates")
 
 PAGE_SIZE = 10
+PAGE_WINDOW = 2  # 현재 페이지 앞뒤로 보여줄 페이지 링크 수
+PAST_MAX_AGE = 7 * 24 * 3600  # 지난 날짜 브리핑은 바뀌지 않는다 → 1주일 캐시
+
+
+@dataclass(frozen=True)
+class PageLink:
+    number: int
+    url: str
 
 
 @router.get("", response_class=HTMLResponse)
@@ -26,44 +50,242 @@ async def archive_list(
     request: Request,
     q: str = "",
     page: int = Query(default=1, ge=1),
-    db: AsyncSession = Depends(get_db),
+    before: str | None = Query(default=None, pattern=r"^\d{4}-\d{2}-\d{2}$"),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    base_query = select(Briefing)
+    q = q.strip()
     if q:
-        base_query = base_query.where(
-            Briefing.content_html.contains(q) | Briefing.title.contains(q)
+        # 전문 검색: 관련도순이라 키셋을 쓸 수 없고, 결과 수가 작아 offset으로 충분하다
+        key = (q, await _generation(db))
+        briefings, total = await search_briefings(
+            db, q, limit=PAGE_SIZE, offset=(page - 1) * PAGE_SIZE, total=archive_counts.get(key),
         )
+        archive_counts.set(key, total)
+        links = _offset_links(q, page, total)
+        context = _list_context(briefings, q, page, total, links)
+    else:
+        context = await browse_context(db, page, before)
+
+    return templates.TemplateResponse("archive.html", {"request": request, **context})
 
-    # 전체 건수 조회 (페이지 계산용)
-    count_result = await db.execute(select(func.count()).select_from(base_query.subquery()))
-    total = count_result.scalar()
-    total_pages = max(1, (total + PAGE_SIZE - 1) // PAGE_SIZE)
 
-    # offset/limit 페이지네이션
-    offset = (page - 1) * PAGE_SIZE
-    rows = await db.execute(
-        base_query.order_by(Briefing.date.desc()).offset(offset).limit(PAGE_SIZE)
+async def browse_context(db: AsyncSession, page: int = 1, before: str | None = None) -> dict:
+    """검색어 없는 목록 페이지의 템플릿 컨텍스트 (정적 내보내기에서도 사용)."""
+    total = await _count_all(db)
+    # 목록은 가벼운 컬럼만 — 본문(content_html)은 읽지도 않는다
+    query = (
+        select(Briefing.date, Briefing.title, Briefing.excerpt)
+        .order_by(Briefing.date.desc()).limit(PAGE_SIZE)
     )
-    briefings = rows.scalars().all()
+    if before:
+        query = query.where(Briefing.date < before)
+    elif page > 1:
+        # 커서 없이 들어온 링크(북마크 등)만 offset으로 처리
+        query = query.offset((page - 1) * PAGE_SIZE)
+    briefings = (await db.execute(query)).all()
+    links = await _keyset_links(db, page, briefings)
+    return _list_context(briefings, "", page, total, links)
 
-    return templates.TemplateResponse("archive.html", {
-        "request": request,
+
+def _list_context(briefings, q: str, page: int, total: int, links: list[PageLink]) -> dict:
+    return {
         "briefings": briefings,
         "search_query": q,
         "page": page,
-        "total_pages": total_pages,
-    })
+        "total": total,
+        "page_links": links,
+        "prev_url": next((l.url for l in links if l.number == page - 1), None),
+        "next_url": next((l.url for l in links if l.number == page + 1), None),
+        "show_pagination": len(links) > 1,
+    }
 
 
-@router.get("/{briefing_date}", response_class=HTMLResponse)
-async def archive_detail(request: Request, briefing_date: str, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Briefing).where(Briefing.date == briefing_date))
-    briefing = result.scalar_one_or_none()
+async def _generation(db: AsyncSession) -> datetime | None:
+    """아카이브 세대 — 어느 프로세스에서든 브리핑이 추가/수정되면 바뀐다 (updated_at 인덱스 끝 한 칸)."""
+    return (await db.execute(select(func.max(Briefing.updated_at)))).scalar()
+
+
+async def _count_all(db: AsyncSession) -> int:
+    """전체 브리핑 수 — 세대가 바뀔 때까지 캐시된 값을 쓴다."""
+    key = ("", await _generation(db))
+    total = archive_counts.get(key)
+    if total is None:
+        total = (await db.execute(select(func.count()).select_from(Briefing))).scalar()
+        archive_counts.set(key, total)
+    return total
+
+
+def _page_url(page: int, before: str | None = None, q: str = "") -> str:
+    params: dict[str, str | int] = {}
+    if q:
+        params["q"] = q
+    if page > 1:
+        params["page"] = page
+    if before:
+        params["before"] = before
+    return f"/archive?{urlencode(params)}" if params else "/archive"
+
+
+async def _keyset_links(db: AsyncSession, page: int, briefings) -> list[PageLink]:
+    """현재 페이지 앞뒤 PAGE_WINDOW개 페이지의 커서를 날짜 인덱스만 읽어서 계산한다."""
+    links = [PageLink(page, _page_url(page))]
+    if not briefings:
+        return links
+    first, last = briefings[0].date, briefings[-1].date
+
+    # 이전 페이지들: 현재 첫 항목보다 최신인 날짜를 가까운 순으로
+    newer = (await db.execute(
+        select(Briefing.date).where(Briefing.date > first)
+        .order_by(Briefing.date.asc()).limit(PAGE_WINDOW * PAGE_SIZE + 1)
+    )).scalars().all()
+    for k in range(PAGE_WINDOW, 0, -1):
+        number = page - k
+        if number < 1:
+            continue
+        # 페이지 n-k 는 newer[(k-1)*S : k*S], 커서는 그보다 한 칸 최신인 newer[k*S]
+        cursor = newer[k * PAGE_SIZE] if number > 1 and len(newer) > k * PAGE_SIZE else None
+        links.insert(len(links) - 1, PageLink(number, _page_url(1) if cursor is None else _page_url(number, cursor)))
+
+    # 다음 페이지들: 현재 마지막 항목보다 오래된 날짜
+    older = (await db.execute(
+        select(Briefing.date).where(Briefing.date < last)
+        .order_by(Briefing.date.desc()).limit((PAGE_WINDOW - 1) * PAGE_SIZE + 1)
+    )).scalars().all()
+    for k in range(1, PAGE_WINDOW + 1):
+        if len(older) <= (k - 1) * PAGE_SIZE:
+            break
+        cursor = last if k == 1 else older[(k - 1) * PAGE_SIZE - 1]
+        links.append(PageLink(page + k, _page_url(page + k, cursor)))
+    return links
+
+
+def _offset_links(q: str, page: int, total: int) -> list[PageLink]:
+    """검색 결과용 — 현재 페이지 앞뒤 PAGE_WINDOW개만."""
+    total_pages = max(1, (total + PAGE_SIZE - 1) // PAGE_SIZE)
+    start, end = max(1, page - PAGE_WINDOW), min(total_pages, page + PAGE_WINDOW)
+    return [PageLink(n, _page_url(n, q=q)) for n in range(start, end + 1)]
 
+
+@dataclass
+class RenderedPage:
+    """렌더링된 상세 페이지 + 미리 압축한 gzip 변형 + 검증자(ETag/Last-Modified)."""
+    body: bytes
+    body_gzip: bytes
+    etag: str
+    last_modified: datetime
+
+    @property
+    def etag_gzip(self) -> str:
+        # 인코딩이 다르면 바이트가 다르므로 강한 ETag도 달라야 한다
+        return self.etag[:-1] + '-gzip"'
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Accept-Encoding이 gzip을 허용하는지 — q=0(명시적 거부)과 "*" 와일드카드를 따진다."""
+    wildcard = None
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ("gzip", "x-gzip"):
+            return q > 0
+        if coding == "*":
+            wildcard = q > 0
+    return bool(wildcard)
+
+
+def _not_modified(request: Request, etag: str, last_modified: datetime | None = None) -> bool:
+    """조건부 요청 판정 — If-None-Match가 있으면 그것만, 없으면 If-Modified-Since."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag in {tag.strip() for tag in if_none_match.split(",")} or if_none_match.strip() == "*"
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            return last_modified <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _cache_headers(briefing_date: str, page: RenderedPage) -> dict[str, str]:
+    # 오늘 브리핑은 재생성될 수 있으니 매번 재검증, 지난 날짜는 오래 캐시
+    if briefing_date < date.today().isoformat():
+        cache_control = f"public, max-age={PAST_MAX_AGE}"
+    else:
+        cache_control = "no-cache"
+    return {
+        "ETag": page.etag,
+        "Last-Modified": format_datetime(page.last_modified, usegmt=True),
+        "Cache-Control": cache_control,
+    }
+
+
+async def render_detail(db: AsyncSession, briefing_date: str) -> RenderedPage | None:
+    """상세 페이지 렌더링 (정적 내보내기에서도 사용)."""
+    result = await db.execute(
+        select(Briefing).options(undefer(Briefing.content_html)).where(Briefing.date == briefing_date)
+    )
+    briefing = result.scalar_one_or_none()
     if not briefing:
-        return HTMLResponse("<h1>해당 날짜의 브리핑이 없습니다.</h1>", status_code=404)
+        return None
+
+    body = templates.get_template("briefing_detail.html").render(briefing=briefing).encode("utf-8")
+    modified = (briefing.updated_at or briefing.created_at).astimezone().replace(microsecond=0)
+    return RenderedPage(
+        body=body,
+        body_gzip=gzip.compress(body, mtime=0),
+        etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+        last_modified=modified,
+    )
+
+
+@router.get("/{briefing_date}", response_class=HTMLResponse)
+async def archive_detail(request: Request, briefing_date: str, db: AsyncSession = Depends(get_read_db)):
+    stamp = (await db.execute(
+        select(func.coalesce(Briefing.updated_at, Briefing.created_at)).where(Briefing.date == briefing_date)
+    )).scalar()
+    page = archive_pages.get((briefing_date, stamp)) if stamp is not None else None
+    if page is None:
+        page = await render_detail(db, briefing_date)
+        if page is None:
+            return HTMLResponse("<h1>해당 날짜의 브리핑이 없습니다.</h1>", status_code=404)
+        archive_pages.set((briefing_date, stamp), page)
+
+    headers = _cache_headers(briefing_date, page)
+    headers["Vary"] = "Accept-Encoding"
+    gzipped = accepts_gzip(request.headers.get("accept-encoding", ""))
+    if gzipped:
+        headers["ETag"] = page.etag_gzip
+    if _not_modified(request, headers["ETag"], page.last_modified):
+        return Response(status_code=304, headers=headers)
+    if gzipped:
+        # 렌더링할 때 한 번 압축해 둔 바이트를 그대로 — 요청마다 압축하지 않는다
+        headers["Content-Encoding"] = "gzip"
+        return HTMLResponse(content=page.body_gzip, headers=headers)
+    return HTMLResponse(content=page.body, headers=headers)
+
+
+@router.get("/{briefing_date}/email")
+async def archive_email(request: Request, briefing_date: str, db: AsyncSession = Depends(get_read_db)):
+    """발송된 이메일 그대로 보기 — 저장된 바이트를 재렌더링 없이 응답한다."""
+    artifact = await load_artifact(db, briefing_date)
+    if not artifact:
+        return HTMLResponse("<h1>해당 날짜의 이메일이 없습니다.</h1>", status_code=404)
 
-    return templates.TemplateResponse("briefing_detail.html", {
-        "request": request,
-        "briefing": briefing,
-    })
+    headers = {"ETag": f'"{artifact.content_hash}"', "Vary": "Accept-Encoding"}
+    if _not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    if accepts_gzip(request.headers.get("accept-encoding", "")):
+        headers["Content-Encoding"] = "gzip"
+        body = artifact.html_gzip
+    else:
+        body = artifact.html
+    return Response(content=body, media_type="text/html; charset=utf-8", headers=headers)
@@ -0,0 +1,113 @@
+"""Prometheus 메트릭 — 실행 종류별 마지막 실행의 소요 시간/성공 여부/구간별 지연/토큰 수.
+
+스프링 대응:
+- GET /metrics = /actuator/prometheus
+
+파이프라인은 별도 워커 프로세스(app/worker.py)에서 돌 수 있으므로 프로세스 메모리가 아닌
+pipeline_runs / pipeline_spans 테이블에서 읽는다 — 웹과 워커 중 어디서 긁어도 같은 값이 나온다.
+
+실행 기록(실패 사유, 외부 API 경로, 토큰 사용량)이 드러나므로 관리자 API와 같은 토큰으로 보호한다.
+Prometheus는 scrape_config의 authorization(Bearer)으로, 그 밖에는 X-Admin-Token 헤더로 보낸다.
+"""
+
+from collections import defaultdict
+
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import PlainTextResponse
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_read_db
+from app.models import PipelineRun, PipelineSpan
+from app.routes.admin import require_admin
+
+router = APIRouter()
+
+PREFIX = "briefing_pipeline"
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict[str, str]) -> str:
+    return "{" + ",".join(f'{k}="{_label(str(v))}"' for k, v in labels.items()) + "}"
+
+
+class _Exposition:
+    """Prometheus 텍스트 형식 작성기 (메트릭마다 HELP/TYPE 한 번)."""
+
+    def __init__(self):
+        self.lines: list[str] = []
+        self._declared: set[str] = set()
+
+    def add(self, name: str, help_text: str, value: float, labels: dict[str, str]) -> None:
+        metric = f"{PREFIX}_{name}"
+        if metric not in self._declared:
+            self._declared.add(metric)
+            self.lines.append(f"# HELP {metric} {help_text}")
+            self.lines.append(f"# TYPE {metric} gauge")
+        self.lines.append(f"{metric}{_labels(labels)} {value:g}")
+
+    def text(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+async def render_metrics(db: AsyncSession) -> str:
+    out = _Exposition()
+
+    totals = await db.execute(
+        select(PipelineRun.kind, PipelineRun.status, func.count()).group_by(PipelineRun.kind, PipelineRun.status)
+    )
+    for kind, status, count in totals.all():
+        out.add("runs", "보관 중인 실행 수", count, {"kind": kind, "status": status})
+
+    latest_ids = select(func.max(PipelineRun.id)).group_by(PipelineRun.kind)
+    latest = {run.id: run for run in (await db.execute(
+        select(PipelineRun).where(PipelineRun.id.in_(latest_ids))
+    )).scalars()}
+    for run in latest.values():
+        out.add("last_run_timestamp_seconds", "마지막 실행 시작 시각", run.started_at.timestamp(), {"kind": run.kind})
+        out.add("last_run_duration_seconds", "마지막 실행 소요 시간", run.duration_ms / 1000, {"kind": run.kind})
+        out.add("last_run_success", "마지막 실행 성공 여부", 1 if run.status == "ok" else 0, {"kind": run.kind})
+
+    # 마지막 실행의 구간별 합계 — 같은 이름의 호출(예: 같은 API 엔드포인트)은 묶는다
+    durations: dict[tuple, float] = defaultdict(float)
+    calls: dict[tuple, int] = defaultdict(int)
+    errors: dict[tuple, int] = defaultdict(int)
+    tokens: dict[tuple, int] = defaultdict(int)
+    spans = await db.execute(select(PipelineSpan).where(PipelineSpan.run_id.in_(list(latest))))
+    for span in spans.scalars():
+        kind = latest[span.run_id].kind
+        key = (kind, span.kind, span.name)
+        durations[key] += span.duration_ms / 1000
+        calls[key] += span.attrs.get("count", 1)
+        errors[key] += span.attrs.get("errors", 1 if span.status == "error" else 0)
+        if span.kind == "ai":
+            tokens[(kind, "input")] += span.attrs.get("input_tokens", 0)
+            tokens[(kind, "output")] += span.attrs.get("output_tokens", 0)
+
+    # 같은 메트릭의 샘플은 한 묶음으로 나와야 한다 (텍스트 형식 규칙)
+    keys = sorted(durations)
+    for metric, help_text, values in (
+        ("last_run_span_seconds", "마지막 실행의 구간별 소요 시간 합계", durations),
+        ("last_run_span_calls", "마지막 실행의 구간별 호출 수", calls),
+        ("last_run_span_errors", "마지막 실행의 구간별 실패 수", errors),
+    ):
+        for kind, span_kind, name in keys:
+            out.add(metric, help_text, values[(kind, span_kind, name)], {"kind": kind, "span_kind": span_kind, "name": name})
+    for (kind, direction), count in sorted(tokens.items()):
+        out.add("last_run_ai_tokens", "마지막 실행의 AI 토큰 수", count, {"kind": kind, "direction": direction})
+
+    return out.text()
+
+
+def require_metrics_token(x_admin_token: str = Header(default=""), authorization: str = Header(default="")) -> None:
+    """관리자 토큰 확인 — Authorization: Bearer <토큰> 또는 X-Admin-Token."""
+    scheme, _, credentials = authorization.partition(" ")
+    require_admin(credentials.strip() if scheme.lower() == "bearer" else x_admin_token)
+
+
+@router.get("/metrics", response_class=PlainTextResponse, dependencies=[Depends(require_metrics_token)])
+async def metrics(db: AsyncSession = Depends(get_read_db)):
+    return PlainTextResponse(await render_metrics(db), media_type="text/plain; version=0.0.4")
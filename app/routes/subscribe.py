@@ -3,17 +3,17 @@
 스프링 대응:
 - EmailStr = @Email @Valid (입력 검증)
 - RequestValidationError 핸들러 = @ExceptionHandler(MethodArgumentNotValidException.class)
+- 중복 체크는 SELECT 없이 INSERT ... ON CONFLICT DO NOTHING 한 번 (동시 가입에도 안전)
 """
 
 from fastapi import APIRouter, Depends, Form, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 from pydantic import EmailStr
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.models import Subscriber
+from app.subscribers import add_subscriber
 
 router = APIRouter()
 templates = Jinja2Templates(directory="templates")
@@ -30,19 +30,15 @@ async def subscribe(
     email: EmailStr = Form(...),
     db: AsyncSession = Depends(get_db),
 ):
-    # 중복 체크
-    existing = await db.execute(select(Subscriber).where(Subscriber.email == email))
-    if existing.scalar_one_or_none():
+    added = await add_subscriber(db, email)
+    await db.commit()
+    if not added:
         return templates.TemplateResponse("landing.html", {
             "request": request,
             "message": "이미 구독 중인 이메일입니다.",
             "message_type": "warning",
         })
 
-    subscriber = Subscriber(email=email)
-    db.add(subscriber)
-    await db.commit()
-
     return templates.TemplateResponse("landing.html", {
         "request": request,
         "message": "구독 신청이 완료되었습니다! 내일 아침 첫 브리핑을 보내드릴게요.",
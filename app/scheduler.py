@@ -1,17 +1,56 @@
-"""스케줄러 — 스케줄링 설정만 담당. 비즈니스 로직은 pipeline.py에."""
+"""스케줄러 — 스케줄링 설정만 담당. 비즈니스 로직은 pipeline.py에.
+
+여러 워커로 띄울 때는 리더 한 곳에서만 start_scheduler()가 호출된다 (app/leader.py).
+"""
 
 import logging
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 
-from app.pipeline import run_pipeline
+from app.checkpoint import RunCheckpoint
+from app.config import settings
+from app.pipeline import prefetch, prepare_draft, run_pipeline, warm_after_close
 
 logger = logging.getLogger(__name__)
 
+TIMEZONE = "Asia/Seoul"
+
 
 def start_scheduler():
-    """APScheduler로 매일 아침 7시 브리핑을 스케줄링한다."""
+    """APScheduler로 매일 아침 7시 브리핑과 그 전 워밍업 작업을 스케줄링한다.
+
+    - 평일 18:30  장 마감 워밍업 (다음 실행일의 시장 데이터 + 공시 맵 요약 캐시)
+    - 06:00       수집 미리 하기
+    - 06:20       초안 생성
+    - 07:00       본 실행 (뉴스만 새로 받고, 새 뉴스가 적으면 초안 그대로 → 저장/발송)
+    """
     from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
-    scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
+    scheduler = AsyncIOScheduler(timezone=TIMEZONE)
+    scheduler.add_job(
+        warm_after_close,
+        trigger="cron",
+        hour=18,
+        minute=30,
+        day_of_week="mon-fri",
+        id="after_close_warmup",
+    )
+    scheduler.add_job(
+        prefetch,
+        trigger="cron",
+        hour=6,
+        minute=0,
+        day_of_week="mon-sat",
+        id="prefetch",
+    )
+    scheduler.add_job(
+        prepare_draft,
+        trigger="cron",
+        hour=6,
+        minute=20,
+        day_of_week="mon-sat",
+        id="draft",
+    )
     scheduler.add_job(
         run_pipeline,
         trigger="cron",
@@ -21,5 +60,25 @@ def start_scheduler():
         id="daily_briefing",
     )
     scheduler.start()
-    logger.info("스케줄러 시작: 월~토 매일 아침 7시 브리핑 발송")
+    logger.info("스케줄러 시작: 월~토 매일 아침 7시 브리핑 발송 (06:00 수집, 06:20 초안 미리 준비)")
     return scheduler
+
+
+async def catch_up(now: datetime | None = None) -> None:
+    """리더가 된 직후 호출: 이전 리더가 오늘 07:00 실행을 놓쳤거나 도중에 죽었으면 이어서 한다.
+
+    07:00 이후 catch_up_hours 안에서만, 체크포인트 기준으로 발송이 끝나지 않았을 때만 재개한다
+    (resume이라 이미 끝난 단계와 이미 받은 구독자는 건너뛴다).
+    이전 리더의 실행이 아직 실행일을 점유하고 있으면 그 점유가 풀리기를 임대 2회분까지 기다린다 —
+    살아 있는 실행이면 그쪽이 끝까지 보내고, 죽은 실행이면 점유가 만료돼 여기서 이어받는다.
+    """
+    now = now or datetime.now(ZoneInfo(TIMEZONE))
+    if now.weekday() == 6:
+        return
+    due = now.replace(hour=7, minute=0, second=0, microsecond=0)
+    if not due <= now <= due + timedelta(hours=settings.catch_up_hours):
+        return
+    if RunCheckpoint(now.date().isoformat()).done("send"):
+        return
+    logger.warning("놓친 브리핑 실행 이어서 하기: %s", now.date())
+    await run_pipeline(resume=True, claim_wait=2 * settings.leader_lease_seconds)
@@ -0,0 +1,190 @@
+"""아카이브 전문 검색 — SQLite FTS5 색인.
+
+- 색인 대상은 태그를 걷어낸 평문 → 태그/인라인 스타일 안의 문자열은 검색되지 않는다
+- trigram 토크나이저: 띄어쓰기/조사와 무관하게 3글자 n-gram으로 매칭 (한국어에 적합)
+- 3글자 미만 검색어("금리", "환율")는 trigram으로 찾을 수 없어 같은 평문 컬럼에 LIKE로 대체
+- bm25 순위 + snippet() 하이라이트
+- save_briefing()이 브리핑 저장과 같은 트랜잭션에서 색인을 갱신한다
+
+SQLite가 아니거나 FTS5 trigram이 없는 SQLite(3.34 미만 등)에서는 FTS5 대신 Briefing.search_text(저장 시 html_to_text로 만든 평문)에
+LIKE로 검색한다. PostgreSQL은 pg_trgm GIN 인덱스를 만들 수 있으면 만들어 LIKE '%단어%'도 인덱스를 탄다.
+"""
+
+import html
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy import Connection, func, or_, select, text, update
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import FTS_TABLE, Briefing, uses_fts
+from app.text import html_to_text
+
+logger = logging.getLogger(__name__)
+
+_MIN_TRIGRAM = 3
+
+# snippet()이 돌려주는 하이라이트 구분자 — 본문 이스케이프 후 <mark>로 바꾼다
+_MARK_START, _MARK_END = "\ue000", "\ue001"
+_SNIPPET_TOKENS = 24
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """검색 결과 한 건 (snippet은 이스케이프 + <mark> 하이라이트 완료된 HTML)."""
+
+    date: str
+    title: str
+    snippet: str
+
+
+def _uses_fts(db: AsyncSession) -> bool:
+    return uses_fts(db.bind)
+
+
+def sync_search_index(conn: Connection) -> None:
+    """색인이 비어 있으면 기존 브리핑으로 채운다 (기능 도입 전 DB 대응, init_db에서 호출)."""
+    if not uses_fts(conn):
+        _sync_search_text(conn)
+        return
+    if conn.execute(text(f"SELECT count(*) FROM {FTS_TABLE}")).scalar():
+        return
+    rows = conn.execute(select(Briefing.date, Briefing.title, Briefing.content_html)).all()
+    if not rows:
+        return
+    conn.execute(
+        text(f"INSERT INTO {FTS_TABLE}(date, title, body) VALUES (:date, :title, :body)"),
+        [{"date": d, "title": t, "body": html_to_text(h)} for d, t, h in rows],
+    )
+    logger.info("검색 색인 생성: 브리핑 %d건", len(rows))
+
+
+def _sync_search_text(conn: Connection) -> None:
+    """검색용 평문이 비어 있는 브리핑을 채우고, PostgreSQL이면 trigram 인덱스를 만든다."""
+    from app.models import CompressedText
+
+    query = text("SELECT id, content_html FROM briefings WHERE search_text IS NULL").columns(content_html=CompressedText)
+    rows = conn.execute(query).all()
+    if rows:
+        conn.execute(
+            text("UPDATE briefings SET search_text = :body WHERE id = :id"),
+            [{"id": row_id, "body": html_to_text(h or "")} for row_id, h in rows],
+        )
+        logger.info("검색용 평문 생성: 브리핑 %d건", len(rows))
+
+    if conn.dialect.name == "postgresql":
+        try:
+            with conn.begin_nested():
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_briefings_search_text_trgm "
+                    "ON briefings USING gin (search_text gin_trgm_ops)"
+                ))
+        except DBAPIError as e:
+            # 확장을 만들 권한이 없으면 인덱스 없이(순차 스캔) 검색한다
+            logger.warning("pg_trgm 인덱스를 만들지 못함 — 검색은 순차 스캔: %s", e.orig)
+
+
+async def index_briefing(db: AsyncSession, briefing_date: str, title: str, content_html: str) -> None:
+    """브리핑 한 건의 색인을 갱신한다. 커밋은 호출자가 한다."""
+    if not _uses_fts(db):
+        await db.execute(
+            update(Briefing).where(Briefing.date == briefing_date).values(search_text=html_to_text(content_html))
+        )
+        return
+    await db.execute(text(f"DELETE FROM {FTS_TABLE} WHERE date = :date"), {"date": briefing_date})
+    await db.execute(
+        text(f"INSERT INTO {FTS_TABLE}(date, title, body) VALUES (:date, :title, :body)"),
+        {"date": briefing_date, "title": title, "body": html_to_text(content_html)},
+    )
+
+
+async def search_briefings(
+    db: AsyncSession, q: str, limit: int, offset: int = 0, total: int | None = None,
+) -> tuple[list[SearchHit], int]:
+    """검색어로 브리핑을 찾는다. (결과 목록, 전체 건수)를 반환한다.
+
+    total을 넘기면(캐시된 건수) 건수 쿼리를 건너뛴다.
+    """
+    terms = q.split()
+    if not terms:
+        return [], 0
+    if not _uses_fts(db):
+        return await _search_like_briefings(db, terms, limit, offset, total)
+    if all(len(t) >= _MIN_TRIGRAM for t in terms):
+        return await _search_match(db, terms, limit, offset, total)
+    return await _search_like_fts(db, terms, limit, offset, total)
+
+
+async def _search_match(
+    db: AsyncSession, terms: list[str], limit: int, offset: int, total: int | None,
+) -> tuple[list[SearchHit], int]:
+    """FTS5 MATCH + bm25 순위 (제목 매칭에 가중치)."""
+    # 각 단어를 구(phrase)로 감싸서 AND 검색 — FTS 문법 문자("*", "-" 등)가 그대로 검색되게
+    match = " ".join('"' + t.replace('"', '""') + '"' for t in terms)
+    if total is None:
+        total = (await db.execute(
+            text(f"SELECT count(*) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :q"), {"q": match},
+        )).scalar()
+    rows = await db.execute(
+        text(
+            f"SELECT date, title, snippet({FTS_TABLE}, 2, :s, :e, '…', {_SNIPPET_TOKENS}) "
+            f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :q "
+            f"ORDER BY bm25({FTS_TABLE}, 0.0, 5.0, 1.0), date DESC LIMIT :limit OFFSET :offset"
+        ),
+        {"q": match, "s": _MARK_START, "e": _MARK_END, "limit": limit, "offset": offset},
+    )
+    return [SearchHit(d, t, _render_snippet(s)) for d, t, s in rows.all()], total
+
+
+async def _search_like_fts(
+    db: AsyncSession, terms: list[str], limit: int, offset: int, total: int | None,
+) -> tuple[list[SearchHit], int]:
+    """짧은 검색어: 색인의 평문 컬럼에 LIKE (HTML은 여전히 제외), 최신순."""
+    where = " AND ".join(
+        f"(title LIKE :t{i} ESCAPE '\\' OR body LIKE :t{i} ESCAPE '\\')" for i in range(len(terms))
+    )
+    params = {f"t{i}": f"%{_escape_like(t)}%" for i, t in enumerate(terms)}
+    if total is None:
+        total = (await db.execute(text(f"SELECT count(*) FROM {FTS_TABLE} WHERE {where}"), params)).scalar()
+    rows = await db.execute(
+        text(f"SELECT date, title, body FROM {FTS_TABLE} WHERE {where} ORDER BY date DESC LIMIT :limit OFFSET :offset"),
+        {**params, "limit": limit, "offset": offset},
+    )
+    return [SearchHit(d, t, _make_snippet(body, terms)) for d, t, body in rows.all()], total
+
+
+async def _search_like_briefings(
+    db: AsyncSession, terms: list[str], limit: int, offset: int, total: int | None,
+) -> tuple[list[SearchHit], int]:
+    """FTS5가 없는 DB — 제목/검색용 평문(search_text) LIKE, 최신순."""
+    conditions = [or_(Briefing.title.contains(t, autoescape=True), Briefing.search_text.contains(t, autoescape=True)) for t in terms]
+    if total is None:
+        total = (await db.execute(select(func.count()).select_from(Briefing).where(*conditions))).scalar()
+    rows = await db.execute(
+        select(Briefing.date, Briefing.title, Briefing.search_text)
+        .where(*conditions).order_by(Briefing.date.desc()).limit(limit).offset(offset)
+    )
+    return [SearchHit(d, t, _make_snippet(body or "", terms)) for d, t, body in rows.all()], total
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _render_snippet(raw: str) -> str:
+    """snippet() 결과를 이스케이프하고 구분자를 <mark>로 바꾼다."""
+    return html.escape(raw).replace(_MARK_START, "<mark>").replace(_MARK_END, "</mark>")
+
+
+def _make_snippet(body: str, terms: list[str], width: int = 80) -> str:
+    """첫 매칭 위치 주변을 잘라 하이라이트한다 (snippet()을 쓸 수 없는 경로용)."""
+    pos = min((i for i in (body.find(t) for t in terms) if i >= 0), default=0)
+    start = max(0, pos - width // 2)
+    chunk = body[start:start + width]
+    marked = html.escape(chunk)
+    for t in terms:
+        escaped = html.escape(t)
+        marked = marked.replace(escaped, f"<mark>{escaped}</mark>")
+    return ("…" if start else "") + marked + ("…" if start + width < len(body) else "")
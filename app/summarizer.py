@@ -4,15 +4,23 @@
 - Protocol = interface (구조적 타이핑 — implements 선언 불필요)
 - ClaudeProvider / GeminiProvider = 구현체
 - get_provider() = @Qualifier 또는 @ConditionalOnProperty 팩토리
+- HedgedProvider = 데코레이터 (AiProvider를 감싸서 AiProvider로 동작)
 """
 
-from typing import Protocol
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from typing import Callable, Protocol
 
+from app.cache import FileCache
 from app.collector.dart import Disclosure
 from app.collector.market import MarketSummary
 from app.collector.news import NewsArticle
 from app.config import settings
+from app.telemetry import ContextThreadPoolExecutor, span, traced
 
+logger = logging.getLogger(__name__)
 
 # ── Protocol 정의 (스프링의 interface AiProvider) ──
 
@@ -33,47 +41,201 @@ class AiProvider(Protocol):
 class ClaudeProvider:
     """Claude API 구현체."""
 
+    def __init__(self, model: str | None = None, max_tokens: int = 3000):
+        self.model = model
+        self.max_tokens = max_tokens
+
     def call(self, system_prompt: str, user_prompt: str) -> str:
         import anthropic
 
+        settings.require("claude")
+        model = self.model or settings.claude_model
         client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
-        message = client.messages.create(
-            model=settings.claude_model,
-            max_tokens=3000,
-            system=system_prompt,
-            messages=[{"role": "user", "content": user_prompt}],
-        )
+        with span(f"claude {model}", kind="ai") as s:
+            message = client.messages.create(
+                model=model,
+                max_tokens=self.max_tokens,
+                system=system_prompt,
+                messages=[{"role": "user", "content": user_prompt}],
+            )
+            s.attrs.update(input_tokens=message.usage.input_tokens, output_tokens=message.usage.output_tokens)
         return message.content[0].text
 
 
 class GeminiProvider:
     """Gemini API 구현체."""
 
+    def __init__(self, model: str | None = None):
+        self.model = model
+
     def call(self, system_prompt: str, user_prompt: str) -> str:
         from google import genai
 
+        settings.require("gemini")
+        model = self.model or settings.gemini_model
         client = genai.Client(api_key=settings.gemini_api_key)
-        response = client.models.generate_content(
-            model=settings.gemini_model,
-            contents=f"{system_prompt}\n\n{user_prompt}",
-        )
+        with span(f"gemini {model}", kind="ai") as s:
+            response = client.models.generate_content(
+                model=model,
+                contents=f"{system_prompt}\n\n{user_prompt}",
+            )
+            usage = response.usage_metadata
+            if usage is not None:
+                s.attrs.update(input_tokens=usage.prompt_token_count or 0, output_tokens=usage.candidates_token_count or 0)
         return response.text
 
 
+# ── 헤지 레이싱 (CompletableFuture.anyOf + 지연 출발) ──
+
+
+@dataclass
+class ProviderAttempt:
+    """헤지 레이스에 참가한 제공자 한 건의 기록."""
+
+    name: str
+    elapsed: float | None = None  # 초 단위, 아직 끝나지 않았으면 None
+    error: str | None = None
+
+
+@dataclass
+class HedgeReport:
+    """헤지 레이스 결과 — 누가 이겼고 각자 얼마나 걸렸는지."""
+
+    winner: str | None = None
+    attempts: list[ProviderAttempt] = field(default_factory=list)
+
+
+class HedgedProvider:
+    """주 제공자를 먼저 호출하고, 지연/실패 시 보조 제공자를 경쟁시킨다.
+
+    - 주 제공자가 hedge_delay 안에 유효한 응답을 주면 보조 제공자는 출발하지 않는다.
+    - 지연되거나 에러가 나면 보조 제공자를 즉시 출발시키고, 먼저 도착한 유효 응답을 채택한다.
+    - 진 쪽은 취소한다. 이미 실행 중인 동기 SDK 호출은 중단할 수 없으므로 결과를 버린다.
+    """
+
+    def __init__(
+        self,
+        primary: tuple[str, AiProvider],
+        secondary: tuple[str, AiProvider],
+        hedge_delay: float,
+    ):
+        self.primary = primary
+        self.secondary = secondary
+        self.hedge_delay = hedge_delay
+        self.last_report: HedgeReport | None = None
+
+    def call(self, system_prompt: str, user_prompt: str) -> str:
+        report = HedgeReport()
+        self.last_report = report
+        futures: dict[Future, ProviderAttempt] = {}
+        pool = ContextThreadPoolExecutor(max_workers=2, thread_name_prefix="hedge")
+
+        def launch(name: str, provider: AiProvider) -> None:
+            attempt = ProviderAttempt(name=name)
+            report.attempts.append(attempt)
+            started = time.perf_counter()
+
+            def run() -> str:
+                try:
+                    return provider.call(system_prompt, user_prompt)
+                except Exception as e:
+                    attempt.error = str(e)
+                    raise
+                finally:
+                    attempt.elapsed = time.perf_counter() - started
+
+            futures[pool.submit(run)] = attempt
+
+        try:
+            launch(*self.primary)
+            done, _ = wait(futures, timeout=self.hedge_delay)
+            hit = _first_valid(done)
+            if hit:
+                return self._finish(report, futures, *hit)
+
+            logger.warning("주 제공자(%s) 지연/실패 — 보조 제공자(%s) 출발", self.primary[0], self.secondary[0])
+            launch(*self.secondary)
+            pending = {f for f in futures if not f.done()}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                hit = _first_valid(done)
+                if hit:
+                    return self._finish(report, futures, *hit)
+
+            errors = ", ".join(f"{a.name}: {a.error or '빈 응답'}" for a in report.attempts)
+            raise RuntimeError(f"모든 AI 제공자 실패 ({errors})")
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _finish(report: HedgeReport, futures: dict[Future, ProviderAttempt], winner: Future, text: str) -> str:
+        """승자를 기록하고 나머지를 취소한다."""
+        report.winner = futures[winner].name
+        for f in futures:
+            if f is not winner:
+                f.cancel()
+        logger.info(
+            "헤지 결과: %s 승리 (%s)",
+            report.winner,
+            ", ".join(
+                f"{a.name} {a.elapsed:.1f}s" if a.elapsed is not None else f"{a.name} 미완료"
+                for a in report.attempts
+            ),
+        )
+        return text
+
+
+def _valid_result(future: Future) -> str | None:
+    """완료된 Future에서 유효한(비어 있지 않은) 응답을 꺼낸다. 실패면 None."""
+    if future.cancelled() or future.exception() is not None:
+        return None
+    text = future.result()
+    return text if text and text.strip() else None
+
+
+def _first_valid(done: set[Future]) -> tuple[Future, str] | None:
+    """완료된 Future 중 첫 유효 응답을 (Future, 응답) 으로 반환한다."""
+    for f in done:
+        text = _valid_result(f)
+        if text is not None:
+            return f, text
+    return None
+
+
 # ── 팩토리 함수 (스프링의 @ConditionalOnProperty) ──
 
 
+_PROVIDERS: dict[str, type] = {
+    "claude": ClaudeProvider,
+    "gemini": GeminiProvider,
+}
+
+
 def _get_provider() -> AiProvider:
     """설정에 따라 AI 제공자를 반환한다."""
-    if settings.ai_provider == "gemini":
-        return GeminiProvider()
-    return ClaudeProvider()
+    if settings.ai_provider == "hedged":
+        primary = settings.hedge_primary
+        secondary = "gemini" if primary == "claude" else "claude"
+        return HedgedProvider(
+            primary=(primary, _PROVIDERS[primary]()),
+            secondary=(secondary, _PROVIDERS[secondary]()),
+            hedge_delay=settings.hedge_delay_seconds,
+        )
+    return _PROVIDERS[settings.ai_provider]()
+
+
+def _get_map_provider() -> AiProvider:
+    """공시 맵 단계용 저렴한 모델 제공자를 반환한다 (헤지 모드면 주 제공자 기준)."""
+    name = settings.hedge_primary if settings.ai_provider == "hedged" else settings.ai_provider
+    if name == "gemini":
+        return GeminiProvider(model=settings.gemini_map_model)
+    return ClaudeProvider(model=settings.claude_map_model, max_tokens=1500)
 
 
 # ── 시스템 프롬프트 ──
 
 
-SYSTEM_PROMPT = """당신은 2030 직장인을 위한 주식 뉴스레터 에디터예요.
+_PREAMBLE = """당신은 2030 직장인을 위한 주식 뉴스레터 에디터예요.
 뉴닉(Newneek) 스타일로 친근하고 쉽게 아침 브리핑을 작성해주세요.
 
 톤앤매너:
@@ -94,14 +256,9 @@ SYSTEM_PROMPT = """당신은 2030 직장인을 위한 주식 뉴스레터 에디
 - <h2>, <ul>, <li>, <strong>, <p>, <br> 등 기본 태그만 사용. <div>, <style>, CSS class 사용 금지.
 - 인라인 style 속성을 넣지 마세요. 스타일은 후처리에서 자동으로 적용됩니다.
 
-섹션 구성:
-1. 📊 어제 시장 어땠나요? - 코스피/코스닥 지수를 자연스러운 문장으로. 한 줄 요약 포함.
-2. 💰 외인/기관은 뭘 했나요? - 외국인·기관·개인 순매수/순매도 금액(억원)을 자연스럽게 요약. "외국인이 1,474억 사들였어요" 처럼 쉽게. 코스피/코스닥 차이도 언급.
-3. 🏢 대장주는요 - 코스피 시총 TOP10 등락률. ±2% 이상 움직인 종목은 뉴스 참고하여 이유를 친절하게 설명. 반드시 <li> 리스트가 아닌 <p> 문단형으로 작성하세요. 비슷한 흐름의 종목들을 묶어서 자연스러운 문장으로 서술해주세요. 종목명 하나하나 나열하지 마세요.
-4. 📋 눈여겨볼 공시 - 개인투자자에게 중요한 공시만 골라서, 왜 중요한지 쉽게 설명.
-5. 📰 오늘의 뉴스 - 주요 뉴스 3~5건.
+"""
 
-공시/뉴스 항목 포맷 (반드시 지켜주세요):
+_ITEM_FORMAT = """공시/뉴스 항목 포맷 (반드시 지켜주세요):
 각 <li> 안에서 제목과 내용을 <br> 태그로 줄바꿈하세요. 콜론(:)으로 이어붙이지 마세요.
 올바른 예시:
 <li><strong>현대모비스 자기주식 처분 결정</strong><br>자기주식 약 200만주를 처분하기로 했어요. 주가 방어 신호로 읽힐 수 있어요.</li>
@@ -110,6 +267,112 @@ SYSTEM_PROMPT = """당신은 2030 직장인을 위한 주식 뉴스레터 에디
 """
 
 
+# ── 섹션 정의 (섹션별 병렬 생성에도 그대로 쓰인다) ──
+
+
+@dataclass(frozen=True)
+class BriefingSection:
+    """브리핑 섹션 하나 — 제목, 작성 지침, 그리고 이 섹션에 필요한 데이터만 뽑는 함수."""
+
+    key: str
+    heading: str
+    instruction: str
+    build: Callable[["_PromptInput"], list[str]]
+    item_format: bool = False  # 공시/뉴스처럼 <li> 항목 포맷 규칙이 필요한 섹션
+
+
+@dataclass(frozen=True)
+class _PromptInput:
+    """프롬프트 조립에 쓰이는 수집 데이터 묶음."""
+
+    market: MarketSummary
+    disclosures: list[Disclosure]
+    news: list[NewsArticle]
+    stock_news: dict[str, list[NewsArticle]] | None = None
+    disclosure_notes: list[str] | None = None
+
+
+SECTIONS: list[BriefingSection] = [
+    BriefingSection(
+        key="market",
+        heading="📊 어제 시장 어땠나요?",
+        instruction="코스피/코스닥 지수를 자연스러운 문장으로. 한 줄 요약 포함.",
+        build=lambda d: _market_part(d.market),
+    ),
+    BriefingSection(
+        key="investors",
+        heading="💰 외인/기관은 뭘 했나요?",
+        instruction=(
+            "외국인·기관·개인 순매수/순매도 금액(억원)을 자연스럽게 요약. "
+            "\"외국인이 1,474억 사들였어요\" 처럼 쉽게. 코스피/코스닥 차이도 언급."
+        ),
+        build=lambda d: _investor_part(d.market),
+    ),
+    BriefingSection(
+        key="large_caps",
+        heading="🏢 대장주는요",
+        instruction=(
+            "코스피 시총 TOP10 등락률. ±2% 이상 움직인 종목은 뉴스 참고하여 이유를 친절하게 설명. "
+            "반드시 <li> 리스트가 아닌 <p> 문단형으로 작성하세요. "
+            "비슷한 흐름의 종목들을 묶어서 자연스러운 문장으로 서술해주세요. 종목명 하나하나 나열하지 마세요."
+        ),
+        build=lambda d: _top10_part(d.market) + _stock_news_part(d.stock_news),
+    ),
+    BriefingSection(
+        key="disclosures",
+        heading="📋 눈여겨볼 공시",
+        instruction="개인투자자에게 중요한 공시만 골라서, 왜 중요한지 쉽게 설명.",
+        build=lambda d: _disclosure_part(d.disclosures, d.disclosure_notes),
+        item_format=True,
+    ),
+    BriefingSection(
+        key="news",
+        heading="📰 오늘의 뉴스",
+        instruction="주요 뉴스 3~5건.",
+        build=lambda d: _news_part(d.news),
+        item_format=True,
+    ),
+]
+
+
+SYSTEM_PROMPT = (
+    _PREAMBLE
+    + "섹션 구성:\n"
+    + "".join(f"{i}. {s.heading} - {s.instruction}\n" for i, s in enumerate(SECTIONS, 1))
+    + "\n"
+    + _ITEM_FORMAT
+)
+
+
+MAP_SYSTEM_PROMPT = """당신은 DART 공시를 검토하는 애널리스트예요.
+아래 공시 목록에서 개인투자자에게 의미 있는 것만 골라 짧은 메모로 정리해주세요.
+
+규칙:
+- 한 줄에 하나씩 "- [회사명] 핵심 내용 (왜 중요한지)" 형식으로만 쓰세요.
+- 단순 정정공시, 임원 소유 변동처럼 영향이 작은 공시는 빼세요.
+- 같은 회사의 비슷한 공시는 한 줄로 묶으세요.
+- 의미 있는 공시가 없으면 "- 특이 공시 없음" 한 줄만 쓰세요.
+- HTML, 인사말, 설명 문장 없이 메모 줄만 쓰세요.
+"""
+
+# 맵 프롬프트를 바꾸면 올려서 이전 캐시를 무효화한다
+_MAP_PROMPT_VERSION = 1
+_MAP_CACHE_TTL = 7 * 24 * 3600
+
+
+def _section_system_prompt(section: BriefingSection) -> str:
+    """섹션 하나만 쓰게 하는 시스템 프롬프트."""
+    prompt = (
+        _PREAMBLE
+        + "이번에는 아래 섹션 하나만 작성하세요. 나머지 섹션은 따로 작성돼요.\n"
+        + f"<h2>{section.heading}</h2> 로 시작하세요.\n"
+        + f"- {section.instruction}\n"
+    )
+    if section.item_format:
+        prompt += "\n" + _ITEM_FORMAT
+    return prompt
+
+
 # ── 공개 API ──
 
 
@@ -119,16 +382,149 @@ def generate_briefing(
     news: list[NewsArticle],
     stock_news: dict[str, list[NewsArticle]] | None = None,
 ) -> str:
-    """수집된 데이터를 AI에게 보내 브리핑 HTML을 생성한다."""
-    prompt = _build_prompt(market, disclosures, news, stock_news)
+    """수집된 데이터를 AI에게 보내 브리핑 HTML을 생성한다.
+
+    공시가 disclosure_map_threshold건을 넘으면 먼저 배치별로 요약(map)해서 메모만 프롬프트에 넣는다(reduce).
+    """
+    notes = None
+    if settings.disclosure_map_reduce and len(disclosures) > settings.disclosure_map_threshold:
+        notes = summarize_disclosures(disclosures)
+
+    if settings.briefing_mode == "sections":
+        return generate_briefing_by_sections(market, disclosures, news, stock_news, notes)
+
+    prompt = _build_prompt(market, disclosures, news, stock_news, notes)
     provider = _get_provider()
     raw = provider.call(SYSTEM_PROMPT, prompt)
     return _strip_code_block(raw)
 
 
+def generate_briefing_by_sections(
+    market: MarketSummary,
+    disclosures: list[Disclosure],
+    news: list[NewsArticle],
+    stock_news: dict[str, list[NewsArticle]] | None = None,
+    disclosure_notes: list[str] | None = None,
+) -> str:
+    """섹션별 프롬프트로 동시에 생성한 뒤 순서대로 이어붙인다.
+
+    섹션 하나가 실패하면 그 섹션만 다시 생성한다 (최대 section_max_attempts회).
+    """
+    data = _PromptInput(market, disclosures, news, stock_news, disclosure_notes)
+    provider = _get_provider()
+
+    with ContextThreadPoolExecutor(max_workers=len(SECTIONS), thread_name_prefix="section") as pool:
+        futures = [pool.submit(_generate_section, provider, section, data) for section in SECTIONS]
+        # 제출 순서대로 결과를 모으므로 섹션 순서가 보장된다
+        return "\n".join(f.result() for f in futures)
+
+
+@traced("summarize.disclosure_map")
+def summarize_disclosures(disclosures: list[Disclosure]) -> list[str]:
+    """공시를 배치로 나눠 저렴한 모델로 동시에 요약한다 (맵 단계).
+
+    - 동시 호출 수는 disclosure_map_concurrency로 제한한다.
+    - 배치 결과는 (모델, 배치 구성) 기준으로 디스크 캐시에 저장 → 재실행 시 재호출하지 않는다.
+    - 실패한 배치는 원본 공시 목록으로 대체해서 신호를 잃지 않는다.
+    """
+    # 접수번호 순으로 정렬해서 재실행해도 같은 배치가 만들어지게 한다 (캐시 적중)
+    ordered = sorted(disclosures, key=lambda d: d.rcept_no)
+    size = settings.disclosure_batch_size
+    batches = [ordered[i:i + size] for i in range(0, len(ordered), size)]
+
+    provider = _get_map_provider()
+    cache = FileCache("disclosure_map", ttl=_MAP_CACHE_TTL)
+    with ContextThreadPoolExecutor(max_workers=settings.disclosure_map_concurrency, thread_name_prefix="map") as pool:
+        notes = list(pool.map(lambda batch: _map_batch(provider, cache, batch), batches))
+
+    logger.info("공시 맵 요약 완료: %d건 → %d배치", len(disclosures), len(batches))
+    return notes
+
+
+TICKER_SYSTEM_PROMPT = _PREAMBLE + """이번에는 독자가 관심 종목으로 등록한 종목 하나에 대해서만 써주세요.
+- <p> 문단 하나, 2~3문장. <h2>는 쓰지 마세요.
+- 첫 문장에 종목명을 <strong>으로 감싸서 쓰세요.
+- 가격 데이터가 있으면 어제 움직임을, 뉴스가 있으면 왜 움직였는지를 설명하세요.
+- 데이터가 없으면 "어제는 눈에 띄는 소식이 없었어요" 처럼 짧게 쓰세요.
+"""
+
+
+@traced("summarize.ticker_sections")
+def generate_ticker_sections(
+    tickers: list[str],
+    market: MarketSummary,
+    stock_news: dict[str, list[NewsArticle]],
+) -> dict[str, str]:
+    """관심 종목별 짧은 문단을 종목당 한 번씩 생성한다 (구독자 수와 무관).
+
+    실패한 종목은 결과에서 빠진다 — 그 종목 문단만 없는 메일이 나간다.
+    """
+    provider = _get_provider()
+    prices = {s.name: s for s in market.kospi_top10}
+
+    def generate(ticker: str) -> tuple[str, str | None]:
+        lines = [_date_line(market), f"## 종목: {ticker}"]
+        if ticker in prices:
+            s = prices[ticker]
+            lines.append(f"- 종가 {s.close}원 ({s.direction} {s.change_pct}%)")
+        for a in stock_news.get(ticker, []):
+            lines.append(f"- {a.title}: {a.description}")
+        try:
+            return ticker, _strip_code_block(provider.call(TICKER_SYSTEM_PROMPT, "\n".join(lines))) or None
+        except Exception as e:
+            logger.warning("관심 종목 섹션 생성 실패 (%s): %s", ticker, e)
+            return ticker, None
+
+    with ContextThreadPoolExecutor(max_workers=settings.ticker_section_concurrency, thread_name_prefix="ticker") as pool:
+        results = list(pool.map(generate, tickers))
+    return {ticker: html for ticker, html in results if html}
+
+
 # ── 내부 헬퍼 ──
 
 
+def _map_batch(provider: AiProvider, cache: FileCache, batch: list[Disclosure]) -> str:
+    """공시 배치 하나를 요약 메모로 만든다."""
+    model = getattr(provider, "model", None) or type(provider).__name__
+    key = f"v{_MAP_PROMPT_VERSION}:{model}:" + ",".join(d.rcept_no for d in batch)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    lines = [f"- [{d.corp_name}] {d.report_nm} (제출인: {d.flr_nm})" for d in batch]
+    try:
+        note = _strip_code_block(provider.call(MAP_SYSTEM_PROMPT, "\n".join(lines)))
+    except Exception as e:
+        logger.warning("공시 맵 요약 실패 (%d건) — 원본 목록으로 대체: %s", len(batch), e)
+        return "\n".join(lines)
+    if not note:
+        return "\n".join(lines)
+
+    cache.set(key, note)
+    return note
+
+
+def _generate_section(provider: AiProvider, section: BriefingSection, data: _PromptInput) -> str:
+    """섹션 하나를 생성한다. 실패하거나 빈 응답이면 그 섹션만 재시도한다."""
+    system_prompt = _section_system_prompt(section)
+    user_prompt = "\n".join([_date_line(data.market), *section.build(data)])
+
+    last_error: Exception | None = None
+    for attempt in range(1, settings.section_max_attempts + 1):
+        try:
+            html = _strip_code_block(provider.call(system_prompt, user_prompt))
+        except Exception as e:
+            last_error = e
+            logger.warning("섹션 생성 실패 (%s, %d회차): %s", section.key, attempt, e)
+            continue
+        if html:
+            return html
+        last_error = ValueError("빈 응답")
+        logger.warning("섹션 생성 빈 응답 (%s, %d회차)", section.key, attempt)
+
+    raise RuntimeError(f"섹션 생성 실패: {section.key}") from last_error
+
+
 def _strip_code_block(text: str) -> str:
     """AI 응답에서 ```html ... ``` 코드블록 마커를 제거한다."""
     text = text.strip()
@@ -144,17 +540,38 @@ def _build_prompt(
     disclosures: list[Disclosure],
     news: list[NewsArticle],
     stock_news: dict[str, list[NewsArticle]] | None = None,
+    disclosure_notes: list[str] | None = None,
 ) -> str:
     """수집 데이터를 프롬프트 텍스트로 변환한다."""
-    parts = [f"## 날짜: {market.date or '알 수 없음'}\n"]
+    parts = [_date_line(market)]
+    parts += _market_part(market)
+    parts += _investor_part(market)
+    parts += _top10_part(market)
+    parts += _stock_news_part(stock_news)
+    parts += _disclosure_part(disclosures, disclosure_notes)
+    parts += _news_part(news)
+    return "\n".join(parts)
+
+
+# ── 프롬프트 조각 (섹션별로 필요한 데이터만 잘라낸다) ──
+
 
-    # 시장 데이터
-    parts.append("## 시장 데이터")
+def _date_line(market: MarketSummary) -> str:
+    return f"## 날짜: {market.date or '알 수 없음'}\n"
+
+
+def _market_part(market: MarketSummary) -> list[str]:
+    """시장 데이터."""
+    parts = ["## 시장 데이터"]
     for idx in [market.kospi, market.kosdaq]:
         if idx:
             parts.append(f"- {idx.name}: 종가 {idx.close}, 전일대비 {idx.change} ({idx.direction}), 등락률 {idx.change_pct}%")
+    return parts
+
 
-    # 투자자별 매매동향
+def _investor_part(market: MarketSummary) -> list[str]:
+    """투자자별 매매동향."""
+    parts: list[str] = []
     if market.kospi_investor or market.kosdaq_investor:
         parts.append("\n## 투자자별 매매동향 (단위: 억원)")
         if market.kospi_investor:
@@ -163,34 +580,53 @@ def _build_prompt(
         if market.kosdaq_investor:
             inv = market.kosdaq_investor
             parts.append(f"- 코스닥: 개인 {inv.personal}, 외국인 {inv.foreign}, 기관 {inv.institutional}")
+    return parts
 
+
+def _top10_part(market: MarketSummary) -> list[str]:
+    """코스피 시총 TOP10."""
+    parts: list[str] = []
     if market.kospi_top10:
         parts.append("\n## 코스피 시총 TOP10")
         for s in market.kospi_top10:
             parts.append(f"- {s.name}: {s.close}원 ({s.direction} {s.change_pct}%)")
+    return parts
+
 
-    # 종목별 뉴스 (대장주 이유 분석용)
+def _stock_news_part(stock_news: dict[str, list[NewsArticle]] | None) -> list[str]:
+    """종목별 뉴스 (대장주 이유 분석용)."""
+    parts: list[str] = []
     if stock_news:
         parts.append("\n## 종목별 관련 뉴스 (급등/급락 이유 분석에 활용)")
         for stock_name, articles in stock_news.items():
             parts.append(f"\n### {stock_name}")
             for a in articles:
                 parts.append(f"- {a.title}: {a.description}")
+                if a.body:
+                    parts.append(f"  본문 발췌: {' '.join(a.body.split())}")
+    return parts
 
-    # 공시 데이터
-    parts.append("\n## 공시 데이터")
+
+def _disclosure_part(disclosures: list[Disclosure], notes: list[str] | None = None) -> list[str]:
+    """공시 데이터. 맵 단계 메모가 있으면 원본 목록 대신 메모를 넣는다."""
+    if notes:
+        return [f"\n## 공시 데이터 (전체 {len(disclosures)}건을 미리 요약한 메모)", *notes]
+
+    parts = ["\n## 공시 데이터"]
     if disclosures:
         for d in disclosures:
             parts.append(f"- [{d.corp_name}] {d.report_nm} (제출인: {d.flr_nm})")
     else:
         parts.append("- 주요 공시 없음")
+    return parts
+
 
-    # 뉴스 데이터
-    parts.append("\n## 뉴스 데이터")
+def _news_part(news: list[NewsArticle]) -> list[str]:
+    """뉴스 데이터."""
+    parts = ["\n## 뉴스 데이터"]
     if news:
         for n in news:
             parts.append(f"- {n.title}: {n.description}")
     else:
         parts.append("- 주요 뉴스 없음")
-
-    return "\n".join(parts)
+    return parts
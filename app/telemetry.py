@@ -0,0 +1,304 @@
+"""파이프라인 실행 추적 — 단계와 외부 호출마다 span을 남겨 pipeline_runs / pipeline_spans에 저장.
+
+스프링 대응:
+- traced_run()   = Micrometer Observation (실행 1회 = 트레이스, 끝나면 한 번에 저장)
+- traced()/span()= @Timed / @Observed (단계 하나 = span)
+- http_client()  = WebClient + ExchangeFilterFunction (외부 API 지연과 응답 없는 실패를 자동 기록)
+- observe()      = 호출이 아주 많은 구간(SMTP 발송)은 개별 span 대신 횟수/합계/최대만 누적
+
+span은 실행 중에는 메모리에만 모으고(ContextVar로 현재 실행을 찾는다), 실행이 끝날 때 한 트랜잭션으로 저장한다.
+실행 밖(웹 요청 등)에서 호출되면 아무것도 기록하지 않는다.
+조회: GET /admin/runs (JSON), GET /metrics (Prometheus 텍스트, app/routes/metrics.py)
+"""
+
+import contextvars
+import functools
+import inspect
+import itertools
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator
+
+from sqlalchemy import delete, select
+
+from app.config import settings
+from app.database import async_session
+from app.models import PipelineRun, PipelineSpan
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+MAX_SPANS = 5000  # 실행 하나에 저장할 최대 span 수 (넘으면 버리고 개수만 기록)
+
+_run: contextvars.ContextVar["RunTrace | None"] = contextvars.ContextVar("pipeline_run", default=None)
+_parent: contextvars.ContextVar[int | None] = contextvars.ContextVar("pipeline_span", default=None)
+
+# 경로 안의 숫자 식별자(종목 코드 등)는 묶어서 엔드포인트별로 집계되게 한다
+_ID_SEGMENT = re.compile(r"/\d[^/]*")
+
+
+@dataclass
+class Span:
+    seq: int
+    parent_seq: int | None
+    kind: str
+    name: str
+    offset_ms: float
+    duration_ms: float = 0.0
+    status: str = "ok"
+    attrs: dict[str, Any] = field(default_factory=dict)
+
+
+class RunTrace:
+    """실행 1회 동안 모은 span. 스레드(요약 단계)에서도 함께 쓴다."""
+
+    def __init__(self, kind: str, run_date: str):
+        self.kind = kind
+        self.run_date = run_date
+        self.started_at = datetime.now()
+        self.error = ""
+        self.spans: list[Span] = []
+        self.dropped = 0
+        self._t0 = time.perf_counter()
+        self._seq = itertools.count(1)
+        self._aggregates: dict[tuple, Span] = {}
+        self._lock = threading.RLock()
+
+    def elapsed_ms(self, since: float | None = None) -> float:
+        return (time.perf_counter() - (self._t0 if since is None else since)) * 1000
+
+    def open(self, kind: str, name: str, attrs: dict[str, Any], started: float | None = None) -> Span:
+        offset = self.elapsed_ms() if started is None else (started - self._t0) * 1000
+        with self._lock:
+            span = Span(next(self._seq), _parent.get(), kind, name, offset, attrs=attrs)
+            if len(self.spans) < MAX_SPANS:
+                self.spans.append(span)
+            else:
+                self.dropped += 1
+        return span
+
+    def observe(self, kind: str, name: str, started: float, ok: bool) -> None:
+        """같은 (부모, 종류, 이름)의 호출을 span 하나에 누적한다."""
+        elapsed = self.elapsed_ms(started)
+        key = (_parent.get(), kind, name)
+        with self._lock:
+            span = self._aggregates.get(key)
+            if span is None:
+                span = self._aggregates[key] = self.open(kind, name, {"count": 0, "errors": 0, "max_ms": 0.0}, started)
+            span.attrs["count"] += 1
+            span.attrs["errors"] += 0 if ok else 1
+            span.attrs["max_ms"] = max(span.attrs["max_ms"], elapsed)
+            span.duration_ms += elapsed
+            if not ok:
+                span.status = "error"
+
+
+def current_run() -> RunTrace | None:
+    return _run.get()
+
+
+def mark_failed(message: str) -> None:
+    """예외 없이 끝나도 실패로 기록한다 (예: 일부 구독자 발송 실패)."""
+    trace = _run.get()
+    if trace is not None:
+        trace.error = message
+
+
+@contextmanager
+def span(name: str, kind: str = "stage", **attrs: Any) -> Iterator[Span]:
+    """구간 하나를 기록한다. 넘겨받은 Span의 attrs에 토큰 수 등을 더 적을 수 있다."""
+    trace = _run.get()
+    if trace is None:
+        yield Span(0, None, kind, name, 0.0, attrs=attrs)
+        return
+    current = trace.open(kind, name, attrs)
+    token = _parent.set(current.seq)
+    started = time.perf_counter()
+    try:
+        yield current
+    except BaseException as e:
+        current.status = "error"
+        current.attrs.setdefault("error", type(e).__name__)
+        raise
+    finally:
+        current.duration_ms = trace.elapsed_ms(started)
+        _parent.reset(token)
+
+
+def observe(kind: str, name: str, started: float, ok: bool = True) -> None:
+    """started(perf_counter)부터 지금까지를 누적 span에 더한다."""
+    trace = _run.get()
+    if trace is not None:
+        trace.observe(kind, name, started, ok)
+
+
+def traced(name: str, kind: str = "stage"):
+    """함수 호출 전체를 span으로 감싸는 데코레이터 (동기/비동기 모두)."""
+    def decorator(fn):
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with span(name, kind):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name, kind):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def traced_run(kind: str):
+    """비동기 함수 실행 1회를 pipeline_runs 한 행으로 기록하는 데코레이터.
+
+    함수의 run_date 인자(없으면 오늘)를 실행일로 쓴다. 이미 실행 안에서 불리면 span 하나로 기록된다.
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            run_date = signature.bind_partial(*args, **kwargs).arguments.get("run_date") or date.today()
+            async with trace_run(kind, run_date.isoformat()):
+                return await fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@asynccontextmanager
+async def trace_run(kind: str, run_date: str) -> AsyncIterator[RunTrace | None]:
+    if not settings.telemetry_enabled:
+        yield None
+        return
+    if _run.get() is not None:
+        with span(kind):
+            yield _run.get()
+        return
+
+    trace = RunTrace(kind, run_date)
+    token = _run.set(trace)
+    try:
+        yield trace
+    except BaseException as e:
+        trace.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _run.reset(token)
+        await _save(trace)
+
+
+async def _save(trace: RunTrace) -> None:
+    duration = trace.elapsed_ms()
+    stages = ", ".join(f"{s.name} {s.duration_ms / 1000:.1f}s" for s in trace.spans if s.kind == "stage" and s.parent_seq is None)
+    logger.info("실행 기록: %s %s %.1fs (%s)", trace.kind, trace.run_date, duration / 1000, stages or "단계 없음")
+    try:
+        async with async_session() as db:
+            run = PipelineRun(
+                kind=trace.kind,
+                run_date=trace.run_date,
+                started_at=trace.started_at,
+                duration_ms=duration,
+                status="failed" if trace.error else "ok",
+                error=trace.error,
+            )
+            db.add(run)
+            await db.flush()
+            db.add_all(
+                PipelineSpan(run_id=run.id, **{k: getattr(s, k) for k in (
+                    "seq", "parent_seq", "kind", "name", "offset_ms", "duration_ms", "status", "attrs",
+                )})
+                for s in trace.spans
+            )
+            if trace.dropped:
+                logger.warning("span %d개 초과분 %d개는 저장하지 않음", MAX_SPANS, trace.dropped)
+            await _prune(db)
+            await db.commit()
+    except Exception:
+        # 기록 실패가 파이프라인 실패가 되면 안 된다
+        logger.exception("실행 기록 저장 실패")
+
+
+async def _prune(db) -> None:
+    cutoff = datetime.now() - timedelta(days=settings.telemetry_keep_days)
+    old = select(PipelineRun.id).where(PipelineRun.started_at < cutoff)
+    await db.execute(delete(PipelineSpan).where(PipelineSpan.run_id.in_(old)))
+    await db.execute(delete(PipelineRun).where(PipelineRun.started_at < cutoff))
+
+
+# ── 외부 호출 계측 ──
+
+
+def http_client(**kwargs: Any) -> "httpx.AsyncClient":
+    """요청마다 http span을 남기는 AsyncClient (이름: 메서드 + 호스트 + 경로).
+
+    전송 계층은 httpx가 만들게 두고(verify/cert/limits/http2, 환경변수 프록시 마운트) 만든 뒤에 감싼다.
+    transport를 직접 넘기면 httpx가 그 인자들과 프록시를 무시하기 때문.
+    """
+    import httpx  # 웹 프로세스(publisher가 traced만 씀)는 httpx를 불러오지 않는다
+
+    client = httpx.AsyncClient(**kwargs)
+    client._transport = _TracedTransport(client._transport)
+    client._mounts = {
+        pattern: None if transport is None else _TracedTransport(transport)
+        for pattern, transport in client._mounts.items()
+    }
+    return client
+
+
+class _TracedTransport:
+    """전송 계층 래퍼 — 응답이 없는 실패(타임아웃, 연결 끊김, DNS)도 status=error span으로 남긴다.
+
+    응답 이벤트 훅은 응답이 와야만 불리므로, 가장 보고 싶은 장애가 기록에서 빠진다.
+    """
+
+    def __init__(self, inner: "httpx.AsyncBaseTransport"):
+        self._inner = inner
+
+    async def handle_async_request(self, request: "httpx.Request") -> "httpx.Response":
+        started = time.perf_counter()
+        try:
+            response = await self._inner.handle_async_request(request)
+        except BaseException as e:
+            # 취소(asyncio.wait_for 시간 초과 등)도 호출 실패로 남기고 그대로 올린다
+            _record_http(request, started, {"error": type(e).__name__}, failed=True)
+            raise
+        _record_http(request, started, {"status": response.status_code}, failed=response.status_code >= 400)
+        return response
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+    async def __aenter__(self) -> "_TracedTransport":
+        await self._inner.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._inner.__aexit__(*exc_info)
+
+
+def _record_http(request: "httpx.Request", started: float, attrs: dict[str, Any], failed: bool) -> None:
+    trace = _run.get()
+    if trace is None:
+        return
+    name = f"{request.method} {request.url.host}{_ID_SEGMENT.sub('/{id}', request.url.path)}"
+    span = trace.open("http", name, attrs, started)
+    span.duration_ms = trace.elapsed_ms(started)
+    if failed:
+        span.status = "error"
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """제출한 작업이 현재 실행(ContextVar)을 이어받는 스레드 풀 — 요약 단계의 병렬 AI 호출용."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
@@ -0,0 +1,22 @@
+"""HTML → 평문 변환 (검색 색인, 발췌문 등에 사용)."""
+
+import html
+import re
+
+# 블록 태그 경계는 공백으로 바꿔서 "시장</p><p>외인" 이 "시장외인" 으로 붙지 않게 한다
+_BLOCK_TAG_RE = re.compile(r"</?(?:h[1-6]|p|li|ul|ol|br|div|table|tr|td|th)(?:\s[^>]*)?/?>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def html_to_text(content_html: str) -> str:
+    """태그를 걷어내고 엔티티를 풀어서 한 줄 평문으로 만든다."""
+    text = _BLOCK_TAG_RE.sub(" ", content_html)
+    text = _TAG_RE.sub("", text)
+    return _SPACE_RE.sub(" ", html.unescape(text)).strip()
+
+
+def make_excerpt(content_html: str, length: int = 140) -> str:
+    """목록 화면용 평문 발췌문 (length자 초과 시 말줄임)."""
+    text = html_to_text(content_html)
+    return text if len(text) <= length else text[:length].rstrip() + "…"
@@ -0,0 +1,138 @@
+"""파이프라인 워커 — 웹 서버와 분리된 별도 프로세스에서 스케줄러와 파이프라인을 돌린다.
+
+수집/AI 요약의 CPU·메모리 부하가 웹 응답 지연에 섞이지 않게, 웹은 SCHEDULER_ENABLED=false로
+서빙만 하고 예약 작업은 이 워커가 맡는다. 둘을 따로 늘리고 따로 프로파일링할 수 있다.
+
+스프링 대응:
+- serve = 스케줄러만 켠 별도 Spring Boot 앱 (web-application-type=none)
+- run   = Spring Batch 잡 런처 CLI (JobParameters: --date, --steps)
+
+    python -m app.worker                        # serve: 리더 선출 + 예약 작업 (기본)
+    python -m app.worker run                    # 오늘 브리핑 전체 실행
+    python -m app.worker run --steps summarize save --date 2026-01-05   # 그날 수집 체크포인트로 다시 요약/저장
+    python -m app.worker run --resume           # 실패 지점부터 재개
+    python -m app.worker warm prefetch          # 워밍업 작업 하나만 실행
+    python -m app.worker backfill 2025-01-01 2025-12-31   # 과거 아카이브 채우기 (app/backfill.py)
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+import sys
+from datetime import date
+
+from app.checkpoint import STAGES
+
+logger = logging.getLogger(__name__)
+
+WARMUPS = ("after-close", "prefetch", "draft")
+
+
+async def serve() -> None:
+    """SIGINT/SIGTERM을 받을 때까지 스케줄러를 돌린다 (워커가 여러 개면 리더 하나만)."""
+    from app.config import PIPELINE_GROUPS, settings
+    from app.database import init_db
+    from app.leader import SchedulerLeader
+    from app.scheduler import catch_up, start_scheduler
+
+    settings.require(*PIPELINE_GROUPS)  # 07:00에 가서야 키 누락을 알지 않게 시작할 때 확인
+    await init_db()
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopping.set)
+
+    leader = SchedulerLeader(start_scheduler, on_elected=catch_up)
+    await leader.start()
+    logger.info("파이프라인 워커 시작")
+    try:
+        await stopping.wait()
+    finally:
+        await leader.stop()
+        logger.info("파이프라인 워커 종료")
+
+
+async def run(run_date: date | None = None, steps: list[str] | None = None, resume: bool = False) -> str:
+    """파이프라인을 한 번 실행한다."""
+    from app.database import init_db
+    from app.pipeline import run_pipeline
+
+    await init_db()
+    return await run_pipeline(resume=resume, run_date=run_date, steps=steps)
+
+
+async def warm(job: str, run_date: date | None = None) -> None:
+    """워밍업 작업 하나를 실행한다."""
+    from app.pipeline import prefetch, prepare_draft, warm_after_close
+
+    if job == "after-close":
+        await warm_after_close()
+    elif job == "prefetch":
+        await prefetch(run_date)
+    else:
+        await prepare_draft(run_date)
+
+
+async def backfill(start: date, end: date, concurrency: int | None = None, force: bool = False):
+    """기간 백필을 실행한다."""
+    from app.backfill import backfill as run_backfill
+    from app.database import init_db
+
+    await init_db()
+    return await run_backfill(start, end, concurrency=concurrency, force=force)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.worker", description="브리핑 파이프라인 워커")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("serve", help="스케줄러 실행 (기본)")
+
+    runner = commands.add_parser("run", help="파이프라인 한 번 실행")
+    runner.add_argument(
+        "--date", type=date.fromisoformat,
+        help="실행일 YYYY-MM-DD (기본 오늘) — collect는 오늘만, 지난 날짜를 새로 만들려면 backfill",
+    )
+    runner.add_argument("--steps", nargs="+", choices=STAGES, help="실행할 단계 (기본 전체)")
+    runner.add_argument("--resume", action="store_true", help="체크포인트에서 완료된 단계 건너뛰기")
+
+    warmer = commands.add_parser("warm", help="워밍업 작업 실행")
+    warmer.add_argument("job", choices=WARMUPS)
+    warmer.add_argument("--date", type=date.fromisoformat, help="실행일 YYYY-MM-DD (기본 오늘)")
+
+    backfiller = commands.add_parser("backfill", help="기간의 과거 브리핑 만들기 (수집 → 요약 → 저장)")
+    backfiller.add_argument("start", type=date.fromisoformat, help="시작일 YYYY-MM-DD")
+    backfiller.add_argument("end", type=date.fromisoformat, help="종료일 YYYY-MM-DD (포함)")
+    backfiller.add_argument("--concurrency", type=int, help="동시에 처리할 날짜 수 (기본 BACKFILL_CONCURRENCY)")
+    backfiller.add_argument("--force", action="store_true", help="이미 있는 날짜도 다시 만들기")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        try:
+            asyncio.run(run(args.date, args.steps, args.resume))
+        except ValueError as e:
+            parser.error(str(e))
+    elif args.command == "warm":
+        asyncio.run(warm(args.job, args.date))
+    elif args.command == "backfill":
+        try:
+            report = asyncio.run(backfill(args.start, args.end, args.concurrency, args.force))
+        except ValueError as e:
+            parser.error(str(e))
+        print(
+            f"{report.requested}일: 저장 {len(report.saved)}, 건너뜀 {report.skipped}, "
+            f"실패 {len(report.failed)} ({report.elapsed:.1f}s)"
+        )
+        for day in report.failed:
+            print(f"  실패: {day}")
+        return 1 if report.failed else 0
+    else:
+        asyncio.run(serve())
+    return 0
+
+
+if __name__ == "__main__":
+    from app.logging_config import setup_logging
+
+    setup_logging()
+    sys.exit(main())
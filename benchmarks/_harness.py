@@ -0,0 +1,122 @@
+"""벤치마크 공통 유틸 — 환경 준비, 결과 출력, 기준선(baseline) 비교.
+
+모든 벤치마크는 오프라인에서 돈다. 앱 모듈은 import 시점에 Settings()를 만들기 때문에
+bootstrap_env()를 app 패키지 import 전에 먼저 호출해야 한다.
+"""
+
+import json
+import os
+import resource
+import sys
+from pathlib import Path
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+# 필수 설정값 — 실제 키는 필요 없다 (모든 외부 호출은 가짜로 대체됨)
+_DUMMY_ENV = {
+    "DART_API_KEY": "bench",
+    "ANTHROPIC_API_KEY": "bench",
+    "GEMINI_API_KEY": "bench",
+    "NAVER_CLIENT_ID": "bench",
+    "NAVER_CLIENT_SECRET": "bench",
+    "SMTP_USER": "bench@example.com",
+    "SMTP_PASSWORD": "bench",
+}
+
+
+def bootstrap_env(**overrides: str) -> None:
+    """더미 비밀값은 비어 있을 때만 채우고, 벤치마크가 지정한 값(DB/캐시/체크포인트 경로 등)은 항상 덮어쓴다.
+
+    셸에 운영 DATABASE_URL/CHECKPOINT_DIR 등이 남아 있어도 벤치마크가 실제 데이터를 건드리지 않게 한다.
+    """
+    for key, value in _DUMMY_ENV.items():
+        os.environ.setdefault(key, value)
+    if "DATABASE_URL" in overrides:
+        # 읽기 복제본 설정이 남아 있으면 읽기 엔진만 실제 DB를 가리킨다
+        overrides.setdefault("DATABASE_READ_URL", "")
+    os.environ.update(overrides)
+
+
+def peak_rss_mb() -> float:
+    """프로세스 최대 RSS (MB). 리눅스는 KB, macOS는 바이트 단위로 돌려준다."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def load_baseline(name: str) -> dict[str, float] | None:
+    path = BASELINE_DIR / f"{name}.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baseline(name: str, results: dict[str, float]) -> Path:
+    path = BASELINE_DIR / f"{name}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return path
+
+
+def compare(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    tolerance: float,
+    higher_is_better: set[str] = frozenset(),
+    noise_floor: float = 0.005,
+) -> list[str]:
+    """기준선 대비 tolerance(비율) 이상 나빠진 지표를 반환한다.
+
+    시간 지표는 noise_floor(초)보다 작은 차이는 무시한다 — 밀리초 단위 지터로 실패하지 않게.
+    """
+    regressions: list[str] = []
+    for key, value in results.items():
+        base = baseline.get(key)
+        if base is None or base == 0:
+            continue
+        if key in higher_is_better:
+            worse = value < base * (1 - tolerance)
+        else:
+            worse = value > base * (1 + tolerance) and (value - base) > noise_floor
+        if worse:
+            regressions.append(f"{key}: {base:.4g} → {value:.4g} ({(value - base) / base:+.1%})")
+    return regressions
+
+
+def print_table(title: str, rows: dict[str, float], baseline: dict[str, float] | None = None) -> None:
+    """지표 표를 출력한다. 기준선이 있으면 변화율을 함께 보여준다."""
+    print(f"\n{title}")
+    width = max(len(k) for k in rows)
+    for key, value in rows.items():
+        line = f"  {key:<{width}}  {value:>12.4f}"
+        if baseline and baseline.get(key):
+            line += f"   ({(value - baseline[key]) / baseline[key]:+.1%} vs baseline)"
+        print(line)
+
+
+def report(
+    name: str,
+    results: dict[str, float],
+    *,
+    update_baseline: bool,
+    tolerance: float,
+    higher_is_better: set[str] = frozenset(),
+) -> int:
+    """결과를 출력하고 기준선과 비교한다. 회귀가 있으면 1을 반환한다 (종료 코드용)."""
+    baseline = load_baseline(name)
+    print_table(name, results, baseline)
+
+    if update_baseline:
+        print(f"\n기준선 저장: {save_baseline(name, results)}")
+        return 0
+    if baseline is None:
+        print("\n기준선 없음 — --update-baseline 으로 저장하세요.")
+        return 0
+
+    regressions = compare(results, baseline, tolerance, higher_is_better)
+    if regressions:
+        print(f"\n회귀 감지 (허용 {tolerance:.0%}):")
+        for r in regressions:
+            print(f"  - {r}")
+        return 1
+    print(f"\n회귀 없음 (허용 {tolerance:.0%})")
+    return 0
@@ -0,0 +1,183 @@
+"""DB 프로필 벤치마크 — 파이프라인이 쓰는 동안 아카이브 읽기 지연.
+
+별도 프로세스의 쓰기 루프가 save_briefing과 같은 트랜잭션(브리핑 + 이메일 아티팩트 + 검색 색인)을 반복하는 동안
+읽기 태스크 여러 개가 아카이브 목록/상세를 조회하고, 읽기 지연 분포를 프로필별로 비교한다.
+쓰기를 다른 프로세스에 두는 것은 배포 구성(파이프라인 워커 ↔ 웹 워커)과 같게 하기 위해서다 —
+같은 이벤트 루프에 두면 잠금 경합이 아니라 루프/GIL 공유가 지연을 좌우한다.
+
+- legacy: PRAGMA 없음 (rollback 저널, synchronous=full)
+- tuned : 설정값 PRAGMA (WAL 등) + query_only 읽기 엔진
+
+    python -m benchmarks.db_bench
+    python -m benchmarks.db_bench --readers 16 --duration 30
+    python -m benchmarks.db_bench --update-baseline
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from benchmarks._harness import bootstrap_env, peak_rss_mb, report
+
+
+async def _seed(engine, past_briefings: int) -> list[str]:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from app.database import Base
+    from app.models import Briefing
+    from benchmarks.fakes import fake_briefing_html
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    body = fake_briefing_html(1200)
+    dates = [(date.today() - timedelta(days=i)).isoformat() for i in range(1, past_briefings + 1)]
+    async with async_sessionmaker(engine, class_=AsyncSession)() as db:
+        db.add_all(Briefing(date=d, title=f"{d} 주식 아침 브리핑", content_html=body, excerpt=body[:140]) for d in dates)
+        await db.commit()
+    return dates
+
+
+async def _writer(session_factory, stop, body: str) -> int:
+    """save_briefing과 같은 쓰기를 멈출 때까지 반복한다."""
+    from sqlalchemy import select
+
+    from app.email_store import build_artifact, save_artifact
+    from app.models import Briefing
+    from app.search import index_briefing
+
+    writes = 0
+    today = date.today().isoformat()
+    while not stop.is_set():
+        html = f"{body}<p>rev {writes}</p>"
+        artifact = build_artifact(today, "오늘 브리핑", html)
+        async with session_factory() as db:
+            briefing = (await db.execute(select(Briefing).where(Briefing.date == today))).scalar_one_or_none()
+            if briefing:
+                briefing.content_html = html
+            else:
+                db.add(Briefing(date=today, title="오늘 브리핑", content_html=html, excerpt=html[:140]))
+            await save_artifact(db, artifact)
+            await index_briefing(db, today, "오늘 브리핑", html)
+            await db.commit()
+        writes += 1
+        await asyncio.sleep(0)
+    return writes
+
+
+async def _reader(session_factory, stop: asyncio.Event, dates: list[str], latencies: list[float]) -> None:
+    from app.cache import invalidate_archive
+    from app.routes.archive import browse_context, render_detail
+
+    rng = random.Random(len(latencies))
+    while not stop.is_set():
+        invalidate_archive()  # 건수 캐시 없이 매번 DB를 읽게
+        started = time.perf_counter()
+        async with session_factory() as db:
+            await browse_context(db)
+            await render_detail(db, rng.choice(dates))
+        latencies.append(time.perf_counter() - started)
+
+
+def _write_engine(url: str, profile: str):
+    from app.database import create_engine_for
+
+    return create_engine_for(url, pragmas={}) if profile == "legacy" else create_engine_for(url)
+
+
+def _writer_process(url: str, profile: str, write_tokens: int, ready, stop, writes) -> None:
+    """쓰기 프로세스 진입점 — 자기 이벤트 루프에서 stop이 설정될 때까지 쓰고, 횟수를 writes에 남긴다."""
+    async def run() -> None:
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+        from benchmarks.fakes import fake_briefing_html
+
+        engine = _write_engine(url, profile)
+        ready.set()
+        writes.value = await _writer(
+            async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False), stop,
+            fake_briefing_html(write_tokens),
+        )
+        await engine.dispose()
+
+    asyncio.run(run())
+
+
+async def _run_profile(url: str, profile: str, args: argparse.Namespace) -> dict[str, float]:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from app.database import create_engine_for
+
+    seed_engine = _write_engine(url, profile)
+    dates = await _seed(seed_engine, args.past_briefings)
+    await seed_engine.dispose()
+    read_engine = create_engine_for(url, pragmas={}) if profile == "legacy" else create_engine_for(url, readonly=True)
+    read_session = async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+
+    # fork는 부모의 이벤트 루프/커넥션 상태를 물려받으므로 spawn으로 새 인터프리터를 띄운다
+    ctx = multiprocessing.get_context("spawn")
+    ready, process_stop, writes = ctx.Event(), ctx.Event(), ctx.Value("i", 0)
+    writer = ctx.Process(
+        target=_writer_process, args=(url, profile, args.write_tokens, ready, process_stop, writes), daemon=True,
+    )
+    writer.start()
+    await asyncio.to_thread(ready.wait)
+
+    stop = asyncio.Event()
+    latencies: list[float] = []
+    readers = [asyncio.create_task(_reader(read_session, stop, dates, latencies)) for _ in range(args.readers)]
+    await asyncio.sleep(args.duration)
+    stop.set()
+    process_stop.set()
+    await asyncio.gather(*readers)
+    await asyncio.to_thread(writer.join)
+    if writer.exitcode != 0:
+        raise RuntimeError(f"쓰기 프로세스 실패 (exit {writer.exitcode})")
+    await read_engine.dispose()
+    writes = writes.value
+
+    latencies.sort()
+    return {
+        f"{profile}_read_p50_ms": statistics.median(latencies) * 1000,
+        f"{profile}_read_p95_ms": latencies[int(len(latencies) * 0.95)] * 1000,
+        f"{profile}_reads_per_s": len(latencies) / args.duration,
+        f"{profile}_writes_per_s": writes / args.duration,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", nargs="+", choices=["legacy", "tuned"], default=["legacy", "tuned"])
+    parser.add_argument("--readers", type=int, default=8, help="동시 읽기 태스크 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="프로필당 측정 시간 (초) — 짧으면 프로세스 스케줄링 잡음이 차이를 덮는다")
+    parser.add_argument("--past-briefings", type=int, default=200)
+    parser.add_argument("--write-tokens", type=int, default=1500, help="쓰기 1회당 브리핑 본문 크기 (토큰)")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="허용 회귀 비율 (동시성 측정이라 넉넉하게)")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    results: dict[str, float] = {}
+    with tempfile.TemporaryDirectory(prefix="db-bench-") as tmp:
+        bootstrap_env(
+            DATABASE_URL=f"sqlite+aiosqlite:///{Path(tmp) / 'unused.db'}",
+            CACHE_DIR=str(Path(tmp) / "cache"),
+            STATIC_SITE_DIR=str(Path(tmp) / "site"),
+            CHECKPOINT_DIR=str(Path(tmp) / "checkpoints"),
+        )
+        for profile in args.profiles:
+            url = f"sqlite+aiosqlite:///{Path(tmp) / f'{profile}.db'}"
+            results.update(asyncio.run(_run_profile(url, profile, args)))
+    results["peak_rss_mb"] = peak_rss_mb()
+
+    higher = {k for k in results if k.endswith("_per_s")}
+    return report("db", results, update_baseline=args.update_baseline, tolerance=args.tolerance, higher_is_better=higher)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""오프라인 벤치마크용 가짜 외부 의존성.
+
+- UpstreamReplay: 네이버 금융/검색, DART 응답을 fixtures/upstream.json 에서 재생 (httpx.MockTransport)
+- FakeProvider:   지연 + 초당 토큰 수를 흉내내는 AiProvider
+- SmtpSink:       smtplib.SMTP 자리에 끼워 넣는 발송 기록기
+"""
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+
+import httpx
+
+FIXTURE_PATH = Path(__file__).resolve().parent / "fixtures" / "upstream.json"
+
+_RealAsyncClient = httpx.AsyncClient
+
+
+class UpstreamReplay:
+    """기록된 업스트림 응답을 재생하는 httpx 핸들러."""
+
+    def __init__(self, fixture_path: Path = FIXTURE_PATH, latency: float = 0.0):
+        self.fixtures = json.loads(fixture_path.read_text(encoding="utf-8"))
+        self.latency = latency
+        self.requests = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        host, path = request.url.host, request.url.path
+        if host == "m.stock.naver.com":
+            body = self.fixtures["naver_stock"].get(path)
+        elif host == "polling.finance.naver.com":
+            body = self.fixtures["naver_polling"].get(path.rsplit("/", 1)[-1])
+        elif host == "opendart.fss.or.kr":
+            body = self.fixtures["dart"].get(request.url.params.get("pblntf_ty", ""), {"status": "013"})
+        elif host == "openapi.naver.com":
+            query = request.url.params.get("query", "")
+            display = int(request.url.params.get("display", 10))
+            items = [
+                {**item, "title": f"[{query}] {item['title']}"}
+                for item in self.fixtures["naver_news"][:display]
+            ]
+            body = {"items": items}
+        else:
+            body = None
+
+        if body is None:
+            return httpx.Response(404, request=request)
+        return httpx.Response(200, json=body, request=request)
+
+    def client_factory(self):
+        """httpx.AsyncClient 대체 — 수집기가 만드는 모든 클라이언트가 이 핸들러를 쓰게 한다."""
+        transport = httpx.MockTransport(self.handle)
+
+        def factory(*args, **kwargs):
+            kwargs["transport"] = transport
+            return _RealAsyncClient(*args, **kwargs)
+
+        return factory
+
+
+class FakeProvider:
+    """AiProvider 대역 — 첫 토큰 지연 + 생성 속도(tokens/sec)만큼 시간을 쓴다."""
+
+    def __init__(self, latency: float = 0.3, tokens_per_sec: float = 2000.0, output_tokens: int = 1200):
+        self.latency = latency
+        self.tokens_per_sec = tokens_per_sec
+        self.output_tokens = output_tokens
+        self.calls = 0
+        self.prompt_chars = 0
+        self._lock = threading.Lock()
+
+    def call(self, system_prompt: str, user_prompt: str) -> str:
+        with self._lock:
+            self.calls += 1
+            self.prompt_chars += len(system_prompt) + len(user_prompt)
+        time.sleep(self.latency + self.output_tokens / self.tokens_per_sec)
+        return fake_briefing_html(self.output_tokens)
+
+
+def fake_briefing_html(output_tokens: int) -> str:
+    """토큰 수에 비례하는 크기의 브리핑 HTML을 결정적으로 만든다 (한글 ≈ 1.5자/토큰)."""
+    sentence = "<li><strong>삼성전자 자기주식 처분 결정</strong><br>자기주식 약 200만주를 처분하기로 했어요.</li>"
+    per_item = max(1, len(sentence) // 2)
+    items = max(1, output_tokens // per_item)
+    sections = ["📊 어제 시장 어땠나요?", "💰 외인/기관은 뭘 했나요?", "🏢 대장주는요", "📋 눈여겨볼 공시", "📰 오늘의 뉴스"]
+    per_section = max(1, items // len(sections))
+    return "\n".join(
+        f"<h2>{title}</h2>\n<p>오늘 포인트는요, <strong>반도체</strong>예요.</p>\n<ul>{sentence * per_section}</ul>"
+        for title in sections
+    )
+
+
+class SmtpSink:
+    """smtplib.SMTP 대체 — 실제 접속 없이 메시지 크기만 기록한다."""
+
+    sent = 0
+    bytes_sent = 0
+    latency = 0.0
+    _lock = threading.Lock()
+
+    def __init__(self, host: str = "", port: int = 0, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def starttls(self, *args, **kwargs):
+        pass
+
+    def login(self, user: str, password: str):
+        pass
+
+    def sendmail(self, from_addr: str, to_addrs, msg) -> dict:
+        if self.latency:
+            time.sleep(self.latency)
+        with SmtpSink._lock:
+            SmtpSink.sent += 1
+            SmtpSink.bytes_sent += len(msg)
+        return {}
+
+    def send_message(self, msg, *args, **kwargs) -> dict:
+        return self.sendmail("", [], msg.as_bytes())
+
+    @classmethod
+    def reset(cls, latency: float = 0.0) -> None:
+        cls.sent = 0
+        cls.bytes_sent = 0
+        cls.latency = latency
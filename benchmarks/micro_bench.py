@@ -0,0 +1,312 @@
+"""마이크로 벤치마크 — 데이터 크기에 비례해 느려지는 헬퍼와 쿼리의 초당 처리 횟수(ops/s)와 메모리.
+
+    python -m benchmarks.micro_bench
+    python -m benchmarks.micro_bench --only prompt archive
+    python -m benchmarks.micro_bench --update-baseline
+
+- 헬퍼: _build_prompt, _style_content_html, _strip_html, _strip_code_block, render_email
+- 중복 제거 루프: fetch_stock_news(제목 기준), DART 공시 병합(rcept_no 기준) — 네트워크 호출은 가짜로 대체
+- 쿼리: 아카이브 목록(첫 페이지/깊은 페이지/커서), 검색(trigram MATCH/짧은 검색어 LIKE), 발송 대상/관심 종목 조회
+
+DB 픽스처(기본: 브리핑 10,000건, 구독자 100,000명)는 임시 디렉터리의 SQLite에 매번 새로 만든다.
+지표: <케이스>_ops (높을수록 좋음, timeit 최솟값 기준), <케이스>_peak_kb (tracemalloc 최대 할당량).
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable
+from unittest.mock import patch
+
+from benchmarks._harness import bootstrap_env, peak_rss_mb, report
+
+GROUPS = ("prompt", "email", "news", "dedup", "archive", "search", "subscribers")
+
+_CORPS = ["삼성전자", "SK하이닉스", "LG에너지솔루션", "현대차", "NAVER", "카카오", "셀트리온", "기아", "POSCO홀딩스", "KB금융"]
+_REPORTS = ["주요사항보고서(자기주식처분결정)", "임원ㆍ주요주주특정증권등소유상황보고서", "분기보고서 (2025.09)", "단일판매ㆍ공급계약체결"]
+
+
+# ── 픽스처 생성 (시드 고정 — 실행마다 같은 입력) ──
+
+
+def _market():
+    from app.collector.market import IndexData, InvestorData, MarketSummary, StockData
+
+    return MarketSummary(
+        date="2025-10-17",
+        kospi=IndexData(name="코스피", close="3,748.37", change="+35.12", change_pct="0.95", direction="상승"),
+        kosdaq=IndexData(name="코스닥", close="859.49", change="-2.31", change_pct="-0.27", direction="하락"),
+        kospi_top10=[
+            StockData(name=n, close=f"{70_000 + i * 1_000:,}", change_pct="1.20", direction="상승", volume="12,345,678")
+            for i, n in enumerate(_CORPS)
+        ],
+        kospi_investor=InvestorData(personal="-1,234", foreign="+2,345", institutional="-1,111"),
+        kosdaq_investor=InvestorData(personal="+321", foreign="-210", institutional="-111"),
+    )
+
+
+def _dart_items(count: int, rng: random.Random) -> list[dict]:
+    """DART list.json 항목 — 유형별 조회 결과가 겹치는 만큼(약 25%) rcept_no가 중복된다."""
+    unique = int(count * 0.75)
+    return [
+        {
+            "corp_name": rng.choice(_CORPS),
+            "report_nm": rng.choice(_REPORTS),
+            "rcept_dt": "20251017",
+            "rcept_no": f"20251017{(i % unique):06d}",
+            "flr_nm": rng.choice(_CORPS),
+        }
+        for i in range(count)
+    ]
+
+
+def _raw_news_text(rng: random.Random) -> str:
+    """네이버 검색 API가 주는 형태 — <b> 강조 태그와 HTML 엔티티가 섞인 문장."""
+    corp = rng.choice(_CORPS)
+    return (
+        f"<b>{corp}</b>, 3분기 영업이익 &quot;시장 예상 상회&quot;&amp; 주가 <b>강세</b> "
+        f"&lt;반도체&gt; 업황 회복 기대감에 외국인 순매수 이어져 {rng.randint(1, 99)}일째"
+    )
+
+
+def _news(count: int, rng: random.Random):
+    from app.collector.news import NewsArticle
+
+    return [
+        NewsArticle(
+            title=f"{rng.choice(_CORPS)} 관련 기사 {i % (count // 2 or 1)}",  # 절반 정도는 다른 검색어에서 다시 나온다
+            description=_raw_news_text(rng),
+            link=f"https://news.example.com/{i}",
+            pub_date="Fri, 17 Oct 2025 07:00:00 +0900",
+        )
+        for i in range(count)
+    ]
+
+
+def _disclosures(count: int, rng: random.Random):
+    from app.collector.dart import Disclosure
+
+    return [
+        Disclosure(
+            corp_name=d["corp_name"], report_nm=d["report_nm"], rcept_dt=d["rcept_dt"],
+            rcept_no=d["rcept_no"], flr_nm=d["flr_nm"],
+        )
+        for d in _dart_items(count, rng)
+    ]
+
+
+# ── 측정 ──
+
+
+def _ops(fn: Callable[[], object], repeat: int) -> float:
+    timer = timeit.Timer(fn)
+    number = timer.autorange()[0]
+    return number / min(timer.repeat(repeat=repeat, number=number))
+
+
+def _peak_kb(fn: Callable[[], object]) -> float:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def _measure(cases: dict[str, Callable[[], object]], repeat: int) -> dict[str, float]:
+    results: dict[str, float] = {}
+    for name, fn in cases.items():
+        fn()  # 워밍업 (정규식 컴파일, 템플릿 로드, SQLite 페이지 캐시)
+        results[f"{name}_ops"] = _ops(fn, repeat)
+        results[f"{name}_peak_kb"] = _peak_kb(fn)
+        print(f"  {name}: {results[f'{name}_ops']:,.1f} ops/s, {results[f'{name}_peak_kb']:,.0f}KB")
+    return results
+
+
+# ── 케이스 ──
+
+
+def _helper_cases(groups: set[str], args: argparse.Namespace, rng: random.Random) -> dict[str, Callable[[], object]]:
+    from app.collector.news import _strip_html
+    from app.email_template import _style_content_html, render_email
+    from app.summarizer import _build_prompt, _strip_code_block
+    from benchmarks.fakes import fake_briefing_html
+
+    cases: dict[str, Callable[[], object]] = {}
+    if "prompt" in groups:
+        market = _market()
+        disclosures = _disclosures(args.disclosures, rng)
+        news = _news(10, rng)
+        stock_news = {name: _news(5, rng) for name in _CORPS}
+        notes = [f"- [{d.corp_name}] {d.report_nm} (수급 영향)" for d in disclosures[:200]]
+        cases["build_prompt"] = lambda: _build_prompt(market, disclosures, news, stock_news)
+        cases["build_prompt_notes"] = lambda: _build_prompt(market, disclosures, news, stock_news, notes)
+        fenced = "```html\n" + fake_briefing_html(args.briefing_tokens) + "\n```"
+        cases["strip_code_block"] = lambda: _strip_code_block(fenced)
+    if "email" in groups:
+        html = fake_briefing_html(args.briefing_tokens)
+        watchlist = _style_content_html(fake_briefing_html(300))
+        cases["style_content_html"] = lambda: _style_content_html(html)
+        cases["render_email"] = lambda: render_email("2025-10-17 주식 아침 브리핑", html, watchlist)
+    if "news" in groups:
+        texts = [_raw_news_text(rng) for _ in range(1_000)]
+        cases["strip_html_x1000"] = lambda: [_strip_html(t) for t in texts]
+    return cases
+
+
+def _dedup_cases(args: argparse.Namespace, rng: random.Random, loop: asyncio.AbstractEventLoop) -> dict[str, Callable[[], object]]:
+    from app.collector import dart, news
+
+    articles = _news(args.news, rng)
+
+    async def fake_fetch_news(query: str = "", count: int = 5):
+        return articles
+
+    items = _dart_items(args.disclosures, rng)
+    per_type = [items[i::len(dart.DISCLOSURE_TYPES)] for i in range(len(dart.DISCLOSURE_TYPES))]
+
+    async def fake_fetch_by_type(client, base_params, pblntf_ty, max_pages=1, limiter=None):
+        return per_type[dart.DISCLOSURE_TYPES.index(pblntf_ty)]
+
+    def stock_news() -> object:
+        with patch.object(news, "fetch_news", fake_fetch_news):
+            return loop.run_until_complete(news.fetch_stock_news())
+
+    def disclosures() -> object:
+        with patch.object(dart, "_fetch_by_type", fake_fetch_by_type):
+            return loop.run_until_complete(dart._fetch_disclosures(None, date(2025, 10, 17), None, None))
+
+    return {"dedup_stock_news": stock_news, "dedup_disclosures": disclosures}
+
+
+async def _seed(briefings: int, subscribers: int, rng: random.Random) -> list[str]:
+    """브리핑/구독자/관심 종목을 대량으로 넣고 검색 색인을 만든다. 브리핑 날짜(최신순)를 반환한다."""
+    from sqlalchemy import insert, select
+
+    from app.database import engine, init_db
+    from app.models import Briefing, Subscriber, SubscriberTicker
+    from app.search import sync_search_index
+    from benchmarks.fakes import fake_briefing_html
+
+    await init_db()
+    started = time.perf_counter()
+    body = fake_briefing_html(1500)
+    dates = [(date(2025, 10, 17) - timedelta(days=i)).isoformat() for i in range(briefings)]
+    async with engine.begin() as conn:
+        await conn.execute(insert(Briefing), [
+            {
+                "date": d,
+                "title": f"{d} 주식 아침 브리핑",
+                # 날짜마다 주제 문장이 달라야 검색 결과 수가 현실적으로 나온다
+                "content_html": f"<p>{rng.choice(_CORPS)} {rng.choice(_REPORTS)} 금리 동결</p>{body}",
+                "excerpt": f"{rng.choice(_CORPS)} 관련 브리핑",
+            }
+            for d in dates
+        ])
+        await conn.execute(insert(Subscriber), [
+            {"email": f"user{i}@example.com", "is_active": i % 10 != 0} for i in range(subscribers)
+        ])
+        ids = (await conn.execute(select(Subscriber.id))).scalars().all()
+        await conn.execute(insert(SubscriberTicker), [
+            {"subscriber_id": sid, "ticker": ticker}
+            for sid in ids if sid % 5 == 0  # 구독자 5명 중 1명이 관심 종목 등록
+            for ticker in rng.sample(_CORPS, 3)
+        ])
+        await conn.run_sync(sync_search_index)
+    print(f"  픽스처: 브리핑 {briefings:,}건, 구독자 {subscribers:,}명 ({time.perf_counter() - started:.1f}s)")
+    return dates
+
+
+def _db_cases(
+    groups: set[str], dates: list[str], loop: asyncio.AbstractEventLoop,
+) -> dict[str, Callable[[], object]]:
+    from sqlalchemy import select
+
+    from app.cache import invalidate_archive
+    from app.database import async_session
+    from app.models import Subscriber
+    from app.personalize import load_watchlists
+    from app.routes.archive import PAGE_SIZE, browse_context
+    from app.search import search_briefings
+
+    def run(query: Callable) -> Callable[[], object]:
+        async def once():
+            invalidate_archive()  # 건수 캐시 없이 매번 DB를 읽게
+            async with async_session() as db:
+                return await query(db)
+        return lambda: loop.run_until_complete(once())
+
+    async def active_emails(db):
+        rows = await db.execute(select(Subscriber.email).where(Subscriber.is_active == True))
+        return [row[0] for row in rows.all()]
+
+    deep_page = len(dates) // PAGE_SIZE // 2
+    cases: dict[str, Callable[[], object]] = {}
+    if "archive" in groups:
+        cases["archive_first_page"] = run(lambda db: browse_context(db))
+        cases["archive_deep_offset"] = run(lambda db: browse_context(db, page=deep_page))
+        cases["archive_deep_keyset"] = run(lambda db: browse_context(db, page=deep_page, before=dates[deep_page * PAGE_SIZE]))
+    if "search" in groups:
+        cases["search_match"] = run(lambda db: search_briefings(db, "삼성전자 자기주식", limit=PAGE_SIZE))
+        cases["search_short_like"] = run(lambda db: search_briefings(db, "금리", limit=PAGE_SIZE))
+    if "subscribers" in groups:
+        cases["subscribers_active_emails"] = run(active_emails)
+        cases["subscribers_watchlists"] = run(load_watchlists)
+    return cases
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="+", choices=GROUPS, default=list(GROUPS), help="측정할 그룹")
+    parser.add_argument("--briefings", type=int, default=10_000, help="아카이브 브리핑 수")
+    parser.add_argument("--subscribers", type=int, default=100_000)
+    parser.add_argument("--disclosures", type=int, default=4_000, help="공시 원본 건수 (중복 포함, 4개 유형 합계)")
+    parser.add_argument("--news", type=int, default=100, help="검색어 하나당 뉴스 수 (중복 제거 루프 입력)")
+    parser.add_argument("--briefing-tokens", type=int, default=20_000, help="큰 브리핑 본문 크기 (토큰)")
+    parser.add_argument("--repeat", type=int, default=5, help="timeit 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+    groups = set(args.only)
+
+    results: dict[str, float] = {}
+    with tempfile.TemporaryDirectory(prefix="micro-bench-") as tmp:
+        bootstrap_env(
+            DATABASE_URL=f"sqlite+aiosqlite:///{Path(tmp) / 'micro.db'}",
+            CACHE_DIR=str(Path(tmp) / "cache"),
+            STATIC_SITE_DIR=str(Path(tmp) / "site"),
+            CHECKPOINT_DIR=str(Path(tmp) / "checkpoints"),
+            TELEMETRY_ENABLED="false",
+        )
+        rng = random.Random(47)
+        loop = asyncio.new_event_loop()
+        try:
+            cases = _helper_cases(groups, args, rng)
+            if "dedup" in groups:
+                cases.update(_dedup_cases(args, rng, loop))
+            if groups & {"archive", "search", "subscribers"}:
+                dates = loop.run_until_complete(_seed(args.briefings, args.subscribers, rng))
+                cases.update(_db_cases(groups, dates, loop))
+            results.update(_measure(cases, args.repeat))
+        finally:
+            from app.database import engine, read_engine
+
+            loop.run_until_complete(engine.dispose())
+            if read_engine is not engine:
+                loop.run_until_complete(read_engine.dispose())
+            loop.close()
+    results["peak_rss_mb"] = peak_rss_mb()
+
+    higher = {k for k in results if k.endswith("_ops")}
+    return report("micro", results, update_baseline=args.update_baseline, tolerance=args.tolerance, higher_is_better=higher)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
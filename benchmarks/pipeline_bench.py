@@ -0,0 +1,132 @@
+"""run_pipeline 오프라인 엔드투엔드 벤치마크.
+
+실제 네이버/DART/Claude/SMTP 없이 단계별(collect/summarize/save/send) 벽시계 시간과
+최대 RSS를 측정하고, 저장된 기준선과 비교한다.
+
+    python -m benchmarks.pipeline_bench                      # 측정 + 기준선 비교
+    python -m benchmarks.pipeline_bench --update-baseline    # 기준선 갱신
+    python -m benchmarks.pipeline_bench --llm-latency 2 --llm-tps 60 --subscribers 5000
+"""
+
+import argparse
+import asyncio
+import functools
+import inspect
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+
+from benchmarks._harness import bootstrap_env, peak_rss_mb, report
+from benchmarks.fakes import FakeProvider, SmtpSink, UpstreamReplay
+
+STAGES = ("collect_data", "summarize", "save_briefing", "send_emails", "publish_site")
+
+
+def _timed(fn, timings: dict[str, list[float]]):
+    """단계 함수를 감싸서 소요 시간을 기록한다 (동기/비동기 모두 지원)."""
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                timings[fn.__name__].append(time.perf_counter() - started)
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            timings[fn.__name__].append(time.perf_counter() - started)
+    return wrapper
+
+
+async def _seed(subscribers: int, past_briefings: int) -> None:
+    """벤치마크용 SQLite에 구독자와 과거 브리핑을 채운다."""
+    from datetime import date, timedelta
+
+    from app.database import async_session, init_db
+    from app.models import Briefing, Subscriber
+    from benchmarks.fakes import fake_briefing_html
+
+    await init_db()
+    async with async_session() as db:
+        db.add_all(Subscriber(email=f"user{i}@example.com") for i in range(subscribers))
+        body = fake_briefing_html(1200)
+        for i in range(1, past_briefings + 1):
+            day = date.today() - timedelta(days=i)
+            db.add(Briefing(date=day.isoformat(), title=f"{day} 주식 아침 브리핑", content_html=body))
+        await db.commit()
+
+
+async def _run(args: argparse.Namespace) -> dict[str, float]:
+    import app.pipeline as pipeline
+
+    await _seed(args.subscribers, args.past_briefings)
+
+    upstream = UpstreamReplay(latency=args.upstream_latency)
+    provider = FakeProvider(args.llm_latency, args.llm_tps, args.llm_tokens)
+    timings: dict[str, list[float]] = {name: [] for name in STAGES}
+    totals: list[float] = []
+
+    with ExitStack() as stack:
+        stack.enter_context(patch.object(httpx, "AsyncClient", upstream.client_factory()))
+        stack.enter_context(patch("app.summarizer._get_provider", return_value=provider))
+        stack.enter_context(patch("app.summarizer._get_map_provider", return_value=provider))
+        stack.enter_context(patch("app.email_sender.smtplib.SMTP", SmtpSink))
+        for name in STAGES:
+            stack.enter_context(patch.object(pipeline, name, _timed(getattr(pipeline, name), timings)))
+
+        for _ in range(args.repeat):
+            SmtpSink.reset(latency=args.smtp_latency)
+            started = time.perf_counter()
+            await pipeline.run_pipeline()
+            totals.append(time.perf_counter() - started)
+
+    print(
+        f"업스트림 요청 {upstream.requests // args.repeat}건/회, LLM 호출 {provider.calls // args.repeat}회/회, "
+        f"메일 {SmtpSink.sent}통 ({SmtpSink.bytes_sent / 1024:.0f}KB)"
+    )
+    results = {f"{name}_s": statistics.median(values) for name, values in timings.items()}
+    results["total_s"] = statistics.median(totals)
+    results["peak_rss_mb"] = peak_rss_mb()
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (중앙값 사용)")
+    parser.add_argument("--llm-latency", type=float, default=0.3, help="LLM 첫 토큰 지연 (초)")
+    parser.add_argument("--llm-tps", type=float, default=2000.0, help="LLM 생성 속도 (tokens/sec)")
+    parser.add_argument("--llm-tokens", type=int, default=1200, help="LLM 출력 토큰 수")
+    parser.add_argument("--upstream-latency", type=float, default=0.02, help="업스트림 API 응답 지연 (초)")
+    parser.add_argument("--smtp-latency", type=float, default=0.0, help="메일 1통당 SMTP 지연 (초)")
+    parser.add_argument("--subscribers", type=int, default=200)
+    parser.add_argument("--past-briefings", type=int, default=30)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="허용 회귀 비율")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="pipeline-bench-") as tmp:
+        bootstrap_env(
+            DATABASE_URL=f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}",
+            CACHE_DIR=str(Path(tmp) / "cache"),
+            STATIC_SITE_DIR=str(Path(tmp) / "site"),
+            CHECKPOINT_DIR=str(Path(tmp) / "checkpoints"),
+        )
+        results = asyncio.run(_run(args))
+
+    return report("pipeline", results, update_baseline=args.update_baseline, tolerance=args.tolerance)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
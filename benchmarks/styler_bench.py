@@ -0,0 +1,80 @@
+"""_style_content_html 벤치마크 — 단일 패스 스타일러 vs 기존 정규식 체인.
+
+    python -m benchmarks.styler_bench
+    python -m benchmarks.styler_bench --update-baseline
+
+같은 입력에 대해 두 구현의 출력이 같은지도 함께 확인한다 (속성 없는 태그 기준).
+"""
+
+import argparse
+import re
+import sys
+import timeit
+
+from benchmarks._harness import bootstrap_env, report
+
+
+def _legacy_style_content_html(html: str) -> str:
+    """교체 전 구현 (정규식/replace 5회 스캔) — 비교 기준용으로만 남겨둔다."""
+    html = re.sub(
+        r'<h2>(.*?)</h2>',
+        r'<table cellpadding="0" cellspacing="0" border="0" width="100%" style="margin-top: 28px; margin-bottom: 14px;">'
+        r'<tr><td style="width: 4px; background-color: #3182F6; border-radius: 2px;"></td>'
+        r'<td style="padding-left: 12px; font-size: 17px; font-weight: 700; color: #FFFFFF; line-height: 1.4;">\1</td>'
+        r'</tr></table>',
+        html,
+    )
+    html = html.replace('<ul>', '<ul style="list-style: none; padding: 0; margin: 0 0 8px 0;">')
+    html = re.sub(
+        r'<li(?:\s[^>]*)?>',
+        '<li style="background-color: rgba(255,255,255,0.06); border: 1px solid rgba(255,255,255,0.05); border-radius: 12px; padding: 14px 16px; margin-bottom: 10px; font-size: 14px; line-height: 1.75; color: rgba(255,255,255,0.75);">',
+        html,
+    )
+    html = html.replace('<strong>', '<strong style="color: #FFFFFF; font-weight: 700;">')
+    html = re.sub(
+        r'<p(?:\s[^>]*)?>',
+        '<p style="font-size: 14px; line-height: 1.75; color: rgba(255,255,255,0.65); margin: 0 0 12px 0;">',
+        html,
+    )
+    return html
+
+
+SIZES = {"small": 1_200, "large": 20_000, "huge": 200_000}  # 출력 토큰 수 기준
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=0, help="반복 횟수 (0이면 자동)")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    bootstrap_env()
+    from app.email_template import _style_content_html
+    from benchmarks.fakes import fake_briefing_html
+
+    results: dict[str, float] = {}
+    for label, tokens in SIZES.items():
+        html = fake_briefing_html(tokens)
+        if _style_content_html(html) != _legacy_style_content_html(html):
+            print(f"출력 불일치: {label}")
+            return 1
+
+        for impl, fn in [("single_pass", _style_content_html), ("legacy", _legacy_style_content_html)]:
+            timer = timeit.Timer(lambda: fn(html))
+            number = args.number or timer.autorange()[0]
+            best = min(timer.repeat(repeat=5, number=number)) / number
+            results[f"{impl}_{label}_ops"] = 1 / best
+        print(f"{label}: {len(html) / 1024:.0f}KB, 단일 패스 {results[f'single_pass_{label}_ops'] / results[f'legacy_{label}_ops']:.2f}배")
+
+    return report(
+        "styler",
+        results,
+        update_baseline=args.update_baseline,
+        tolerance=args.tolerance,
+        higher_is_better=set(results),
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
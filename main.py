@@ -1,18 +1,27 @@
-"""Stock Briefing - AI 주식 아침 브리핑 서비스."""
+"""Stock Briefing - AI 주식 아침 브리핑 서비스.
+
+웹 프로세스는 라우트/DB/템플릿만 import한다. 파이프라인(수집기, AI SDK, tenacity, APScheduler)은
+scheduler_enabled=true일 때 lifespan에서만 불러온다 — SCHEDULER_ENABLED=false인 웹 전용 워커는
+API 키 없이 빠르게 뜨고 재시작된다 (tests/test_startup.py가 import 시간과 모듈 목록을 확인).
+"""
 
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse
-from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from starlette.datastructures import Headers
 
+from app.config import PIPELINE_GROUPS, settings
 from app.logging_config import setup_logging
 from app.database import init_db
+from app.publisher import PublishedSiteMiddleware
 from app.routes.subscribe import router as subscribe_router
-from app.routes.archive import router as archive_router
-from app.scheduler import start_scheduler
+from app.routes.archive import accepts_gzip, router as archive_router
+from app.routes.admin import router as admin_router
+from app.routes.metrics import router as metrics_router
 
 setup_logging()
 
@@ -20,15 +29,43 @@ setup_logging()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db()
-    scheduler = start_scheduler()
+    leader = None
+    if settings.scheduler_enabled:
+        from app.leader import SchedulerLeader
+        from app.scheduler import catch_up, start_scheduler
+
+        settings.require(*PIPELINE_GROUPS)
+        # 워커가 여러 개여도 DB 임대를 잡은 리더 하나만 예약 작업을 돌린다
+        leader = SchedulerLeader(start_scheduler, on_elected=catch_up)
+        await leader.start()
     yield
-    scheduler.shutdown()
+    if leader:
+        await leader.stop()
+
+
+class NegotiatedGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware는 Accept-Encoding에 "gzip" 문자열만 있으면 압축한다 — q=0(거부)도 따진다."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and not accepts_gzip(Headers(scope=scope).get("accept-encoding", "")):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
 
 
 app = FastAPI(title="Stock Briefing", lifespan=lifespan)
 
 app.include_router(subscribe_router)
 app.include_router(archive_router)
+app.include_router(admin_router)
+app.include_router(metrics_router)
+
+# 동적 페이지(검색/목록)는 응답 시 압축 — 이미 Content-Encoding이 붙은 응답은 건드리지 않는다
+app.add_middleware(NegotiatedGZipMiddleware, minimum_size=1024, compresslevel=6)
+
+# 미리 내보낸 정적 페이지가 있으면 라우터보다 먼저 응답
+if settings.static_site_dir:
+    app.add_middleware(PublishedSiteMiddleware, directory=settings.static_site_dir)
 
 _templates = Jinja2Templates(directory="templates")
 
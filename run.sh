@@ -14,6 +14,7 @@ case "$1" in
   stop)
     pkill -f "stock-briefing/.venv/bin/python main.py" 2>/dev/null
     pkill -f "stock-briefing/.venv/bin/uvicorn" 2>/dev/null
+    pkill -f "stock-briefing/.venv/bin/python -m app.worker" 2>/dev/null
     echo "서버 종료"
     ;;
   restart)
@@ -27,7 +28,12 @@ case "$1" in
   log)
     tail -f server.log
     ;;
+  worker)
+    # 파이프라인 전용 프로세스 — 이때 웹은 SCHEDULER_ENABLED=false로 띄운다
+    nohup .venv/bin/python -m app.worker serve > worker.log 2>&1 &
+    echo "워커 시작 (PID: $!)"
+    ;;
   *)
-    echo "사용법: ./run.sh {start|stop|restart|status|log}"
+    echo "사용법: ./run.sh {start|stop|restart|status|log|worker}"
     ;;
 esac
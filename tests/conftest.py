@@ -3,10 +3,13 @@
 conftest.py에 정의한 fixture는 같은 디렉토리의 모든 테스트에서 사용할 수 있다.
 """
 
+from unittest.mock import patch
+
 import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
+from app.config import SETTING_GROUPS, settings
 from app.database import Base, get_db
 from app.models import Subscriber, Briefing
 
@@ -35,3 +38,22 @@ async def db_session():
 @pytest.fixture
 def anyio_backend():
     return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def dummy_secrets(monkeypatch):
+    """API 키/SMTP 계정이 없는 환경에서도 스위트가 돌도록 비어 있는 필수 설정에 가짜 값을 넣는다.
+
+    외부 호출은 테스트마다 막혀 있으므로 값 자체는 쓰이지 않는다. 검증(require)은 test_startup이 따로 본다.
+    """
+    for names in SETTING_GROUPS.values():
+        for name in names:
+            if not getattr(settings, name):
+                monkeypatch.setattr(settings, name, f"test-{name}")
+
+
+@pytest.fixture(autouse=True)
+def no_telemetry():
+    """실행 기록은 기본으로 끈다 (실제 DB에 쓰지 않게). 기록을 검증하는 테스트만 켠다."""
+    with patch.object(settings, "telemetry_enabled", False):
+        yield
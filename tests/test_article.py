@@ -0,0 +1,96 @@
+"""기사 본문 수집기 테스트."""
+
+import httpx
+import pytest
+
+from app.collector.article import ArticleTextParser, enrich_articles, fetch_article_text
+from app.collector.news import NewsArticle
+from app.config import settings
+
+PARAGRAPH = "삼성전자 주가가 외국인 순매수에 힘입어 3거래일 연속 상승했다. 반도체 업황 회복 기대가 커졌다."
+
+PAGE = f"""<html><head><title>기사</title><script>var x = "{PARAGRAPH}";</script></head>
+<body><nav><a href="/">홈</a> <a href="/economy">경제 섹션으로 이동하기 위한 아주 긴 메뉴 링크 텍스트</a></nav>
+<article><h1>짧은 제목</h1><p>{PARAGRAPH}</p><div>{PARAGRAPH}<br>기자 홍길동</div></article>
+<footer>Copyright 언론사. All rights reserved. 무단 전재 및 재배포 금지.</footer></body></html>"""
+
+
+def _parse(html: str, max_chars: int = 2000, chunk: int = 7) -> str:
+    parser = ArticleTextParser(max_chars)
+    for i in range(0, len(html), chunk):  # 태그 중간에서 잘려도 이어서 파싱한다
+        parser.feed(html[i:i + chunk])
+    parser.close()
+    return parser.text()
+
+
+def test_parser_keeps_body_paragraphs_only():
+    """스크립트/메뉴/푸터와 짧은 잡문은 빠지고 본문 문단만 남는다."""
+    assert _parse(PAGE) == f"{PARAGRAPH}\n{PARAGRAPH}"
+
+
+def test_parser_stops_at_max_chars():
+    parser = ArticleTextParser(max_chars=60)
+    parser.feed(f"<p>{PARAGRAPH}</p>" * 100)
+    assert parser.done
+    assert len(parser.text()) == 60
+
+
+def _streaming_transport(pulled: list[int], chunks: int, charset: str = "utf-8") -> httpx.MockTransport:
+    async def body():
+        for i in range(chunks):
+            pulled.append(i)
+            yield f"<p>{PARAGRAPH}</p>".encode(charset)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "missing" in request.url.path:
+            return httpx.Response(404)
+        return httpx.Response(200, headers={"content-type": f"text/html; charset={charset}"}, content=body())
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_fetch_stops_streaming_when_enough_text(monkeypatch):
+    """본문 한도가 차면 나머지 응답은 받지 않는다 (거대한 페이지도 메모리/시간이 일정)."""
+    monkeypatch.setattr(settings, "article_max_chars", 200)
+    pulled: list[int] = []
+    async with httpx.AsyncClient(transport=_streaming_transport(pulled, chunks=10_000, charset="euc-kr")) as client:
+        text = await fetch_article_text(client, "https://news.example.com/1")
+
+    assert text.startswith(PARAGRAPH)  # EUC-KR도 헤더 charset으로 디코딩
+    assert len(text) == 200
+    assert len(pulled) < 10
+
+
+@pytest.mark.asyncio
+async def test_fetch_respects_byte_cap(monkeypatch):
+    monkeypatch.setattr(settings, "article_max_bytes", 500)
+    pulled: list[int] = []
+    async with httpx.AsyncClient(transport=_streaming_transport(pulled, chunks=10_000)) as client:
+        text = await fetch_article_text(client, "https://news.example.com/1")
+
+    # 문단 하나가 약 150바이트 — 500바이트에서 끊기고 잘린 넷째 문단은 받은 데까지만
+    assert text.count(PARAGRAPH) == 3
+    assert len(pulled) == 4
+
+
+@pytest.mark.asyncio
+async def test_enrich_articles_fills_body_and_caches_by_url(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "cache_dir", str(tmp_path))
+    pulled: list[int] = []
+    transport = _streaming_transport(pulled, chunks=1)
+    monkeypatch.setattr("app.collector.article.http_client", lambda **kw: httpx.AsyncClient(transport=transport))
+    shared = NewsArticle("공통 기사", "요약", "https://news.example.com/1", "d")
+    broken = NewsArticle("없는 기사", "요약", "https://news.example.com/missing", "d")
+    malformed = NewsArticle("깨진 링크", "요약", "ht!tp://news.example.com/2", "d")
+    invalid = NewsArticle("잘못된 URL", "요약", "https://news.example.com/a b\x00", "d")
+    stock_news = {"삼성전자": [shared, broken, malformed], "SK하이닉스": [shared, invalid]}
+
+    enriched = await enrich_articles(stock_news)
+    assert enriched["삼성전자"][0].body == PARAGRAPH
+    assert enriched["삼성전자"][1:] == [broken, malformed]  # 실패한 기사는 그대로
+    assert enriched["SK하이닉스"][1] is invalid
+    assert enriched["SK하이닉스"][0].body == PARAGRAPH
+    assert len(pulled) == 1  # 같은 링크는 한 번만 받는다
+
+    await enrich_articles(stock_news)
+    assert len(pulled) == 1  # URL 캐시
@@ -0,0 +1,153 @@
+"""과거 아카이브 백필 테스트."""
+
+import asyncio
+import time
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pandas as pd
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import undefer
+
+from app.backfill import backfill, backfill_dates
+from app.cache import FileCache
+from app.checkpoint import RunCheckpoint
+from app.collector.history import MarketHistory
+from app.collector.market import MarketSummary
+from app.config import settings
+from app.models import Briefing
+from app.ratelimit import RateLimiter
+
+
+def _fake_krx() -> MagicMock:
+    """2025-02-06(목), 02-07(금) 두 거래일만 있는 pykrx."""
+    days = pd.to_datetime(["2025-02-06", "2025-02-07"])
+    krx = MagicMock()
+    krx.get_index_ohlcv_by_date.side_effect = lambda f, t, ticker, name_display: pd.DataFrame(
+        {"종가": [2500.0, 2525.0] if ticker == "1001" else [700.0, 693.0]}, index=days,
+    )
+    krx.get_market_trading_value_by_date.return_value = pd.DataFrame(
+        {"개인": [1.5e10, -2.3e11], "외국인합계": [0.0, 1.2e11], "기관합계": [-1.5e10, 1.1e11]}, index=days,
+    )
+    tickers = [f"{i:06d}" for i in range(12)]
+    krx.get_market_cap.return_value = pd.DataFrame(
+        {"종가": [1000 * (i + 1) for i in range(12)], "시가총액": list(range(12)), "거래량": [10] * 12}, index=tickers,
+    )
+    krx.get_market_ohlcv.return_value = pd.DataFrame({"등락률": [1.5] * 12}, index=tickers)
+    krx.get_market_ticker_name.side_effect = lambda t: f"종목{t[-2:]}"
+    return krx
+
+
+def test_backfill_dates_skips_sundays():
+    dates = backfill_dates(date(2025, 2, 7), date(2025, 2, 10))  # 금~월
+    assert dates == [date(2025, 2, 7), date(2025, 2, 8), date(2025, 2, 10)]
+
+
+@pytest.mark.asyncio
+async def test_market_history_summary_uses_previous_trading_day(tmp_path):
+    """토요일과 월요일 실행은 같은 금요일 시세를 쓰고, 시총 TOP10은 한 번만 조회한다."""
+    krx = _fake_krx()
+    with patch("app.collector.history.stock", krx):
+        history = MarketHistory(date(2025, 2, 8), date(2025, 2, 10), cache=FileCache("krx", root=tmp_path))
+        await history.load()
+        saturday, monday = await asyncio.gather(
+            history.summary_for(date(2025, 2, 8)), history.summary_for(date(2025, 2, 10)),
+        )
+
+    assert saturday == monday
+    assert monday.date == "2025-02-07"
+    assert monday.kospi.close == "2,525.00"
+    assert monday.kospi.change_pct == "1.00"
+    assert monday.kosdaq.direction == "하락"
+    assert monday.kospi_investor.personal == "-2,300"
+    assert [s.name for s in monday.kospi_top10][:2] == ["종목11", "종목10"]
+    assert len(monday.kospi_top10) == 10
+    assert krx.get_market_cap.call_count == 1
+
+    with pytest.raises(LookupError):
+        await history.summary_for(date(2025, 2, 6))
+
+
+@pytest.mark.asyncio
+async def test_backfill_skips_existing_dates(db_session, tmp_path):
+    """이미 있는 날짜는 건너뛰고, 나머지는 각 날짜의 시세/전일 공시로 요약해 저장한다."""
+    db_session.add(Briefing(date="2025-02-08", title="기존", content_html="<p>기존</p>", excerpt=""))
+    await db_session.commit()
+
+    history = MagicMock(spec=MarketHistory)
+    history.summary_for = AsyncMock(side_effect=lambda d: MarketSummary(date=f"{d} 직전 거래일"))
+    with (
+        patch.object(settings, "checkpoint_dir", str(tmp_path)),
+        patch("app.backfill.async_session", async_sessionmaker(db_session.bind, expire_on_commit=False)),
+        patch("app.backfill.MarketHistory", return_value=history),
+        patch("app.backfill.fetch_disclosures", new_callable=AsyncMock, return_value=[]) as disclosures,
+        patch("app.pipeline.generate_briefing", return_value="<h2>요약</h2>"),
+        patch("app.backfill.save_briefing", new_callable=AsyncMock) as save,
+        patch("app.backfill.publish_site", new_callable=AsyncMock) as publish,
+    ):
+        report = await backfill(date(2025, 2, 7), date(2025, 2, 10), concurrency=2)
+
+    assert report.requested == 3
+    assert report.skipped == 1
+    assert report.saved == ["2025-02-07", "2025-02-10"]
+    assert sorted(c.args[0] for c in disclosures.await_args_list) == [date(2025, 2, 6), date(2025, 2, 9)]
+    saved = {c.args[1]: c.args[0] for c in save.await_args_list}
+    assert saved[date(2025, 2, 10)].title.startswith("2025년 02월 10일")
+    publish.assert_awaited_once_with(["2025-02-07", "2025-02-10"])
+
+
+@pytest.mark.asyncio
+async def test_backfill_force_regenerates_checkpointed_briefing(db_session, tmp_path):
+    """--force는 DB 존재 확인만이 아니라 체크포인트의 요약도 버리고 다시 만든다."""
+    RunCheckpoint("2025-02-07", root=tmp_path).save("briefing", {"title": "예전 요약", "html": "<p>예전</p>"})
+    sessions = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    history = MagicMock(spec=MarketHistory)
+    history.summary_for = AsyncMock(return_value=MarketSummary(date="2025-02-06"))
+
+    async def run(force: bool):
+        with (
+            patch.object(settings, "checkpoint_dir", str(tmp_path)),
+            patch("app.backfill.async_session", sessions),
+            patch("app.pipeline.async_session", sessions),
+            patch("app.backfill.MarketHistory", return_value=history),
+            patch("app.backfill.fetch_disclosures", new_callable=AsyncMock, return_value=[]),
+            patch("app.pipeline.generate_briefing", return_value="<h2>새 요약</h2>") as generate,
+            patch("app.backfill.publish_site", new_callable=AsyncMock),
+        ):
+            await backfill(date(2025, 2, 7), date(2025, 2, 7), force=force)
+        return generate.call_count
+
+    assert await run(force=False) == 0  # 체크포인트의 요약을 그대로 저장
+    assert await run(force=True) == 1
+
+    briefing = (await db_session.execute(
+        select(Briefing).options(undefer(Briefing.content_html)).where(Briefing.date == "2025-02-07")
+    )).scalar_one()
+    await db_session.refresh(briefing)
+    assert briefing.content_html == "<h2>새 요약</h2>"
+    assert RunCheckpoint("2025-02-07", root=tmp_path).load("briefing")["html"] == "<h2>새 요약</h2>"
+
+
+@pytest.mark.asyncio
+async def test_backfill_refuses_today_and_keeps_live_checkpoint(tmp_path):
+    """오늘이 들어간 기간은 거부한다 — 오늘의 delivered 체크포인트를 지우거나 뉴스 없는 요약으로 덮지 않게."""
+    today = RunCheckpoint(date.today().isoformat(), root=tmp_path)
+    today.save("delivered", ["a@x.com"])
+
+    with patch.object(settings, "checkpoint_dir", str(tmp_path)), patch("app.backfill.MarketHistory") as history:
+        for force in (False, True):
+            with pytest.raises(ValueError, match="어제까지"):
+                await backfill(date.today() - timedelta(days=3), date.today(), force=force)
+
+    history.assert_not_called()
+    assert today.load("delivered") == ["a@x.com"]
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_concurrent_calls():
+    limiter = RateLimiter(rate=50)
+    started = time.monotonic()
+    await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+    assert time.monotonic() - started >= 4 / 50 * 0.9
@@ -0,0 +1,78 @@
+"""init_db 스키마 보정 테스트."""
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database import _add_missing_columns, _backfill_excerpts, async_url, create_engine_for
+from app.models import Briefing
+
+
+@pytest.mark.asyncio
+async def test_add_missing_columns_upgrades_old_table():
+    """발췌문 컬럼이 없던 옛 briefings 테이블에 컬럼을 추가하고 발췌문을 채운다."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE briefings (id INTEGER PRIMARY KEY, date VARCHAR(10), title VARCHAR(200), "
+            "content_html TEXT, created_at DATETIME)"
+        ))
+        await conn.execute(text(
+            "INSERT INTO briefings (date, title, content_html) VALUES ('2025-02-11', '브리핑', '<h2>시장</h2><p>상승 마감</p>')"
+        ))
+        await conn.run_sync(_add_missing_columns)
+        await conn.run_sync(_add_missing_columns)  # 두 번 돌려도 안전
+        await conn.run_sync(_backfill_excerpts)
+        excerpt = (await conn.execute(text("SELECT excerpt FROM briefings"))).scalar()
+    await engine.dispose()
+
+    assert excerpt == "시장 상승 마감"
+
+
+@pytest.mark.asyncio
+async def test_briefing_body_stored_compressed(db_session):
+    """본문은 gzip으로 저장되고, 읽을 때는 평문 str로 돌아온다 (압축 전 평문 행도 읽힌다)."""
+    db_session.add(Briefing(date="2025-02-11", title="브리핑", content_html="<h2>시장</h2>" * 50))
+    await db_session.commit()
+    await db_session.execute(text(
+        "INSERT INTO briefings (date, title, content_html, excerpt, created_at) "
+        "VALUES ('2025-02-10', '옛 브리핑', '<p>평문</p>', '', '2025-02-10 07:00:00')"
+    ))
+    await db_session.commit()
+
+    raw = (await db_session.execute(text("SELECT content_html FROM briefings WHERE date = '2025-02-11'"))).scalar()
+    assert raw[:2] == b"\x1f\x8b"
+    assert len(raw) < len("<h2>시장</h2>".encode() * 50)
+
+    db_session.expunge_all()
+    rows = (await db_session.execute(
+        select(Briefing.date, Briefing.content_html).order_by(Briefing.date)
+    )).all()
+    assert rows == [("2025-02-10", "<p>평문</p>"), ("2025-02-11", "<h2>시장</h2>" * 50)]
+
+
+def test_async_url_adds_async_driver():
+    assert str(async_url("postgres://u:p@db/briefing")) == "postgresql+asyncpg://u:***@db/briefing"
+    assert async_url("postgresql://db/briefing").drivername == "postgresql+asyncpg"
+    assert async_url("sqlite:///briefing.db").drivername == "sqlite+aiosqlite"
+    assert async_url("sqlite+aiosqlite:///briefing.db").drivername == "sqlite+aiosqlite"
+
+
+@pytest.mark.asyncio
+async def test_sqlite_engines_apply_pragmas(tmp_path):
+    """쓰기 엔진은 WAL로, 읽기 엔진은 query_only로 열린다."""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+    write_engine = create_engine_for(url)
+    read_engine = create_engine_for(url, readonly=True)
+    try:
+        async with write_engine.begin() as conn:
+            assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+            await conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        async with read_engine.connect() as conn:
+            assert (await conn.execute(text("SELECT count(*) FROM t"))).scalar() == 0
+            with pytest.raises(OperationalError):
+                await conn.execute(text("INSERT INTO t VALUES (1)"))
+    finally:
+        await write_engine.dispose()
+        await read_engine.dispose()
@@ -1,5 +1,8 @@
 """이메일 템플릿 테스트."""
 
+import gzip
+
+from app.email_store import build_artifact
 from app.email_template import _style_content_html, render_email
 
 
@@ -23,3 +26,28 @@ def test_render_email_contains_title():
     result = render_email("2025년 02월 11일 브리핑", "<h2>시장</h2>")
     assert "2025년 02월 11일 브리핑" in result
     assert "<html" in result.lower()
+
+
+def test_style_content_html_handles_tags_with_attributes():
+    """속성이 붙은 태그도 스타일이 적용된다 (AI가 넣은 속성은 버린다)."""
+    styled = _style_content_html('<h2 id="market">시장</h2><ul class="list"><li>항목</li></ul>')
+    assert 'id="market"' not in styled
+    assert 'class="list"' not in styled
+    assert styled.startswith("<table")
+    assert styled.count("</table>") == 1
+    assert '<ul style="list-style: none;' in styled
+
+
+def test_style_content_html_leaves_other_tags():
+    """스타일 표에 없는 태그(<pre>, <br>, </li> 등)는 그대로 둔다."""
+    html = "<pre>코드</pre><br><b>굵게</b>"
+    assert _style_content_html(html) == html
+
+
+def test_build_artifact_is_deterministic():
+    """같은 브리핑이면 HTML/압축본/해시가 모두 같다."""
+    a = build_artifact("2025-02-11", "브리핑", "<h2>시장</h2>")
+    b = build_artifact("2025-02-11", "브리핑", "<h2>시장</h2>")
+    assert a == b
+    assert gzip.decompress(a.html_gzip) == a.html
+    assert len(a.content_hash) == 64
@@ -0,0 +1,133 @@
+"""스케줄러 리더 선출 테스트."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import settings
+from app.leader import LeaderElector, RunClaim, SchedulerLeader, _utcnow
+from app.scheduler import catch_up
+
+
+@pytest.mark.asyncio
+async def test_lease_is_exclusive_until_expiry(db_session):
+    """임대는 한 워커만 잡고, 만료되거나 반납하면 다른 워커가 가져간다."""
+    a = LeaderElector(holder="a", ttl=60)
+    b = LeaderElector(holder="b", ttl=60)
+    now = datetime(2025, 2, 11, 7, 0)
+
+    assert await a.try_acquire(db_session, now) is True
+    assert await b.try_acquire(db_session, now) is False
+    assert await a.try_acquire(db_session, now + timedelta(seconds=30)) is True  # 하트비트로 연장
+    assert await b.try_acquire(db_session, now + timedelta(seconds=80)) is False  # 연장된 임대는 아직 유효
+    assert await b.try_acquire(db_session, now + timedelta(seconds=91)) is True  # 하트비트 끊김 → 넘겨받음
+    assert await a.try_acquire(db_session, now + timedelta(seconds=92)) is False
+
+    await b.release(db_session)
+    assert await a.try_acquire(db_session, now + timedelta(seconds=93)) is True
+
+
+@pytest.mark.asyncio
+async def test_scheduler_runs_only_on_leader(db_session):
+    """스케줄러는 리더에서만 뜨고, 리더가 내려가면 다른 워커가 이어받아 따라잡기를 한다."""
+    sessions = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    schedulers = {"a": MagicMock(), "b": MagicMock()}
+    caught_up = AsyncMock()
+    a = SchedulerLeader(lambda: schedulers["a"], caught_up, LeaderElector(holder="a"), sessions, heartbeat=3600)
+    b = SchedulerLeader(lambda: schedulers["b"], caught_up, LeaderElector(holder="b"), sessions, heartbeat=3600)
+
+    await a.start()
+    await b.start()
+    assert a.is_leader and not b.is_leader
+
+    await a.stop()  # 정상 종료 → 임대 반납
+    schedulers["a"].shutdown.assert_called_once()
+    await b.tick()
+    await b.stop()
+
+    assert caught_up.await_count == 2  # a 선출 시 1번, b 선출 시 1번
+
+
+@pytest.mark.asyncio
+async def test_transient_heartbeat_failure_keeps_leader(db_session):
+    """하트비트가 한 번 실패해도 임대가 유효한 동안은 리더 유지 — 스케줄러 재기동/따라잡기 중복 없음."""
+    sessions = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    failing = MagicMock(side_effect=ConnectionError("db down"))
+    flaky = MagicMock(side_effect=lambda: sessions())
+    start = MagicMock()
+
+    async def still_catching_up() -> None:
+        await asyncio.Event().wait()
+
+    caught_up = AsyncMock(side_effect=still_catching_up)
+    leader = SchedulerLeader(start, caught_up, LeaderElector(holder="a", ttl=60), flaky, heartbeat=3600)
+
+    await leader.start()
+    await asyncio.sleep(0)
+    (catching_up,) = leader._tasks
+    flaky.side_effect = failing
+    await leader.tick()
+    assert leader.is_leader
+    flaky.side_effect = lambda: sessions()
+    await leader.tick()  # 복구 후 연장 — 같은 임기
+    await asyncio.sleep(0)
+
+    assert leader.is_leader
+    start.assert_called_once()
+    caught_up.assert_awaited_once()
+
+    # 실패가 임대 만료까지 이어지면 그때 내려놓는다
+    flaky.side_effect = failing
+    leader.elector.expires_at = datetime(2000, 1, 1)
+    await leader.tick()
+    assert not leader.is_leader
+    start.return_value.shutdown.assert_called_once()
+    await asyncio.sleep(0)
+    assert catching_up.cancelled()  # 리더를 잃으면 진행 중인 따라잡기도 멈춘다
+
+
+@pytest.mark.asyncio
+async def test_run_claim_is_exclusive_and_cancels_run_when_lost(db_session):
+    """실행일 점유는 한 곳만 잡고, 점유를 빼앗기면 (갱신 실패 후 만료) 그 실행을 취소한다."""
+    sessions = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    stolen = asyncio.Event()
+
+    async def run() -> None:
+        async with RunClaim("2025-02-11", sessions, ttl=0.2).hold() as claimed:
+            assert claimed
+            async with RunClaim("2025-02-11", sessions).hold() as second:
+                assert not second
+            # 점유가 만료된 것으로 보고 다른 워커가 가져간다
+            async with sessions() as db:
+                thief = LeaderElector("run:2025-02-11", holder="other")
+                assert await thief.try_acquire(db, now=_utcnow() + timedelta(seconds=1))
+            stolen.set()
+            await asyncio.sleep(10)
+
+    task = asyncio.create_task(run())
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(task, timeout=5)
+    assert stolen.is_set()
+
+
+@pytest.mark.parametrize("now, expected", [
+    (datetime(2025, 2, 10, 8, 0), True),     # 월요일 08:00, 발송 전
+    (datetime(2025, 2, 10, 6, 30), False),   # 아직 07:00 전
+    (datetime(2025, 2, 10, 11, 0), False),   # 따라잡기 시간 지남
+    (datetime(2025, 2, 16, 8, 0), False),    # 일요일
+])
+@pytest.mark.asyncio
+async def test_catch_up_window(tmp_path, now, expected):
+    with (
+        patch.object(settings, "checkpoint_dir", str(tmp_path)),
+        patch("app.scheduler.run_pipeline", new_callable=AsyncMock) as run,
+    ):
+        await catch_up(now.replace(tzinfo=ZoneInfo("Asia/Seoul")))
+
+    assert run.await_count == (1 if expected else 0)
+    if expected:
+        run.assert_awaited_once_with(resume=True, claim_wait=2 * settings.leader_lease_seconds)
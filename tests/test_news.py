@@ -86,3 +86,86 @@ async def test_fetch_news_network_error_returns_empty():
         result = await fetch_news(query="테스트")
 
     assert result == []
+
+
+# ── 종목별 뉴스 서비스 (중복 제거 + TTL 캐시 + 호출 한도) ──
+
+
+def _naver_transport(queries: list[str], fail: set[str] = frozenset()) -> httpx.MockTransport:
+    """검색어를 기록하고, 모든 종목에 같은 링크의 기사 하나와 종목별 기사 하나를 준다."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["query"]
+        queries.append(query)
+        if query in fail:
+            return httpx.Response(503)
+        items = [
+            {"title": "증시 마감", "description": "공통", "originallink": "https://example.com/market", "pubDate": "d"},
+            {"title": query, "description": "종목", "originallink": f"https://example.com/{query}", "pubDate": "d"},
+        ]
+        return httpx.Response(200, json={"items": items})
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture
+def ticker_service(tmp_path, monkeypatch):
+    from app.collector.news import TickerNewsService
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "cache_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "naver_search_rps", 0)
+    queries: list[str] = []
+    fail: set[str] = set()
+    monkeypatch.setattr(
+        "app.collector.news.http_client", lambda **kw: httpx.AsyncClient(transport=_naver_transport(queries, fail)),
+    )
+    return TickerNewsService, queries, fail
+
+
+@pytest.mark.asyncio
+async def test_ticker_news_searches_each_unique_ticker_once_and_caches(ticker_service):
+    """구독자들이 겹쳐 요청한 종목은 한 번만 검색하고, 같은 기사는 같은 객체를 공유한다."""
+    service_cls, queries, _ = ticker_service
+    service = service_cls()
+
+    result = await service.fetch(["삼성전자", "NAVER", "삼성전자", "NAVER"])
+    assert queries == ["삼성전자 주가", "NAVER 주가"]
+    assert result["삼성전자"][0] is result["NAVER"][0]  # 링크가 같은 기사
+
+    again = await service.fetch(["NAVER", "삼성전자"])
+    assert len(queries) == 2  # 메모리 캐시
+    assert again["NAVER"][1] is result["NAVER"][1]
+
+    restarted = await service_cls().fetch(["삼성전자"])
+    assert len(queries) == 2  # 디스크 캐시 (프로세스 재시작)
+    assert restarted["삼성전자"][1].link == "https://example.com/삼성전자 주가"
+
+
+@pytest.mark.asyncio
+async def test_ticker_news_refresh_bypasses_cache_and_falls_back_on_failure(ticker_service):
+    """본 실행(refresh)은 06:00에 캐시된 결과를 쓰지 않고 다시 검색한다. 검색이 실패한 종목만 캐시로 채운다."""
+    service_cls, queries, fail = ticker_service
+    service = service_cls()
+    await service.fetch(["삼성전자", "NAVER"])  # 06:00 prefetch
+
+    fail.add("NAVER 주가")
+    result = await service.fetch(["삼성전자", "NAVER"], refresh=True)
+
+    assert queries == ["삼성전자 주가", "NAVER 주가", "삼성전자 주가", "NAVER 주가"]
+    assert set(result) == {"삼성전자", "NAVER"}
+
+
+@pytest.mark.asyncio
+async def test_ticker_news_respects_daily_quota_and_retries_failures(ticker_service, monkeypatch):
+    from app.config import settings
+
+    service_cls, queries, fail = ticker_service
+    fail.add("NAVER 주가")
+    monkeypatch.setattr(settings, "naver_daily_quota", 3)
+    service = service_cls()
+
+    result = await service.fetch(["삼성전자", "NAVER"])
+    assert list(result) == ["삼성전자"]  # 실패한 종목은 빠지고 캐시되지 않는다
+
+    result = await service.fetch(["NAVER", "카카오", "현대차"])
+    assert queries == ["삼성전자 주가", "NAVER 주가", "NAVER 주가"]  # 남은 한도 1회 — 앞쪽 종목만 다시 시도
+    assert result == {}
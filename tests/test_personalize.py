@@ -0,0 +1,65 @@
+"""관심 종목 개인화 테스트."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.collector.market import MarketSummary
+from app.email_template import render_email
+from app.models import Subscriber
+from app.personalize import load_watchlists, render_fragments, send_personalized, set_watchlist
+
+
+def test_fragments_without_tickers_match_common_email():
+    """관심 종목 조각이 없으면 조립 결과가 공통 메일과 같다."""
+    fragments = render_fragments("브리핑", "<h2>시장</h2>", {})
+    assert fragments.assemble(["삼성전자"]).decode("utf-8") == render_email("브리핑", "<h2>시장</h2>")
+
+
+def test_fragments_assemble_in_subscriber_order():
+    """구독자가 등록한 순서대로 종목 조각이 붙는다."""
+    fragments = render_fragments("브리핑", "<h2>시장</h2>", {"A": "<p>에이</p>", "B": "<p>비</p>"})
+    html = fragments.assemble(["B", "A"]).decode("utf-8")
+    assert "내 관심 종목" in html
+    assert html.index("비</p>") < html.index("에이</p>")
+    assert "<p style=" in html
+
+
+@pytest.mark.asyncio
+async def test_load_watchlists(db_session):
+    """관심 종목이 있는 활성 구독자만 반환한다."""
+    db_session.add_all([Subscriber(email="a@example.com"), Subscriber(email="b@example.com")])
+    await db_session.flush()
+    await set_watchlist(db_session, "a@example.com", ["삼성전자", "NAVER", "삼성전자"])
+    await db_session.commit()
+
+    assert await load_watchlists(db_session) == {"a@example.com": ["삼성전자", "NAVER"]}
+
+
+@pytest.mark.asyncio
+async def test_send_personalized_generates_once_per_unique_ticker():
+    """AI 생성과 뉴스 검색은 고유 종목당 한 번, 같은 조합은 본문을 공유한다."""
+    watchlists = {
+        "a@example.com": ["삼성전자", "NAVER"],
+        "b@example.com": ["삼성전자", "NAVER"],
+        "c@example.com": ["NAVER"],
+    }
+    emails = [*watchlists, "d@example.com"]
+    generated = {}
+
+    def fake_generate(tickers, market, news):
+        generated["tickers"] = tickers
+        return {t: f"<p>{t} 소식</p>" for t in tickers}
+
+    sender = AsyncMock(side_effect=lambda group, subject, body, on_delivered=None: {"success": len(group), "fail": 0})
+    with (
+        patch("app.personalize.fetch_news_for_stocks", new_callable=AsyncMock, return_value={}) as fetch,
+        patch("app.personalize.generate_ticker_sections", side_effect=fake_generate),
+        patch("app.personalize.send_briefing_to_subscribers", sender),
+    ):
+        result = await send_personalized("브리핑", "<h2>시장</h2>", emails, watchlists, MarketSummary(), {"NAVER": []})
+
+    assert generated["tickers"] == ["삼성전자", "NAVER"]
+    fetch.assert_awaited_once_with(["삼성전자"])  # NAVER 뉴스는 이미 수집됨
+    assert result == {"success": 4, "fail": 0, "failed": []}
+    assert sender.await_count == 3  # (삼성전자, NAVER) / (NAVER) / 공통
@@ -1,13 +1,30 @@
 """파이프라인 테스트."""
 
+import asyncio
+from datetime import date
 from unittest.mock import AsyncMock, patch, MagicMock
 
 import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from app.collector.dart import Disclosure
 from app.collector.market import MarketSummary, IndexData
 from app.collector.news import NewsArticle
-from app.pipeline import CollectedData, BriefingResult, collect_data, summarize
+from app.config import settings
+from app.checkpoint import RunCheckpoint
+from app.leader import LeaderElector
+from app.models import Subscriber
+from app.pipeline import (
+    CollectedData, BriefingResult, collect_data, prefetch, prepare_draft, run_pipeline, summarize,
+)
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def run_claims(db_session):
+    """실행일 점유(RunClaim)는 테스트 DB에 잡는다."""
+    with patch("app.leader.async_session", async_sessionmaker(db_session.bind, expire_on_commit=False)):
+        yield
 
 
 @pytest.mark.asyncio
@@ -24,12 +41,13 @@ async def test_collect_data():
         patch("app.pipeline.fetch_market_summary", new_callable=AsyncMock, return_value=fake_market),
         patch("app.pipeline.fetch_disclosures", new_callable=AsyncMock, return_value=[]),
         patch("app.pipeline.fetch_stock_news", new_callable=AsyncMock, return_value=[]),
-        patch("app.pipeline.fetch_news_for_stocks", new_callable=AsyncMock, return_value={}),
+        patch("app.pipeline.fetch_news_for_stocks", new_callable=AsyncMock, return_value={}) as stock_news,
     ):
         data = await collect_data()
 
     assert isinstance(data, CollectedData)
     assert data.market.kospi.name == "코스피"
+    assert stock_news.await_args.kwargs == {"refresh": True}  # 대장주 뉴스는 캐시 없이 매번 새로
 
 
 def test_summarize():
@@ -51,3 +69,216 @@ def test_summarize():
     assert isinstance(result, BriefingResult)
     assert "요약" in result.html
     assert "브리핑" in result.title
+
+
+def test_collected_data_round_trip():
+    """체크포인트 직렬화 후 복원하면 같은 데이터가 된다."""
+    news = NewsArticle(title="뉴스", description="설명", link="https://n.example/1", pub_date="2025-02-11")
+    data = CollectedData(
+        market=MarketSummary(
+            date="2025-02-11",
+            kospi=IndexData(name="코스피", close="2,500", change="30", change_pct="1.2", direction="상승"),
+        ),
+        disclosures=[Disclosure("삼성전자", "주요사항보고서", "20250211", "1", "삼성전자")],
+        news=[news],
+        stock_news={"삼성전자": [news]},
+    )
+    assert CollectedData.from_dict(data.to_dict()) == data
+
+
+@pytest.mark.asyncio
+async def test_run_pipeline_resume_skips_completed_stages(tmp_path):
+    """발송이 일부 실패한 뒤 재개하면 수집/요약 없이 못 받은 구독자에게만 보낸다."""
+    data = CollectedData(market=MarketSummary(date="2025-02-11"), disclosures=[], news=[])
+    result = BriefingResult(title="브리핑", html="<h2>요약</h2>")
+    first_send = {"success": 1, "fail": 1, "failed": ["b@x.com"], "delivered": ["a@x.com"]}
+    second_send = {"success": 1, "fail": 0, "failed": [], "delivered": ["b@x.com"]}
+
+    with (
+        patch.object(settings, "checkpoint_dir", str(tmp_path)),
+        patch("app.pipeline.collect_data", new_callable=AsyncMock, return_value=data) as collect,
+        patch("app.pipeline.summarize", return_value=result) as summarize_mock,
+        patch("app.pipeline.save_briefing", new_callable=AsyncMock) as save,
+        patch("app.pipeline.send_emails", new_callable=AsyncMock, side_effect=[first_send, second_send]) as send,
+        patch("app.pipeline.publish_site", new_callable=AsyncMock),
+    ):
+        await run_pipeline()
+        await run_pipeline(resume=True)
+
+    assert collect.await_count == 1
+    assert summarize_mock.call_count == 1
+    assert save.await_count == 1
+    assert send.await_args_list[1].kwargs["skip"] == {"a@x.com"}
+    assert send.await_args_list[1].args[1] == data  # 체크포인트에서 복원된 수집 데이터
+
+
+@pytest.mark.asyncio
+async def test_run_pipeline_skips_overlapping_run_for_same_day(tmp_path):
+    """07:00 실행이 도는 중에 따라잡기(resume)가 불려도 겹쳐 돌지 않는다 — 중복 발송 방지."""
+    data = CollectedData(market=MarketSummary(date="2025-02-11"), disclosures=[], news=[])
+    release = asyncio.Event()
+
+    async def slow_collect(**kwargs):
+        await release.wait()
+        return data
+
+    with (
+        patch.object(settings, "checkpoint_dir", str(tmp_path)),
+        patch("app.pipeline.collect_data", side_effect=slow_collect) as collect,
+        patch("app.pipeline.summarize", return_value=BriefingResult(title="브리핑", html="<p>요약</p>")),
+        patch("app.pipeline.save_briefing", new_callable=AsyncMock),
+        patch("app.pipeline.send_emails", new_callable=AsyncMock, return_value={"success": 1, "fail": 0, "failed": [], "delivered": ["a@x.com"]}) as send,
+        patch("app.pipeline.publish_site", new_callable=AsyncMock),
+    ):
+        first = asyncio.create_task(run_pipeline())
+        await asyncio.sleep(0)
+        assert await run_pipeline(resume=True) == ""
+        release.set()
+        assert await first == "<p>요약</p>"
+
+    assert collect.call_count == 1
+    send.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_run_pipeline_skips_day_claimed_by_another_process(tmp_path, db_session):
+    """다른 워커(이전 리더 등)가 실행일을 점유하고 있으면 따라잡기가 겹쳐 돌지 않는다."""
+    today = date.today().isoformat()
+    other = LeaderElector(f"run:{today}", holder="old-leader", ttl=60)
+    assert await other.try_acquire(db_session)
+
+    with (
+        patch.object(settings, "checkpoint_dir", str(tmp_path)),
+        patch("app.pipeline.collect_data", new_callable=AsyncMock) as collect,
+        patch("app.pipeline.send_emails", new_callable=AsyncMock) as send,
+    ):
+        assert await run_pipeline(resume=True) == ""
+
+    collect.assert_not_awaited()
+    send.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_resume_after_crash_mid_send_skips_already_delivered(tmp_path, db_session):
+    """발송 도중에 죽어도 그때까지 받은 구독자는 delivered 체크포인트에 남아 재개 시 다시 받지 않는다."""
+    db_session.add_all(Subscriber(email=email) for email in ("a@x.com", "b@x.com", "c@x.com"))
+    await db_session.commit()
+    data = CollectedData(market=MarketSummary(date="2025-02-11"), disclosures=[], news=[])
+    sent: list[str] = []
+    crashed = False
+
+    async def fake_send(email, subject, body):
+        nonlocal crashed
+        if email == "c@x.com" and not crashed:
+            crashed = True
+            await asyncio.sleep(0.01)
+            raise RuntimeError("worker died")
+        sent.append(email)
+        return True
+
+    with (
+        patch.object(settings, "checkpoint_dir", str(tmp_path)),
+        patch.object(settings, "delivery_checkpoint_batch", 10),
+        patch("app.pipeline.async_session", async_sessionmaker(db_session.bind, expire_on_commit=False)),
+        patch("app.pipeline.collect_data", new_callable=AsyncMock, return_value=data),
+        patch("app.pipeline.summarize", return_value=BriefingResult(title="브리핑", html="<p>요약</p>")),
+        patch("app.pipeline.save_briefing", new_callable=AsyncMock),
+        patch("app.pipeline.publish_site", new_callable=AsyncMock),
+        patch("app.email_sender.send_email", side_effect=fake_send),
+    ):
+        with pytest.raises(RuntimeError):
+            await run_pipeline()
+        await run_pipeline(resume=True)
+
+    assert sorted(sent) == ["a@x.com", "b@x.com", "c@x.com"]  # 각자 한 번씩만
+
+
+@pytest.mark.asyncio
+async def test_run_pipeline_refuses_to_collect_for_another_date(tmp_path):
+    """수집기는 지금 시점 데이터만 주므로 지난 날짜로 collect하면 거부한다. 체크포인트로 뒤 단계만은 돌릴 수 있다."""
+    past = date(2025, 2, 11)
+    checkpoint = RunCheckpoint(past.isoformat(), root=tmp_path)
+    checkpoint.save("delivered", ["a@x.com"])
+    checkpoint.save("briefing", {"title": "2025년 02월 11일 브리핑", "html": "<p>요약</p>"})
+
+    with (
+        patch.object(settings, "checkpoint_dir", str(tmp_path)),
+        patch("app.pipeline.collect_data", new_callable=AsyncMock) as collect,
+        patch("app.pipeline.save_briefing", new_callable=AsyncMock) as save,
+    ):
+        for steps in (None, ["collect", "summarize", "save"]):
+            with pytest.raises(ValueError, match="backfill"):
+                await run_pipeline(run_date=past, steps=steps)
+        await run_pipeline(run_date=past, steps=["save"])
+
+    collect.assert_not_awaited()
+    assert checkpoint.load("delivered") == ["a@x.com"]  # 거부하기 전에 체크포인트를 지우지 않는다
+    save.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_run_pipeline_selected_steps_for_date(tmp_path):
+    """단계를 골라 나눠 실행하면 앞 단계 산출물을 같은 실행일 체크포인트에서 이어받는다."""
+    data = CollectedData(market=MarketSummary(date="2025-02-10"), disclosures=[], news=[])
+    run_date = date.today()
+
+    with (
+        patch.object(settings, "checkpoint_dir", str(tmp_path)),
+        patch("app.pipeline.collect_data", new_callable=AsyncMock, return_value=data) as collect,
+        patch("app.pipeline.generate_briefing", return_value="<h2>요약</h2>"),
+        patch("app.pipeline.save_briefing", new_callable=AsyncMock) as save,
+        patch("app.pipeline.send_emails", new_callable=AsyncMock, return_value={"fail": 0, "delivered": []}) as send,
+        patch("app.pipeline.publish_site", new_callable=AsyncMock) as publish,
+    ):
+        await run_pipeline(run_date=run_date, steps=["collect", "summarize"])
+        save.assert_not_awaited()
+        send.assert_not_awaited()
+
+        await run_pipeline(run_date=run_date, steps=["save", "send"])
+
+    assert collect.await_count == 1
+    assert collect.await_args.kwargs["run_date"] == run_date
+    result = save.await_args.args[0]
+    assert result.title.startswith(run_date.strftime("%Y년 %m월 %d일"))
+    assert save.await_args.args[1] == run_date
+    assert send.await_args.kwargs["run_date"] == run_date
+    publish.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_run_pipeline_steps_without_checkpoint(tmp_path):
+    """앞 단계 체크포인트 없이 뒤 단계만 실행하면 실패한다. 모르는 단계 이름도 거부한다."""
+    with patch.object(settings, "checkpoint_dir", str(tmp_path)):
+        with pytest.raises(RuntimeError):
+            await run_pipeline(steps=["send"])
+        with pytest.raises(ValueError):
+            await run_pipeline(steps=["deploy"])
+
+
+def _news(n: int) -> list[NewsArticle]:
+    return [NewsArticle(title=f"뉴스{i}", description="", link=f"https://n.example/{i}", pub_date="") for i in range(n)]
+
+
+@pytest.mark.parametrize("new_news, regenerated", [(2, False), (5, True)])
+@pytest.mark.asyncio
+async def test_run_pipeline_uses_prefetch_and_draft(tmp_path, new_news, regenerated):
+    """06시 워밍업 결과가 있으면 본 실행은 뉴스만 다시 받고, 새 뉴스가 적으면 초안을 그대로 쓴다."""
+    market = MarketSummary(date="2025-02-11")
+    with (
+        patch.object(settings, "checkpoint_dir", str(tmp_path)),
+        patch("app.pipeline.fetch_market_summary", new_callable=AsyncMock, return_value=market) as fetch_market,
+        patch("app.pipeline.fetch_disclosures", new_callable=AsyncMock, return_value=[]) as fetch_disclosures,
+        patch("app.pipeline.fetch_stock_news", new_callable=AsyncMock, side_effect=[_news(5), _news(5 + new_news)]),
+        patch("app.pipeline.fetch_news_for_stocks", new_callable=AsyncMock, return_value={}),
+        patch("app.pipeline.generate_briefing", return_value="<h2>요약</h2>") as generate,
+        patch("app.pipeline.save_briefing", new_callable=AsyncMock),
+        patch("app.pipeline.send_emails", new_callable=AsyncMock, return_value={"fail": 0, "delivered": []}),
+        patch("app.pipeline.publish_site", new_callable=AsyncMock),
+    ):
+        await prefetch()
+        await prepare_draft()
+        await run_pipeline()
+
+    assert fetch_market.await_count == 1  # 06시에만
+    assert fetch_disclosures.await_count == 1
+    assert generate.call_count == (2 if regenerated else 1)
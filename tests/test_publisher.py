@@ -0,0 +1,94 @@
+"""정적 내보내기 테스트."""
+
+import gzip
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models import Briefing
+from app.publisher import PublishedSiteMiddleware, page_file, publish_site, unpublish
+
+
+def test_page_file_maps_only_exported_paths():
+    assert page_file("/") == "index.html"
+    assert page_file("/archive") == "archive/index.html"
+    assert page_file("/archive/2025-02-11") == "archive/2025-02-11/index.html"
+    assert page_file("/archive/2025-02-11/email") is None
+    assert page_file("/subscribe") is None
+
+
+@pytest.mark.asyncio
+async def test_publish_site_writes_pages_and_gzip(db_session, tmp_path):
+    """랜딩/목록/상세 페이지와 .gz 변형을 내보낸다."""
+    db_session.add(Briefing(date="2025-02-11", title="테스트 브리핑", content_html="<h2>본문</h2>", excerpt="발췌"))
+    await db_session.commit()
+
+    session_factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    with patch("app.publisher.read_session", session_factory):
+        count = await publish_site(root=tmp_path)
+
+    assert count == 3
+    detail = tmp_path / "archive" / "2025-02-11" / "index.html"
+    assert "본문" in detail.read_text(encoding="utf-8")
+    assert gzip.decompress((tmp_path / "archive" / "2025-02-11" / "index.html.gz").read_bytes()) == detail.read_bytes()
+    assert "테스트 브리핑" in (tmp_path / "archive" / "index.html").read_text(encoding="utf-8")
+    assert (tmp_path / "index.html").exists()
+
+
+@pytest.mark.asyncio
+async def test_unpublish_removes_stale_pages(db_session, tmp_path):
+    """브리핑이 바뀌면 그 날짜 상세와 목록 파일을 지워 동적 라우트가 응답하게 한다."""
+    for day in ("2025-02-10", "2025-02-11"):
+        db_session.add(Briefing(date=day, title=f"{day} 브리핑", content_html="<h2>본문</h2>", excerpt="발췌"))
+    await db_session.commit()
+
+    session_factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    with patch("app.publisher.read_session", session_factory):
+        await publish_site(root=tmp_path)
+
+    unpublish("2025-02-11", root=tmp_path)
+    unpublish("2025-02-11", root=tmp_path)  # 이미 지워졌어도 괜찮다
+
+    archive = tmp_path / "archive"
+    assert not (archive / "2025-02-11" / "index.html").exists()
+    assert not (archive / "2025-02-11" / "index.html.gz").exists()
+    assert not (archive / "index.html").exists() and not (archive / "index.html.gz").exists()
+    assert (archive / "2025-02-10" / "index.html.gz").exists()  # 다른 날짜는 그대로
+    assert (tmp_path / "index.html").exists()
+
+
+@pytest.mark.asyncio
+async def test_middleware_serves_files_and_falls_through(tmp_path):
+    """내보낸 파일은 그대로, 쿼리가 있거나 파일이 없으면 라우터가 응답한다."""
+    (tmp_path / "archive").mkdir()
+    (tmp_path / "archive" / "index.html").write_text("static", encoding="utf-8")
+    (tmp_path / "archive" / "index.html.gz").write_bytes(gzip.compress(b"static"))
+
+    app = FastAPI()
+    app.add_middleware(PublishedSiteMiddleware, directory=tmp_path)
+
+    @app.get("/archive")
+    async def dynamic():
+        return PlainTextResponse("dynamic")
+
+    @app.get("/")
+    async def landing():
+        return PlainTextResponse("dynamic landing")
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        plain = await client.get("/archive", headers={"Accept-Encoding": "identity"})
+        gzipped = await client.get("/archive", headers={"Accept-Encoding": "gzip"})
+        revalidated = await client.get("/archive", headers={"If-None-Match": gzipped.headers["etag"]})
+        searched = await client.get("/archive", params={"q": "반도체"})
+        missing = await client.get("/")
+
+    assert plain.text == "static"
+    assert plain.headers["content-type"].startswith("text/html")
+    assert gzipped.headers["content-encoding"] == "gzip" and gzipped.text == "static"
+    assert revalidated.status_code == 304
+    assert searched.text == "dynamic"
+    assert missing.text == "dynamic landing"
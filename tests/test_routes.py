@@ -1,12 +1,22 @@
 """라우트 테스트."""
 
+import re
+from datetime import datetime
+from unittest.mock import patch
+
 import pytest
 import pytest_asyncio
 import httpx
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
-from app.database import Base, get_db
-from app.models import Subscriber, Briefing
+from app.cache import invalidate_archive
+from app.config import settings
+from app.database import Base, get_db, get_read_db
+from app.email_store import build_artifact, save_artifact
+from app.models import Subscriber, Briefing, PipelineRun, PipelineSpan
+from app.routes.archive import accepts_gzip, render_detail
+from app.search import index_briefing
 from main import app
 
 # ── 테스트용 DB 설정 ──
@@ -24,11 +34,13 @@ async def override_get_db():
 
 # 의존성 교체: 실제 DB 대신 인메모리 DB 사용
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_read_db] = override_get_db
 
 
 @pytest_asyncio.fixture(autouse=True)
 async def setup_db():
     """각 테스트마다 테이블 생성/삭제."""
+    invalidate_archive()
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
@@ -98,6 +110,58 @@ async def test_archive_empty():
     assert "아직 브리핑이 없습니다" in resp.text
 
 
+@pytest.mark.asyncio
+async def test_admin_import_requires_token():
+    """관리자 토큰이 맞아야 가져오기가 동작한다."""
+    body = "email\na@example.com\nb@example.com\nbad\n"
+    with patch.object(settings, "admin_token", "secret"):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            denied = await client.post("/admin/subscribers/import", content=body)
+            resp = await client.post(
+                "/admin/subscribers/import", content=body,
+                headers={"X-Admin-Token": "secret", "Content-Type": "text/csv"},
+            )
+
+    assert denied.status_code == 403
+    assert resp.status_code == 200
+    assert resp.json()["inserted"] == 2 and resp.json()["invalid"] == 1
+
+
+@pytest.mark.asyncio
+async def test_admin_runs_and_metrics():
+    """실행 기록이 관리자 JSON과 /metrics로 나온다."""
+    async with TestSession() as session:
+        run = PipelineRun(
+            kind="daily", run_date="2025-02-11", started_at=datetime(2025, 2, 11, 7), duration_ms=42000.0, status="ok",
+        )
+        session.add(run)
+        await session.flush()
+        session.add_all([
+            PipelineSpan(run_id=run.id, seq=1, kind="stage", name="collect", offset_ms=0, duration_ms=3000, status="ok"),
+            PipelineSpan(run_id=run.id, seq=2, parent_seq=1, kind="http", name="GET opendart.fss.or.kr/api/list.json",
+                         offset_ms=5, duration_ms=800, status="ok", attrs={"status": 200}),
+            PipelineSpan(run_id=run.id, seq=3, kind="ai", name="claude test", offset_ms=3000, duration_ms=30000,
+                         status="ok", attrs={"input_tokens": 1200, "output_tokens": 900}),
+        ])
+        await session.commit()
+
+    with patch.object(settings, "admin_token", "secret"):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            denied = await client.get("/admin/runs")
+            runs = await client.get("/admin/runs", headers={"X-Admin-Token": "secret"})
+            detail = await client.get(f"/admin/runs/{run.id}", headers={"X-Admin-Token": "secret"})
+            metrics_denied = await client.get("/metrics")
+            metrics = await client.get("/metrics", headers={"Authorization": "Bearer secret"})
+
+    assert denied.status_code == 403
+    assert metrics_denied.status_code == 403
+    assert runs.json()[0]["stages"] == {"collect": 3000.0}
+    assert runs.json()[0]["tokens"] == {"input": 1200, "output": 900}
+    assert [s["name"] for s in detail.json()["spans"]][1] == "GET opendart.fss.or.kr/api/list.json"
+    assert metrics.headers["content-type"].startswith("text/plain")
+    assert 'briefing_pipeline_last_run_duration_seconds{kind="daily"} 42' in metrics.text
+
+
 @pytest.mark.asyncio
 async def test_archive_with_data():
     """브리핑이 있으면 목록에 표시된다."""
@@ -113,6 +177,69 @@ async def test_archive_with_data():
     assert "테스트 브리핑" in resp.text
 
 
+@pytest.mark.asyncio
+async def test_archive_list_shows_excerpt_and_detail_loads_body():
+    """목록은 저장된 발췌문을, 상세는 (지연 로딩되는) 본문을 보여준다."""
+    async with TestSession() as session:
+        session.add(Briefing(
+            date="2025-02-11", title="테스트 브리핑",
+            content_html="<h2>본문 제목</h2>", excerpt="미리 계산한 발췌문",
+        ))
+        await session.commit()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        listing = await client.get("/archive")
+        detail = await client.get("/archive/2025-02-11")
+
+    assert "미리 계산한 발췌문" in listing.text
+    assert "본문 제목" not in listing.text
+    assert detail.status_code == 200
+    assert "본문 제목" in detail.text
+
+
+@pytest.mark.asyncio
+async def test_archive_search_highlights():
+    """검색하면 하이라이트된 발췌문과 함께 결과가 나온다."""
+    async with TestSession() as session:
+        for date, html in [("2025-02-10", "<p>반도체 수출 회복</p>"), ("2025-02-11", "<p>금리 동결</p>")]:
+            session.add(Briefing(date=date, title=f"{date} 브리핑", content_html=html))
+            await index_briefing(session, date, f"{date} 브리핑", html)
+        await session.commit()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.get("/archive", params={"q": "반도체"})
+
+    assert resp.status_code == 200
+    assert "2025-02-10 브리핑" in resp.text
+    assert "2025-02-11 브리핑" not in resp.text
+    assert "<mark>반도체</mark>" in resp.text
+
+
+@pytest.mark.asyncio
+async def test_archive_keyset_pagination():
+    """페이지 링크의 커서를 따라가면 겹치거나 빠지는 항목 없이 이어진다."""
+    async with TestSession() as session:
+        for day in range(1, 26):
+            session.add(Briefing(date=f"2025-01-{day:02d}", title=f"브리핑-{day:02d}", content_html="<p>x</p>"))
+        await session.commit()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        page1 = await client.get("/archive")
+        page2_url = re.search(r'href="(/archive\?page=2&amp;before=[^"]+)"', page1.text).group(1)
+        page3_url = re.search(r'href="(/archive\?page=3&amp;before=[^"]+)"', page1.text).group(1)
+        page2 = await client.get(page2_url.replace("&amp;", "&"))
+        page3 = await client.get(page3_url.replace("&amp;", "&"))
+        legacy3 = await client.get("/archive?page=3")  # 커서 없는 옛 링크
+
+    assert "브리핑-25" in page1.text and "브리핑-16" in page1.text and "브리핑-15" not in page1.text
+    assert "브리핑-15" in page2.text and "브리핑-06" in page2.text and "브리핑-05" not in page2.text
+    assert "브리핑-05" in page3.text and "브리핑-01" in page3.text and "브리핑-06" not in page3.text
+    assert "브리핑-05" in legacy3.text and "브리핑-06" not in legacy3.text
+    # 3페이지의 이전 링크는 2페이지와 같은 커서
+    assert page2_url in page3.text
+    assert "전체 25개의 브리핑" in page1.text
+
+
 @pytest.mark.asyncio
 async def test_archive_pagination_invalid_page():
     """page=0 (ge=1 위반) → 422 에러."""
@@ -129,3 +256,118 @@ async def test_archive_detail_not_found():
         resp = await client.get("/archive/9999-01-01")
 
     assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_archive_detail_conditional_requests():
+    """상세 페이지는 ETag/Last-Modified로 304를 돌려주고, 지난 날짜는 오래 캐시하게 한다."""
+    async with TestSession() as session:
+        session.add(Briefing(date="2025-02-11", title="테스트 브리핑", content_html="<h2>내용</h2>"))
+        await session.commit()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        first = await client.get("/archive/2025-02-11")
+        by_etag = await client.get("/archive/2025-02-11", headers={"If-None-Match": first.headers["etag"]})
+        by_date = await client.get("/archive/2025-02-11", headers={"If-Modified-Since": first.headers["last-modified"]})
+        stale = await client.get("/archive/2025-02-11", headers={"If-None-Match": '"other"'})
+
+    assert first.status_code == 200
+    assert first.headers["cache-control"].startswith("public, max-age=")
+    assert by_etag.status_code == 304 and by_etag.content == b""
+    assert by_date.status_code == 304
+    assert stale.status_code == 200 and stale.content == first.content
+
+
+@pytest.mark.asyncio
+async def test_archive_detail_serves_precompressed_gzip():
+    """gzip을 받는 클라이언트에는 미리 압축한 바이트를 인코딩별 ETag와 함께 보낸다."""
+    async with TestSession() as session:
+        session.add(Briefing(date="2025-02-11", title="테스트 브리핑", content_html="<h2>내용</h2>"))
+        await session.commit()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        plain = await client.get("/archive/2025-02-11", headers={"Accept-Encoding": "identity"})
+        gzipped = await client.get("/archive/2025-02-11", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in plain.headers
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.content == plain.content
+    assert gzipped.headers["etag"] != plain.headers["etag"]
+    assert gzipped.headers["vary"] == "Accept-Encoding"
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip", True),
+    ("br, gzip;q=0.5", True),
+    ("GZIP ; Q=1", True),
+    ("gzip;q=0", False),
+    ("gzip; q=0.0, identity", False),
+    ("*", True),
+    ("*;q=0", False),
+    ("gzip;q=0, *", False),  # 명시적 거부가 와일드카드보다 우선
+    ("identity", False),
+    ("", False),
+])
+def test_accepts_gzip_respects_q_values(header, expected):
+    assert accepts_gzip(header) is expected
+
+
+@pytest.mark.asyncio
+async def test_archive_detail_refused_gzip_gets_plain_body():
+    async with TestSession() as session:
+        session.add(Briefing(date="2025-02-11", title="테스트 브리핑", content_html="<h2>내용</h2>"))
+        await session.commit()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        refused = await client.get("/archive/2025-02-11", headers={"Accept-Encoding": "gzip;q=0"})
+
+    assert "content-encoding" not in refused.headers
+    assert "내용" in refused.text
+
+
+@pytest.mark.asyncio
+async def test_archive_cache_follows_saves_from_other_processes():
+    """렌더링 결과/건수는 캐시되고, 다른 프로세스가 브리핑을 저장하면 (이 프로세스의 무효화 없이도) 새로 읽는다."""
+    async with TestSession() as session:
+        session.add(Briefing(date="2025-02-11", title="첫 버전", content_html="<p>x</p>"))
+        await session.commit()
+
+    with patch("app.routes.archive.render_detail", wraps=render_detail) as render:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            before = await client.get("/archive/2025-02-11")
+            cached = await client.get("/archive/2025-02-11")
+            listed = await client.get("/archive")
+            # 파이프라인 워커가 저장한 것처럼 — invalidate_archive() 호출 없이 DB만 바뀐다
+            async with TestSession() as session:
+                briefing = (await session.execute(select(Briefing).where(Briefing.date == "2025-02-11"))).scalar_one()
+                briefing.title = "두 번째 버전"
+                session.add(Briefing(date="2025-02-12", title="새 브리핑", content_html="<p>y</p>"))
+                await session.commit()
+            fresh = await client.get("/archive/2025-02-11")
+            listing = await client.get("/archive")
+
+    assert render.await_count == 2
+    assert "첫 버전" in before.text and cached.headers["etag"] == before.headers["etag"]
+    assert "두 번째 버전" in fresh.text
+    assert fresh.headers["etag"] != before.headers["etag"]
+    assert "전체 1개의 브리핑" in listed.text
+    assert "전체 2개의 브리핑" in listing.text
+
+
+@pytest.mark.asyncio
+async def test_archive_email_serves_stored_bytes():
+    """저장된 이메일을 그대로 응답하고, gzip 수용 시 미리 압축한 바이트를 보낸다."""
+    artifact = build_artifact("2025-02-11", "테스트 브리핑", "<h2>내용</h2>")
+    async with TestSession() as session:
+        await save_artifact(session, artifact)
+        await session.commit()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        plain = await client.get("/archive/2025-02-11/email", headers={"Accept-Encoding": "identity"})
+        gzipped = await client.get("/archive/2025-02-11/email", headers={"Accept-Encoding": "gzip"})
+
+    assert plain.status_code == 200
+    assert plain.content == artifact.html
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.content == artifact.html  # httpx가 풀어서 돌려준다
+    assert gzipped.headers["etag"] == f'"{artifact.content_hash}"'
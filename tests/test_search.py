@@ -0,0 +1,115 @@
+"""아카이브 전문 검색 테스트."""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models import FTS_TABLE, Briefing
+from app.search import _sync_search_text, index_briefing, search_briefings, sync_search_index
+from app.text import html_to_text
+
+
+def test_html_to_text_strips_tags_and_unescapes():
+    """태그를 공백으로 바꾸고 엔티티를 푼다."""
+    html = '<h2>시장</h2><p style="color: red">외인 &amp; 기관</p>'
+    assert html_to_text(html) == "시장 외인 & 기관"
+
+
+async def _add(db, date: str, title: str, html: str) -> None:
+    db.add(Briefing(date=date, title=title, content_html=html))
+    await index_briefing(db, date, title, html)
+
+
+@pytest.mark.asyncio
+async def test_search_matches_text_not_markup(db_session):
+    """본문 텍스트만 검색되고, 태그/인라인 스타일 안의 문자열은 매칭되지 않는다."""
+    await _add(db_session, "2025-02-10", "2월 10일 브리핑", '<p style="font-size: 14px">반도체 수출이 늘었어요</p>')
+    await _add(db_session, "2025-02-11", "2월 11일 브리핑", "<p>금리 동결 소식</p>")
+    await db_session.commit()
+
+    hits, total = await search_briefings(db_session, "반도체", limit=10)
+    assert total == 1
+    assert hits[0].date == "2025-02-10"
+    assert "<mark>반도체</mark>" in hits[0].snippet
+
+    assert (await search_briefings(db_session, "font-size", limit=10))[1] == 0
+
+
+@pytest.mark.asyncio
+async def test_search_short_term_falls_back(db_session):
+    """3글자 미만 검색어도 평문 컬럼에서 찾는다."""
+    await _add(db_session, "2025-02-11", "브리핑", "<p>금리 동결 소식</p>")
+    await db_session.commit()
+
+    hits, total = await search_briefings(db_session, "금리", limit=10)
+    assert total == 1
+    assert "<mark>금리</mark>" in hits[0].snippet
+
+
+@pytest.mark.asyncio
+async def test_search_snippet_is_escaped(db_session):
+    """본문에 있는 꺾쇠 문자는 이스케이프되어 하이라이트만 HTML로 남는다."""
+    await _add(db_session, "2025-02-11", "브리핑", "<p>코스피 &lt;script&gt; 2,500선 회복</p>")
+    await db_session.commit()
+
+    hits, _ = await search_briefings(db_session, "코스피", limit=10)
+    assert "<script>" not in hits[0].snippet
+    assert "&lt;script&gt;" in hits[0].snippet
+
+
+@pytest.mark.asyncio
+async def test_sync_search_index_backfills_existing(db_session):
+    """색인이 비어 있으면 기존 브리핑으로 채운다."""
+    db_session.add(Briefing(date="2025-02-11", title="브리핑", content_html="<p>환율 급등</p>"))
+    await db_session.commit()
+
+    conn = await db_session.connection()
+    await conn.run_sync(sync_search_index)
+    count = (await db_session.execute(text("SELECT count(*) FROM briefing_fts"))).scalar()
+    assert count == 1
+
+
+@pytest.mark.asyncio
+async def test_search_without_fts_matches_body_text(db_session):
+    """FTS5가 없는 DB 경로도 본문(압축 저장)까지 검색한다 — 저장 시 만든 평문 컬럼으로."""
+    body = "<p>" + "시장 개요 " * 40 + "</p><p>반도체 <b>수출</b> 급증</p>"
+    with patch("app.search._uses_fts", return_value=False):
+        await _add(db_session, "2025-02-11", "브리핑", body)
+        await db_session.commit()
+        hits, total = await search_briefings(db_session, "수출 급증", limit=10)
+
+    assert total == 1
+    assert "<mark>수출</mark>" in hits[0].snippet  # 발췌문(140자) 밖의 본문
+
+
+@pytest.mark.asyncio
+async def test_sqlite_without_trigram_falls_back_to_like():
+    """FTS5 trigram이 없는 SQLite에서도 init이 실패하지 않고 search_text LIKE로 검색한다."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    with patch("app.models.fts_supported", return_value=False):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(sync_search_index)
+            tables = (await conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'table'"))).scalars().all()
+        async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+            await _add(db, "2025-02-11", "브리핑", "<p>반도체 <b>수출</b> 급증</p>")
+            await db.commit()
+            hits, total = await search_briefings(db, "수출 급증", limit=10)
+    await engine.dispose()
+
+    assert FTS_TABLE not in tables
+    assert total == 1 and "<mark>수출</mark>" in hits[0].snippet
+
+
+@pytest.mark.asyncio
+async def test_sync_search_text_backfills_plain_body(db_session):
+    db_session.add(Briefing(date="2025-02-11", title="브리핑", content_html="<p>환율 급등</p>"))
+    await db_session.commit()
+
+    conn = await db_session.connection()
+    await conn.run_sync(_sync_search_text)
+    stored = (await db_session.execute(text("SELECT search_text FROM briefings"))).scalar()
+    assert stored == "환율 급등"
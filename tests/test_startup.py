@@ -0,0 +1,70 @@
+"""웹 전용 모드 기동 테스트 — API 키 없이 뜨고, 파이프라인 모듈을 불러오지 않는다."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.config import Settings, SettingsError
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 웹 전용 워커가 import하면 안 되는 모듈 (수집기/AI 요약/발송/스케줄러와 그 의존성)
+PIPELINE_MODULES = [
+    "app.pipeline", "app.scheduler", "app.leader", "app.summarizer", "app.email_sender", "app.collector",
+    "tenacity", "apscheduler", "anthropic", "google.genai", "pykrx", "pandas", "httpx",
+]
+
+# main import 시간 예산 (초) — 벽시계 측정이라 기본값은 느린 CI에서도 넉넉하게, 성능 점검 때는 환경변수로 조인다
+#   IMPORT_BUDGET_SECONDS=1.5 pytest tests/test_startup.py
+IMPORT_BUDGET_SECONDS = float(os.environ.get("IMPORT_BUDGET_SECONDS", "3"))
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import main
+print(json.dumps({"seconds": time.perf_counter() - started, "modules": sorted(sys.modules)}))
+"""
+
+
+def _import_main(tmp_path) -> dict:
+    """새 프로세스에서 main을 import한다. 비밀값 없이 — 현재 환경의 API 키/SMTP 계정은 넘기지 않는다."""
+    env = {k: v for k, v in os.environ.items() if k in ("PATH", "HOME", "LANG", "SYSTEMROOT")}
+    env.update(SCHEDULER_ENABLED="false", DATABASE_URL=f"sqlite+aiosqlite:///{tmp_path / 'web.db'}")
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE], cwd=ROOT, env=env, capture_output=True, text=True, timeout=60,
+    )
+    assert proc.returncode == 0, proc.stderr
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def test_web_only_import_skips_pipeline(tmp_path):
+    loaded = set(_import_main(tmp_path)["modules"])
+    assert [m for m in PIPELINE_MODULES if m in loaded] == []
+
+
+def test_web_only_import_fits_budget(tmp_path):
+    seconds = min(_import_main(tmp_path)["seconds"] for _ in range(3))  # 첫 실행의 디스크 캐시 영향을 덜어낸다
+    assert seconds < IMPORT_BUDGET_SECONDS, f"main import {seconds:.2f}s"
+
+
+def test_require_validates_groups_on_use():
+    settings = Settings(_env_file=None, dart_api_key="key", anthropic_api_key="", smtp_user="", smtp_password="")
+    settings.require("dart")
+
+    with pytest.raises(SettingsError, match="SMTP_USER, SMTP_PASSWORD"):
+        settings.require("smtp")
+    with pytest.raises(SettingsError, match="ANTHROPIC_API_KEY"):
+        settings.require("ai")
+
+
+def test_require_ai_follows_provider():
+    settings = Settings(_env_file=None, ai_provider="hedged", anthropic_api_key="key", gemini_api_key="")
+    with pytest.raises(SettingsError, match="GEMINI_API_KEY"):
+        settings.require("ai")
+
+    settings.ai_provider = "claude"
+    settings.require("ai")
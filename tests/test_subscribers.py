@@ -0,0 +1,60 @@
+"""구독자 등록/가져오기 테스트."""
+
+import pytest
+from pydantic import EmailStr, TypeAdapter, ValidationError
+from sqlalchemy import func, select
+
+from app.models import Subscriber, SubscriberTicker
+from app.subscribers import (
+    SubscriberRow, add_subscriber, import_subscribers, normalize_email, parse_rows,
+)
+
+
+@pytest.mark.parametrize("raw", [
+    "user@example.com", "First.Last+tag@Sub.Example.COM", "a@b.c", "a@123.com",
+    "a..b@x.com", "a@x-.com", "a@x.co1", "a@localhost", "a@b.test", "not-an-email",
+    '"quoted"@x.com', "홍길동@예시.한국", "  padded@example.com ",
+])
+def test_normalize_email_matches_emailstr(raw):
+    """빠른 경로도 /subscribe의 EmailStr과 같은 결과를 낸다."""
+    try:
+        expected = TypeAdapter(EmailStr).validate_python(raw.strip())
+    except ValidationError:
+        expected = None
+    assert normalize_email(raw) == expected
+
+
+@pytest.mark.asyncio
+async def test_add_subscriber_on_conflict(db_session):
+    assert await add_subscriber(db_session, "a@example.com") is True
+    assert await add_subscriber(db_session, "a@example.com") is False
+    await db_session.commit()
+    count = (await db_session.execute(select(func.count()).select_from(Subscriber))).scalar()
+    assert count == 1
+
+
+def test_parse_rows_csv_and_json():
+    csv_rows = parse_rows("name,email,tickers\n홍길동,a@x.com,삼성전자;SK하이닉스\n,b@x.com,\n", "csv")
+    assert csv_rows == [SubscriberRow("a@x.com", ["삼성전자", "SK하이닉스"]), SubscriberRow("b@x.com", [""])]
+    assert parse_rows("a@x.com\nb@x.com\n", "csv") == [SubscriberRow("a@x.com"), SubscriberRow("b@x.com")]
+    json_rows = parse_rows('["a@x.com", {"email": "b@x.com", "tickers": ["카카오"]}]', "json")
+    assert json_rows == [SubscriberRow("a@x.com"), SubscriberRow("b@x.com", ["카카오"])]
+
+
+@pytest.mark.asyncio
+async def test_import_subscribers_reports_and_skips_existing(db_session):
+    """기존/파일 내 중복은 건너뛰고, 잘못된 주소는 리포트에 남기고, 종목도 함께 넣는다."""
+    await add_subscriber(db_session, "old@example.com")
+    rows = [
+        SubscriberRow("old@example.com"),
+        SubscriberRow("new@example.com", ["삼성전자", "삼성전자", "카카오"]),
+        SubscriberRow("new@EXAMPLE.com"),
+        SubscriberRow("broken@"),
+    ]
+    report = await import_subscribers(db_session, rows, batch_size=2)
+    await db_session.commit()
+
+    assert (report.total, report.inserted, report.duplicates, report.invalid) == (4, 1, 2, 1)
+    assert report.invalid_rows == ["broken@"]
+    tickers = (await db_session.execute(select(SubscriberTicker.ticker).order_by(SubscriberTicker.ticker))).scalars().all()
+    assert tickers == ["삼성전자", "카카오"]
@@ -1,5 +1,7 @@
 """요약기 테스트."""
 
+import threading
+import time
 from unittest.mock import patch
 
 import pytest
@@ -7,7 +9,16 @@ import pytest
 from app.collector.dart import Disclosure
 from app.collector.market import MarketSummary, IndexData, StockData
 from app.collector.news import NewsArticle
-from app.summarizer import _strip_code_block, generate_briefing
+from app.config import settings
+from app.summarizer import (
+    SECTIONS,
+    HedgedProvider,
+    _stock_news_part,
+    _strip_code_block,
+    generate_briefing,
+    generate_briefing_by_sections,
+    summarize_disclosures,
+)
 
 
 # ── 순수 함수 테스트 ──
@@ -19,6 +30,19 @@ def test_strip_code_block_removes_markers():
     assert _strip_code_block(raw) == "<h1>제목</h1>"
 
 
+def test_stock_news_part_includes_article_body():
+    """본문을 보강한 기사는 발췌가 한 줄로 붙는다."""
+    articles = [
+        NewsArticle("삼성전자 급등", "외국인 매수", "https://a", "d", body="첫 문단\n둘째 문단"),
+        NewsArticle("삼성전자 공시", "자사주", "https://b", "d"),
+    ]
+    assert _stock_news_part({"삼성전자": articles})[2:] == [
+        "- 삼성전자 급등: 외국인 매수",
+        "  본문 발췌: 첫 문단 둘째 문단",
+        "- 삼성전자 공시: 자사주",
+    ]
+
+
 def test_strip_code_block_plain_text():
     """마커 없는 텍스트는 그대로 반환한다."""
     assert _strip_code_block("<h1>제목</h1>") == "<h1>제목</h1>"
@@ -49,3 +73,199 @@ async def test_generate_briefing_calls_provider():
         result = generate_briefing(market, disclosures, news)
 
     assert "<h2>테스트 브리핑</h2>" in result
+
+
+# ── 헤지 모드 ──
+
+
+class _FakeProvider:
+    """지연/실패를 흉내내는 테스트용 제공자."""
+
+    def __init__(self, text: str = "", delay: float = 0.0, error: Exception | None = None):
+        self.text = text
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    def call(self, system_prompt: str, user_prompt: str) -> str:
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.text
+
+
+def test_hedged_primary_wins_without_hedge():
+    """주 제공자가 지연 전에 끝나면 보조 제공자는 호출되지 않는다."""
+    primary, secondary = _FakeProvider("<h2>주</h2>"), _FakeProvider("<h2>보조</h2>")
+    provider = HedgedProvider(("claude", primary), ("gemini", secondary), hedge_delay=1.0)
+
+    assert provider.call("s", "u") == "<h2>주</h2>"
+    assert secondary.calls == 0
+    assert provider.last_report.winner == "claude"
+    assert provider.last_report.attempts[0].elapsed is not None
+
+
+def test_hedged_secondary_wins_on_primary_error():
+    """주 제공자가 실패하면 지연을 기다리지 않고 보조 제공자 결과를 쓴다."""
+    primary = _FakeProvider(error=RuntimeError("overloaded"))
+    secondary = _FakeProvider("<h2>보조</h2>")
+    provider = HedgedProvider(("claude", primary), ("gemini", secondary), hedge_delay=5.0)
+
+    started = time.perf_counter()
+    assert provider.call("s", "u") == "<h2>보조</h2>"
+    assert time.perf_counter() - started < 1.0
+    assert provider.last_report.winner == "gemini"
+    assert provider.last_report.attempts[0].error == "overloaded"
+
+
+def test_hedged_secondary_wins_when_primary_slow():
+    """주 제공자가 느리면 보조 제공자가 출발해서 먼저 도착한 쪽이 이긴다."""
+    primary = _FakeProvider("<h2>주</h2>", delay=0.5)
+    secondary = _FakeProvider("<h2>보조</h2>")
+    provider = HedgedProvider(("claude", primary), ("gemini", secondary), hedge_delay=0.05)
+
+    assert provider.call("s", "u") == "<h2>보조</h2>"
+    assert provider.last_report.winner == "gemini"
+
+
+def test_hedged_all_fail_raises():
+    """둘 다 실패하면 예외를 던진다."""
+    provider = HedgedProvider(
+        ("claude", _FakeProvider(error=RuntimeError("a"))),
+        ("gemini", _FakeProvider("   ")),
+        hedge_delay=0.05,
+    )
+
+    with pytest.raises(RuntimeError, match="모든 AI 제공자 실패"):
+        provider.call("s", "u")
+
+
+# ── 섹션별 병렬 생성 ──
+
+
+def _sample_market() -> MarketSummary:
+    return MarketSummary(
+        date="2025-02-11",
+        kospi=IndexData(name="코스피", close="2,500", change="30", change_pct="1.2", direction="상승"),
+        kospi_top10=[StockData(name="삼성전자", close="55,000", change_pct="3.1", direction="상승")],
+    )
+
+
+class _SectionEcho:
+    """시스템 프롬프트의 섹션 제목을 그대로 <h2>로 돌려주는 제공자."""
+
+    def __init__(self, fail_once: str | None = None):
+        self.fail_once = fail_once
+        self.prompts: list[tuple[str, str]] = []
+
+    def call(self, system_prompt: str, user_prompt: str) -> str:
+        self.prompts.append((system_prompt, user_prompt))
+        heading = next(s.heading for s in SECTIONS if f"<h2>{s.heading}</h2> 로 시작" in system_prompt)
+        if heading == self.fail_once:
+            self.fail_once = None
+            raise RuntimeError("일시 오류")
+        return f"<h2>{heading}</h2>"
+
+
+def test_generate_by_sections_assembles_in_order():
+    """섹션들이 동시에 생성되어도 SYSTEM_PROMPT 순서대로 조립된다."""
+    provider = _SectionEcho()
+
+    with patch("app.summarizer._get_provider", return_value=provider):
+        html = generate_briefing_by_sections(_sample_market(), [], [], {})
+
+    headings = [s.heading for s in SECTIONS]
+    assert html == "\n".join(f"<h2>{h}</h2>" for h in headings)
+    assert len(provider.prompts) == len(SECTIONS)
+
+
+def test_generate_by_sections_uses_only_relevant_data():
+    """섹션 프롬프트에는 해당 섹션 데이터만 들어간다."""
+    provider = _SectionEcho()
+    disclosures = [
+        Disclosure(corp_name="현대모비스", report_nm="자기주식처분", rcept_dt="20250211", rcept_no="1", flr_nm="현대모비스"),
+    ]
+
+    with patch("app.summarizer._get_provider", return_value=provider):
+        generate_briefing_by_sections(_sample_market(), disclosures, [], {})
+
+    by_section = {
+        next(s.key for s in SECTIONS if f"<h2>{s.heading}</h2> 로 시작" in sp): up
+        for sp, up in provider.prompts
+    }
+    assert "현대모비스" in by_section["disclosures"]
+    assert "현대모비스" not in by_section["market"]
+    assert "삼성전자" in by_section["large_caps"]
+    assert "삼성전자" not in by_section["news"]
+
+
+def test_generate_by_sections_retries_failed_section_only():
+    """실패한 섹션만 다시 호출한다."""
+    provider = _SectionEcho(fail_once="📋 눈여겨볼 공시")
+
+    with patch("app.summarizer._get_provider", return_value=provider):
+        html = generate_briefing_by_sections(_sample_market(), [], [], {})
+
+    assert "<h2>📋 눈여겨볼 공시</h2>" in html
+    assert len(provider.prompts) == len(SECTIONS) + 1
+
+
+# ── 공시 맵리듀스 ──
+
+
+class _CountingMapProvider:
+    model = "fake-map"
+
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def call(self, system_prompt: str, user_prompt: str) -> str:
+        with self.lock:
+            self.calls += 1
+        return f"- 메모 {user_prompt.count(chr(10)) + 1}건"
+
+
+def _many_disclosures(n: int) -> list[Disclosure]:
+    return [
+        Disclosure(corp_name=f"회사{i}", report_nm="주요사항보고서", rcept_dt="20250211", rcept_no=f"{i:014d}", flr_nm=f"회사{i}")
+        for i in range(n)
+    ]
+
+
+def test_summarize_disclosures_batches_and_caches(tmp_path, monkeypatch):
+    """공시를 배치로 요약하고, 재실행 시 캐시에서 가져온다."""
+    monkeypatch.setattr(settings, "cache_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "disclosure_batch_size", 10)
+    provider = _CountingMapProvider()
+
+    with patch("app.summarizer._get_map_provider", return_value=provider):
+        first = summarize_disclosures(_many_disclosures(25))
+        second = summarize_disclosures(list(reversed(_many_disclosures(25))))
+
+    assert first == ["- 메모 10건", "- 메모 10건", "- 메모 5건"]
+    assert second == first
+    assert provider.calls == 3  # 두 번째 호출은 전부 캐시 적중
+
+
+def test_generate_briefing_reduces_with_map_notes(tmp_path, monkeypatch):
+    """공시가 임계값을 넘으면 원본 목록 대신 맵 메모가 본 프롬프트에 들어간다."""
+    monkeypatch.setattr(settings, "cache_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "disclosure_map_reduce", True)
+    monkeypatch.setattr(settings, "disclosure_map_threshold", 20)
+    captured = {}
+
+    class _Main:
+        def call(self, system_prompt: str, user_prompt: str) -> str:
+            captured["prompt"] = user_prompt
+            return "<h2>브리핑</h2>"
+
+    with (
+        patch("app.summarizer._get_map_provider", return_value=_CountingMapProvider()),
+        patch("app.summarizer._get_provider", return_value=_Main()),
+    ):
+        generate_briefing(_sample_market(), _many_disclosures(60), [])
+
+    assert "전체 60건을 미리 요약한 메모" in captured["prompt"]
+    assert "회사42" not in captured["prompt"]
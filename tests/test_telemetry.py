@@ -0,0 +1,151 @@
+"""실행 기록(telemetry) 테스트."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app import telemetry
+from app.config import settings
+from app.models import PipelineRun, PipelineSpan
+from app.routes.metrics import render_metrics
+
+
+@pytest.fixture
+def recorded(db_session):
+    """실행 기록을 켜고 테스트 DB에 저장하게 한다."""
+    session_factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    with (
+        patch.object(settings, "telemetry_enabled", True),
+        patch("app.telemetry.async_session", session_factory),
+    ):
+        yield db_session
+
+
+async def _spans(db) -> list[PipelineSpan]:
+    return list((await db.execute(select(PipelineSpan).order_by(PipelineSpan.seq))).scalars())
+
+
+@pytest.mark.asyncio
+async def test_traced_run_records_stages_calls_and_tokens(recorded):
+    """단계 span 아래에 HTTP 호출, 스레드 안 AI 호출(토큰), 누적된 SMTP 발송이 기록된다."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "timeout" in request.url.path:
+            raise httpx.ConnectTimeout("timed out", request=request)
+        return httpx.Response(200 if "ok" in request.url.path else 503)
+
+    transport = httpx.MockTransport(handler)
+
+    def call_ai() -> None:
+        with telemetry.span("claude test", kind="ai") as s:
+            s.attrs.update(input_tokens=100, output_tokens=20)
+
+    @telemetry.traced("collect")
+    async def collect() -> None:
+        async with telemetry.http_client(transport=transport) as client:
+            await client.get("https://api.example.com/stock/005930/ok")
+            await client.get("https://api.example.com/stock/000660/down")
+            with pytest.raises(httpx.ConnectTimeout):
+                await client.get("https://api.example.com/stock/035420/timeout")
+
+    @telemetry.traced_run("daily")
+    async def run(run_date=None) -> None:
+        await collect()
+        with telemetry.span("summarize"):
+            await asyncio.to_thread(call_ai)
+        with telemetry.span("send"):
+            for ok in (True, True, False):
+                telemetry.observe("smtp", "send", time.perf_counter(), ok=ok)
+
+    await run()
+
+    run_row = (await recorded.execute(select(PipelineRun))).scalar_one()
+    assert run_row.kind == "daily"
+    assert run_row.status == "ok"
+    spans = {s.name: s for s in await _spans(recorded) if s.kind != "smtp"}
+    collect_span = spans["collect"]
+    ok_call = spans["GET api.example.com/stock/{id}/ok"]
+    assert ok_call.parent_seq == collect_span.seq
+    assert ok_call.attrs == {"status": 200}
+    assert spans["GET api.example.com/stock/{id}/down"].status == "error"
+    timed_out = spans["GET api.example.com/stock/{id}/timeout"]  # 응답 없이 끝난 호출도 남는다
+    assert (timed_out.status, timed_out.attrs, timed_out.parent_seq) == ("error", {"error": "ConnectTimeout"}, collect_span.seq)
+    assert spans["claude test"].parent_seq == spans["summarize"].seq  # 스레드에서도 부모를 이어받는다
+    assert spans["claude test"].attrs["input_tokens"] == 100
+    assert spans["send"].parent_seq is None
+    smtp = [s for s in await _spans(recorded) if s.kind == "smtp"]
+    assert len(smtp) == 1
+    assert smtp[0].parent_seq == spans["send"].seq
+    assert smtp[0].attrs["count"] == 3
+    assert smtp[0].attrs["errors"] == 1
+
+
+def test_http_client_keeps_transport_options_and_traces_proxies(monkeypatch):
+    """연결 옵션은 실제 전송 계층에 적용되고, 환경변수 프록시 경로도 계측된다."""
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    monkeypatch.setenv("NO_PROXY", "localhost")
+    client = telemetry.http_client(limits=httpx.Limits(max_connections=3))
+
+    assert isinstance(client._transport, telemetry._TracedTransport)
+    assert client._transport._inner._pool._max_connections == 3
+    proxied = client._transport_for_url(httpx.URL("https://api.example.com/"))
+    assert isinstance(proxied, telemetry._TracedTransport)
+    assert proxied._inner._pool._max_connections == 3
+    assert client._transport_for_url(httpx.URL("http://localhost/")) is client._transport
+
+
+@pytest.mark.asyncio
+async def test_traced_run_records_failures(recorded):
+    """예외로 끝나거나 mark_failed가 불리면 실패로 남고, 예외는 그대로 전파된다."""
+    @telemetry.traced_run("daily")
+    async def broken(run_date=None) -> None:
+        with telemetry.span("collect"):
+            raise RuntimeError("수집 실패")
+
+    @telemetry.traced_run("daily")
+    async def partial(run_date=None) -> None:
+        telemetry.mark_failed("발송 실패 2건")
+
+    with pytest.raises(RuntimeError):
+        await broken()
+    await partial()
+
+    runs = list((await recorded.execute(select(PipelineRun).order_by(PipelineRun.id))).scalars())
+    assert [r.status for r in runs] == ["failed", "failed"]
+    assert "수집 실패" in runs[0].error
+    assert runs[1].error == "발송 실패 2건"
+    assert (await _spans(recorded))[0].status == "error"
+
+
+@pytest.mark.asyncio
+async def test_span_outside_run_records_nothing(recorded):
+    with telemetry.span("collect") as s:
+        s.attrs["x"] = 1
+    telemetry.observe("smtp", "send", time.perf_counter())
+    assert await _spans(recorded) == []
+
+
+@pytest.mark.asyncio
+async def test_render_metrics_reports_latest_run_per_kind(recorded):
+    @telemetry.traced_run("daily")
+    async def run(run_date=None, fail: bool = False) -> None:
+        with telemetry.span("collect"):
+            pass
+        with telemetry.span("claude test", kind="ai") as s:
+            s.attrs.update(input_tokens=10, output_tokens=5)
+        if fail:
+            telemetry.mark_failed("실패")
+
+    await run(fail=True)
+    await run()
+
+    text = await render_metrics(recorded)
+    assert 'briefing_pipeline_runs{kind="daily",status="failed"} 1' in text
+    assert 'briefing_pipeline_last_run_success{kind="daily"} 1' in text
+    assert 'briefing_pipeline_last_run_span_calls{kind="daily",span_kind="stage",name="collect"} 1' in text
+    assert 'briefing_pipeline_last_run_ai_tokens{kind="daily",direction="input"} 10' in text
+    assert text.count("# TYPE briefing_pipeline_last_run_span_seconds gauge") == 1